@@ -0,0 +1,473 @@
+# bdd.py
+"""This module represents propositional formulas as reduced ordered binary decision diagrams.
+
+A diagram is a node which tests a letter and has a low child for when the letter is False and a
+high child for when it is True.  The letters are tested in a fixed order and no node has equal
+children or repeats another, so two formulas stand for the same truth function exactly when
+they are the same node.  Equivalence, tautology and entailment then come down to comparing
+integers however many letters there are, and the size of a diagram depends on the structure of
+the formulas rather than on the 2^n rows of their truth table.
+
+The nodes are kept in a unique table so each is made once, and the results of operations in a
+computed table so each is done once.  Nodes no longer reachable from a converted formula or a
+kept node are reclaimed by `collect`, which `node` calls as the number of nodes grows.  The order of the letters, which decides how large the
+diagrams are, is chosen by one of the heuristics of `order`.
+
+As in `altrea.truthtables` and `altrea.sat`, `Necessary` is read as its operand, `Truth` and
+`Possibly` as true and `StrictImplies`, `StrictIff` and `ConsistentWith` as `Implies`, `Iff`
+and `And`.
+
+It contains the following:
+- `truthfunctional` - The classes of the connectives whose reading needs no modal assumptions.
+- `order(formulas, heuristic)` - Return the letters of formulas in the order a heuristic gives.
+- `BDD` - A manager of the nodes of diagrams.
+- `checkentailment(premises, goal, letters)` - Decide whether the premises entail the goal.
+- `equivalent(first, second)` - Decide whether two formulas have the same truth function.
+- `tautology(formula)` - Decide whether a formula is true in every row.
+"""
+
+from altrea.wffs import (
+    And,
+    Or,
+    Not,
+    Implies,
+    Iff,
+    Necessary,
+    Possibly,
+    Falsehood,
+    Truth,
+    ConsistentWith,
+    StrictIff,
+    StrictImplies,
+    Wff,
+)
+
+heuristic_appearance = "appearance"
+heuristic_frequency = "frequency"
+
+operator_and = 0b1000
+operator_or = 0b1110
+operator_implies = 0b1011
+operator_iff = 0b1001
+operator_xor = 0b0110
+
+truthfunctional = (And, Or, Not, Implies, Iff, Falsehood, Truth)
+
+binaryoperators = [
+    ((And, ConsistentWith), operator_and),
+    ((Or,), operator_or),
+    ((Implies, StrictImplies), operator_implies),
+    ((Iff, StrictIff), operator_iff),
+]
+
+
+def operands(node: Wff):
+    """Return the subformulas of a formula that its truth value depends on."""
+
+    if isinstance(node, (And, ConsistentWith, Or, Implies, StrictImplies, Iff, StrictIff)):
+        return (node.left, node.right)
+    elif isinstance(node, Not):
+        return (node.negated,)
+    elif isinstance(node, Necessary):
+        return (node.wff,)
+    else:
+        return ()
+
+
+def isletter(node: Wff):
+    return (
+        not isinstance(node, (Truth, Possibly, Falsehood))
+        and type(node).subformulas == ()
+        and hasattr(node, "name")
+    )
+
+
+def order(formulas: list, heuristic: str = heuristic_appearance):
+    """Return the distinct letters of the formulas in the order given by a heuristic.
+
+    With "appearance" the letters are in the order they are first met reading the formulas from
+    left to right, which keeps letters that occur together close in the order.  With "frequency"
+    the letters that occur most often come first, ties in the order of appearance.
+    """
+
+    letters = []
+    counts = {}
+    for formula in formulas:
+        stack = [formula]
+        while stack:
+            node = stack.pop()
+            children = operands(node)
+            if len(children) == 0:
+                if isletter(node):
+                    if id(node) not in counts:
+                        letters.append(node)
+                        counts[id(node)] = 0
+                    counts[id(node)] += 1
+            else:
+                stack.extend(reversed(children))
+    if heuristic == heuristic_frequency:
+        return sorted(letters, key=lambda i: -counts[id(i)])
+    elif heuristic == heuristic_appearance:
+        return letters
+    raise ValueError(f'The heuristic "{heuristic}" is not one of "{heuristic_appearance}" or "{heuristic_frequency}".')
+
+
+class BDD:
+    """A manager of the nodes of reduced ordered binary decision diagrams.
+
+    Nodes are integers: 0 is false, 1 is true and any other indexes the lists `level`, `low` and
+    `high`.  The level of a node is the position in `letters` of the letter it tests.  Letters met
+    by `node` that are not yet ordered are added after the others.
+
+    Parameters:
+        letters: The order in which the letters are tested.
+        threshold: The number of nodes after which `node` first reclaims unreachable ones.
+    """
+
+    false = 0
+    true = 1
+    terminallevel = 1 << 30
+
+    def __init__(self, letters: list = None, threshold: int = 1 << 16):
+        self.letters = []
+        self.levels = {}
+        self.level = [self.terminallevel, self.terminallevel]
+        self.low = [0, 1]
+        self.high = [0, 1]
+        self.unique = {}
+        self.computed = {}
+        self.roots = {}
+        self.converted = {}
+        self.kept = {}
+        self.free = []
+        self.threshold = threshold
+        for i in letters or []:
+            self.letterlevel(i)
+
+    def __len__(self):
+        """Return the number of nodes in use apart from the two terminals."""
+
+        return len(self.unique)
+
+    def letterlevel(self, letter: Wff):
+        """Return the level of a letter, ordering it after the others if it is new."""
+
+        level = self.levels.get(id(letter))
+        if level is None:
+            level = self.levels[id(letter)] = len(self.letters)
+            self.letters.append(letter)
+        return level
+
+    def make(self, level: int, low: int, high: int):
+        """Return the node testing the letter at a level, reusing an equal node if there is one."""
+
+        if low == high:
+            return low
+        key = (level, low, high)
+        node = self.unique.get(key)
+        if node is None:
+            if self.free:
+                node = self.free.pop()
+                self.level[node] = level
+                self.low[node] = low
+                self.high[node] = high
+            else:
+                node = len(self.level)
+                self.level.append(level)
+                self.low.append(low)
+                self.high.append(high)
+            self.unique[key] = node
+        return node
+
+    def variable(self, letter: Wff):
+        """Return the node of a letter."""
+
+        return self.make(self.letterlevel(letter), self.false, self.true)
+
+    def shortcut(self, operator: int, x: int, y: int):
+        """Return the result of an operator when it follows without looking below the nodes, otherwise None."""
+
+        if x <= 1 and y <= 1:
+            return (operator >> (2 * x + y)) & 1
+        if x == y:
+            same = (operator & 1, (operator >> 3) & 1)
+            return {(0, 0): 0, (1, 1): 1, (0, 1): x}.get(same)
+        if x <= 1:
+            bits = ((operator >> (2 * x)) & 1, (operator >> (2 * x + 1)) & 1)
+            return {(0, 0): 0, (1, 1): 1, (0, 1): y}.get(bits)
+        if y <= 1:
+            bits = ((operator >> y) & 1, (operator >> (2 + y)) & 1)
+            return {(0, 0): 0, (1, 1): 1, (0, 1): x}.get(bits)
+        return None
+
+    def apply(self, operator: int, x: int, y: int):
+        """Return the node of the operator applied to two nodes.
+
+        The operator is the 4 bit truth table whose bit `2 * a + b` is the value for `a` and `b`,
+        such as `operator_and`.  The diagrams are walked with an explicit stack and the result of
+        each pair of nodes is kept in the computed table.
+        """
+
+        level, low, high, computed = self.level, self.low, self.high, self.computed
+        result = self.shortcut(operator, x, y)
+        if result is not None:
+            return result
+        first = (operator, x, y)
+        stack = [(x, y, False)]
+        while stack:
+            x, y, expanded = stack.pop()
+            key = (operator, x, y)
+            if key in computed:
+                continue
+            top = min(level[x], level[y])
+            x0, x1 = (low[x], high[x]) if level[x] == top else (x, x)
+            y0, y1 = (low[y], high[y]) if level[y] == top else (y, y)
+            if expanded:
+                computed[key] = self.make(top, self.result(operator, x0, y0), self.result(operator, x1, y1))
+                continue
+            stack.append((x, y, True))
+            for a, b in ((x1, y1), (x0, y0)):
+                if self.shortcut(operator, a, b) is None and (operator, a, b) not in computed:
+                    stack.append((a, b, False))
+        return computed[first]
+
+    def result(self, operator: int, x: int, y: int):
+        """Return the result of an operator on two nodes which is a shortcut or already computed."""
+
+        result = self.shortcut(operator, x, y)
+        return result if result is not None else self.computed[(operator, x, y)]
+
+    def negate(self, x: int):
+        """Return the node of the negation of a node."""
+
+        return self.apply(operator_xor, x, self.true)
+
+    def node(self, formula: Wff):
+        """Return the node of a formula.
+
+        The nodes of the formulas given are kept so they survive `collect`, while those of their
+        subformulas are only remembered until then.  Whenever there are more than `threshold`
+        nodes the unreachable ones are reclaimed, keeping the node just made and those of the
+        subformulas still waiting to be combined.  A node returned earlier that is not the node
+        of a formula given to `node` must be kept with `keep` to survive a later call.
+        """
+
+        if formula in self.roots:
+            return self.roots[formula]
+        converted = self.converted
+        nodes = []
+        waiting = {}
+        stack = [(formula, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                nodes.append(node)
+            elif node not in converted and node not in waiting:
+                waiting[node] = 0
+                stack.append((node, True))
+                stack.extend((i, False) for i in reversed(operands(node)))
+        for node in nodes:
+            children = operands(node)
+            for i in children:
+                waiting[i] = waiting.get(i, 0) + 1
+        for node in nodes:
+            children = operands(node)
+            converted[node] = self.combine(node, [converted[i] for i in children])
+            for i in children:
+                waiting[i] -= 1
+            if len(self.unique) > self.threshold:
+                pending = {i: converted[i] for i in waiting if waiting[i] > 0 and i in converted}
+                pending[node] = converted[node]
+                self.collect(pending=pending)
+                self.threshold = max(self.threshold, 2 * len(self.unique))
+                converted = self.converted
+        self.roots[formula] = converted[formula]
+        return converted[formula]
+
+    def combine(self, node: Wff, children: list):
+        """Return the node of a formula from the nodes of its operands."""
+
+        if isinstance(node, Not):
+            return self.negate(children[0])
+        elif isinstance(node, Necessary):
+            return children[0]
+        elif isinstance(node, (Truth, Possibly)):
+            return self.true
+        elif isinstance(node, Falsehood):
+            return self.false
+        elif len(children) == 0:
+            if isletter(node):
+                return self.variable(node)
+            raise ValueError(f'The formula "{node}" cannot be converted to a decision diagram.')
+        for classes, operator in binaryoperators:
+            if isinstance(node, classes):
+                return self.apply(operator, children[0], children[1])
+        raise ValueError(f'The formula "{node}" cannot be converted to a decision diagram.')
+
+    def conjoin(self, nodes: list):
+        """Return the node of the conjunction of nodes, true if there are none.
+
+        The nodes are joined in pairs, then the pairs in pairs and so on, so that no diagram
+        is walked once for every node as joining them one at a time would.
+        """
+
+        nodes = list(nodes)
+        if len(nodes) == 0:
+            return self.true
+        while len(nodes) > 1:
+            joined = [self.apply(operator_and, nodes[i], nodes[i + 1]) for i in range(0, len(nodes) - 1, 2)]
+            nodes = joined + nodes[len(joined) * 2:]
+        return nodes[0]
+
+    def restrict(self, x: int, letter: Wff, value: bool):
+        """Return the node of a node with the letter set to a value."""
+
+        target = self.levels.get(id(letter))
+        if target is None:
+            return x
+        level, low, high = self.level, self.low, self.high
+        restricted = {0: 0, 1: 1}
+        stack = [x]
+        while stack:
+            node = stack[-1]
+            if node in restricted:
+                stack.pop()
+            elif level[node] > target:
+                restricted[node] = node
+                stack.pop()
+            elif level[node] == target:
+                restricted[node] = high[node] if value else low[node]
+                stack.pop()
+            elif low[node] in restricted and high[node] in restricted:
+                restricted[node] = self.make(level[node], restricted[low[node]], restricted[high[node]])
+                stack.pop()
+            else:
+                stack.extend(i for i in (high[node], low[node]) if i not in restricted)
+        return restricted[x]
+
+    def satisfying(self, x: int, letters: list):
+        """Return the first assignment to the letters, with True before False, under which the node is true.
+
+        The letters are assigned in the order given, so this is the first such row of a truth
+        table listing them in that order.  Returns None if the node is false.
+        """
+
+        if x == self.false:
+            return None
+        values = []
+        for letter in letters:
+            restricted = self.restrict(x, letter, True)
+            if restricted == self.false:
+                values.append(False)
+                x = self.restrict(x, letter, False)
+            else:
+                values.append(True)
+                x = restricted
+        return values
+
+    def size(self, x: int):
+        """Return the number of nodes reachable from a node, including the terminals."""
+
+        return len(self.reachable([x]))
+
+    def count(self, x: int, letters: int = None):
+        """Return the number of rows of the truth table of all letters ordered so far in which the node is true."""
+
+        letters = len(self.letters) if letters is None else letters
+        level, low, high = self.level, self.low, self.high
+        depth = lambda node: letters if node <= 1 else level[node]
+        counts = {0: 0, 1: 1}
+        stack = [x]
+        while stack:
+            node = stack[-1]
+            if node in counts:
+                stack.pop()
+            elif low[node] in counts and high[node] in counts:
+                counts[node] = sum(
+                    counts[i] << (depth(i) - level[node] - 1) for i in (low[node], high[node])
+                )
+                stack.pop()
+            else:
+                stack.extend(i for i in (high[node], low[node]) if i not in counts)
+        return counts[x] << depth(x)
+
+    def keep(self, x: int):
+        """Protect a node from `collect` until it is released as often as it was kept."""
+
+        self.kept[x] = self.kept.get(x, 0) + 1
+        return x
+
+    def release(self, x: int):
+        """Undo one `keep` of a node."""
+
+        if self.kept.get(x, 0) <= 1:
+            self.kept.pop(x, None)
+        else:
+            self.kept[x] -= 1
+
+    def reachable(self, roots: list):
+        """Return the set of nodes reachable from the roots."""
+
+        seen = {0, 1}
+        stack = [i for i in roots if i not in seen]
+        while stack:
+            node = stack.pop()
+            if node not in seen:
+                seen.add(node)
+                stack.append(self.low[node])
+                stack.append(self.high[node])
+        return seen
+
+    def collect(self, forget: bool = False, pending: dict = None):
+        """Reclaim the nodes not reachable from a formula given to `node` or a kept node.
+
+        The computed table and the nodes of subformulas are forgotten since they may be among
+        them, except for the pending dictionary of subformulas to nodes that are still needed.
+        With `forget` the formulas given to `node` are forgotten too, so only kept nodes
+        survive.  Returns the number of nodes reclaimed.
+        """
+
+        if forget:
+            self.roots = {}
+        pending = pending or {}
+        live = self.reachable(list(self.roots.values()) + list(self.kept) + list(pending.values()))
+        reclaimed = [key for key, node in self.unique.items() if node not in live]
+        for key in reclaimed:
+            self.free.append(self.unique.pop(key))
+        self.computed = {}
+        self.converted = dict(self.roots)
+        self.converted.update(pending)
+        return len(reclaimed)
+
+
+def checkentailment(
+    premises: list, goal: Wff, letters: list, heuristic: str = heuristic_appearance, threshold: int = 1 << 16
+):
+    """Decide whether the premises entail the goal.
+
+    Returns whether the premises can all be true, whether the goal can be false and the values of
+    the letters in the first counterexample in the order of the truth table, or None if there is
+    none.  This is the same form as `altrea.truthtables.findcounterexample`.  The threshold is
+    that of the `BDD` used.
+    """
+
+    manager = BDD(order(list(premises) + [goal], heuristic), threshold)
+    joined = manager.keep(manager.conjoin([manager.node(i) for i in premises]))
+    negatedgoal = manager.negate(manager.node(goal))
+    manager.release(joined)
+    counterexample = manager.apply(operator_and, joined, negatedgoal)
+    values = manager.satisfying(counterexample, letters)
+    return joined != manager.false, negatedgoal != manager.false, values
+
+
+def equivalent(first: Wff, second: Wff):
+    """Return whether two formulas are true in the same rows."""
+
+    manager = BDD(order([first, second]))
+    return manager.node(first) == manager.node(second)
+
+
+def tautology(formula: Wff):
+    """Return whether a formula is true in every row."""
+
+    return BDD(order([formula])).node(formula) == BDD.true
@@ -90,7 +90,7 @@ class No(Categorical):
 
 
 class SomeNot(Categorical):
-    """A class for the categorical proposition 'Some S are P'."""
+    """A class for the categorical proposition 'Some S are not P'."""
 
     def __init__(self, subjectterm: Term, predicateterm: Term):
         self.subjectterm = subjectterm
@@ -99,6 +99,6 @@ class SomeNot(Categorical):
         self.copula = self.copula_arenot
         self.quality = self.quality_negative
         self.quantity = self.quantity_particular
-        self.letter = self.letter_i
+        self.letter = self.letter_o
         self.subjectterm.distributed = self.undistributed
         self.predicateterm.distributed = self.distributed
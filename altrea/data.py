@@ -1,8 +1,28 @@
-"""This module interfaces between the python sqlite3 database."""
+"""This module interfaces between the python sqlite3 database.
+
+Connections are pooled rather than opened for each call.  Each thread keeps one connection
+per database file, closed when the thread ends, and the database file of each logic is
+remembered after it is first looked up in the metadata.
+- `connect` - Return the pooled connection to a database file for the current thread.
+- `pooled` - Roll back what a failing function using the pool left uncommitted.
+- `flush` - Commit the pooled connections of the current thread.
+- `closeconnections` - Close every pooled connection and forget the cached database files.
+
+Saved proofs used as lemmas are kept in a least recently used cache with their compiled patterns.
+- `LemmaCache` - The cache of saved proofs keyed by logic and name.
+- `getcachedproof` - Return a saved proof and its template from the cache.
+"""
 
 import sqlite3
 import pandas
 import os
+import threading
+import atexit
+import collections
+import functools
+import weakref
+
+from altrea.patterns import compilepattern
 
 
 # from altrea.wffs import And, Or, Not, Implies, Iff, Wff, Falsehood, Truth, ConclusionPremises
@@ -11,13 +31,199 @@ metadata = "altrea/data/metadata.db"
 datafolder = "altrea/data/"
 proofsfolder = 'altrea/proofs/research/contents/'
 
+lock = threading.RLock()
+pool = weakref.WeakSet()
+local = threading.local()
+databases = {}
+lemmacachesize = 256
+
+
+def closeall(connections: dict):
+    """Commit and close the connections of a dictionary and empty it."""
+
+    for i in connections.values():
+        i.commit()
+        i.close()
+    connections.clear()
+
+
+class ThreadConnections:
+    """The pooled connections of one thread keyed by the path of their database file.
+
+    It is kept in `threading.local`, so it is released when its thread ends and its connections
+    are then committed and closed.  `depth` counts the calls of `pooled` functions under way.
+    """
+
+    def __init__(self):
+        self.connections = {}
+        self.depth = 0
+        weakref.finalize(self, closeall, self.connections)
+
+    def rollback(self):
+        """Roll back the open transactions of the connections."""
+
+        for i in list(self.connections.values()):
+            if i.in_transaction:
+                i.rollback()
+
+
+def threadconnections():
+    """Return the pooled connections of the current thread."""
+
+    connections = getattr(local, "connections", None)
+    if connections is None:
+        connections = local.connections = ThreadConnections()
+    return connections
+
+
+def connect(path: str):
+    """Return the connection to the database file at `path` for the current thread.
+
+    The connection is opened the first time it is asked for and kept in the pool.  Work not
+    yet committed is left alone, so a call within another sees the writes of its caller.
+    """
+
+    connections = threadconnections()
+    key = os.path.abspath(path)
+    connection = connections.connections.get(key)
+    if connection is None:
+        connection = sqlite3.connect(path, check_same_thread=False)
+        connections.connections[key] = connection
+        with lock:
+            pool.add(connections)
+    return connection
+
+
+def pooled(function):
+    """Wrap a function using pooled connections so a transaction it leaves open by failing is rolled back.
+
+    Only the outermost such call rolls back, so a failure caught by the caller does not lose
+    the writes the caller has not yet committed.
+    """
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        connections = threadconnections()
+        connections.depth += 1
+        try:
+            return function(*args, **kwargs)
+        except BaseException:
+            if connections.depth == 1:
+                connections.rollback()
+            raise
+        finally:
+            connections.depth -= 1
+
+    return wrapper
+
+
+def flush():
+    """Commit the pooled connections of the current thread."""
+
+    for i in list(threadconnections().connections.values()):
+        i.commit()
+
+
+def closeconnections():
+    """Commit and close every pooled connection and forget the cached database files.
+
+    This should only be called when no other thread is using the pool.
+    """
+
+    with lock:
+        for i in list(pool):
+            closeall(i.connections)
+        pool.clear()
+        databases.clear()
+
+
+atexit.register(closeconnections)
+
+
+class LemmaCache:
+    """A least recently used cache of saved proofs keyed by logic and name.
+
+    Each entry holds the display name, description and pattern of a saved proof together with
+    the template compiled from the pattern.  The number of hits and misses is counted.
+    """
+
+    def __init__(self, maxsize: int = lemmacachesize):
+        self.maxsize = maxsize
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.RLock()
+
+    def get(self, logic: str, name: str):
+        """Return the display name, description, pattern and template of a saved proof.
+
+        A TypeError is raised if there is no saved proof by that name.
+        """
+
+        key = (logic, name)
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+        displayname, description, pattern = getsavedproof(logic, name)
+        entry = (displayname, description, pattern, compilepattern(pattern))
+        with self.lock:
+            self.entries[key] = entry
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, logic: str, name: str = ""):
+        """Forget the saved proof by that name or, without a name, every saved proof of the logic."""
+
+        with self.lock:
+            if name:
+                self.entries.pop((logic, name), None)
+            else:
+                for i in [i for i in self.entries if i[0] == logic]:
+                    del self.entries[i]
+
+    def clear(self):
+        """Forget every saved proof and reset the counters."""
+
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """Return the number of hits, misses and entries and the maximum size of the cache."""
+
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self.entries),
+                "maxsize": self.maxsize,
+            }
+
+
+lemmacache = LemmaCache()
+
+
+def getcachedproof(logic: str, name: str):
+    """Retrieve a saved proof with its compiled template through the lemma cache."""
+
+    return lemmacache.get(logic, name)
+
 
 def getreservedwords():
     return ["No Database", ""]
 
 
+@pooled
 def getdatabase(logic: str):
-    connection = sqlite3.connect(metadata)
+    with lock:
+        if logic in databases:
+            return databases[logic]
+    connection = connect(metadata)
     c = connection.cursor()
     statement = "SELECT database FROM logics WHERE logic =?"
     c.execute(statement, (logic,))
@@ -26,16 +232,19 @@ def getdatabase(logic: str):
         database = dbname[0]
     except TypeError:
         print(f'The logic "{logic}" could not be found in the logics table.')
+    else:
+        with lock:
+            databases[logic] = database
     connection.commit()
-    connection.close()
     return database
 
 
+@pooled
 def createmetadatatables():
     """Create the metadata file and logics and operators table if the logics table does not exist."""
 
     # Connect to metadata.
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     try:
         c.execute("SELECT COUNT(*) FROM logics")
@@ -111,11 +320,11 @@ def createmetadatatables():
                 )""")
         print("The bibliography table has been created.")
 
-    # Commit and close the connection.
+    # Commit the changes.
     connection.commit()
-    connection.close()
 
 
+@pooled
 def addlogic(
     logic: str,
     database: str,
@@ -137,7 +346,7 @@ def addlogic(
         raise TypeError("The name of the logic must be of string type.")
 
     # Connect to metadata to see if the logic already exists.
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     try:
         c.execute("SELECT database, description FROM logics WHERE logic=?", (logic,))
@@ -217,11 +426,12 @@ def addlogic(
 
     connection.commit()
     print(f"Data loaded to the {metadata} tables have been committed.")
-    connection.close()
 
     # Create the proofs table in the dbname database.
+    with lock:
+        databases.pop(logic, None)
     database = getdatabase(logic)
-    connection = sqlite3.connect(database)
+    connection = connect(database)
     c = connection.cursor()
     statement = "SELECT COUNT(*) FROM proofs"
     
@@ -268,12 +478,12 @@ def addlogic(
     else:
         print(f"The proof table already contains {howmany[0]} rows.")
 
-    # Commit and close the connection.
+    # Commit the changes.
     connection.commit()
     print(f"Data loaded to the {database} tables have been committed.")
-    connection.close()
 
 
+@pooled
 def deletelogic(logic: str):
     # Connect and get a cursor to the logic database.
     try:
@@ -282,7 +492,7 @@ def deletelogic(logic: str):
         # print(f'The logic "{logic}" is not defined in the database.')
         pass
     else:
-        connection = sqlite3.connect(database)
+        connection = connect(database)
         c = connection.cursor()
 
         # Drop the proofcodelines table.
@@ -300,12 +510,11 @@ def deletelogic(logic: str):
         c.execute(statement)
         print(f"The proofs table for logic {logic} has been dropped.")
 
-        # Commit and disconnect.
+        # Commit the changes.
         connection.commit()
-        connection.close()
 
         # Connect and get cursor to metadata database.
-        connection = sqlite3.connect(metadata)
+        connection = connect(metadata)
         c = connection.cursor()
 
         # Delete from the definitions table.
@@ -332,16 +541,19 @@ def deletelogic(logic: str):
         statement = "DELETE FROM logics WHERE logic=?"
         c.execute(statement, (logic,))
         print(f"The record for {logic} in the logics table has been deleted.")
+        with lock:
+            databases.pop(logic, None)
+        lemmacache.invalidate(logic)
 
-        # Commit and disconnect.
+        # Commit the changes.
         connection.commit()
-        connection.close()
 
 
+@pooled
 def getlogic(logic: str):
     """Retrieve the details about the logic."""
 
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     statement = """SELECT 
         database, 
@@ -351,17 +563,17 @@ def getlogic(logic: str):
     c.execute(statement, (logic,))
     row = c.fetchone()
     connection.commit()
-    connection.close()
     if type(row) is not None:
         return row
     else:
         return ("", "")
 
 
+@pooled
 def getdefinedlogics():
     """Retrieve all of the defined logics."""
 
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     statement = """SELECT 
         logic, 
@@ -372,17 +584,17 @@ def getdefinedlogics():
     c.execute(statement)
     rows = c.fetchall()
     connection.commit()
-    connection.close()
     index = [i for i in range(1, len(rows) + 1)]
     columns = ["Name", "Database", "Description"]
     df = pandas.DataFrame(rows, index=index, columns=columns)
     return df
 
 
+@pooled
 def addaxiom(logic: str, name: str, pattern: str, displayname: str, description: str):
     """Add an axiom to a logic."""
 
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     statement = "SELECT COUNT(*) FROM axioms WHERE logic=? AND name=?"
     c.execute(
@@ -411,13 +623,13 @@ def addaxiom(logic: str, name: str, pattern: str, displayname: str, description:
         print(
             f'There is already an axiom by the name "{name}" in the "{logic}" database.'
         )
-    connection.close()
 
 
+@pooled
 def deleteaxiom(logic: str, name: str):
     """Delete an axiom from a logic."""
 
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     statement = "SELECT COUNT(*) FROM axioms WHERE logic=? AND name=?"
     c.execute(
@@ -441,13 +653,13 @@ def deleteaxiom(logic: str, name: str):
         print(f'The axiom "{name}" has been deleted from the "{logic}" database.')
     else:
         print(f'There is no axiom by the name "{name}" in the "{logic}" database.')
-    connection.close()
 
 
+@pooled
 def getaxiom(logic: str, name: str):
     """Retrieve a single axiom by name."""
 
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     statement = """SELECT 
         displayname, 
@@ -465,14 +677,14 @@ def getaxiom(logic: str, name: str):
     )
     displayname, description, pattern = c.fetchone()
     connection.commit()
-    connection.close()
     return displayname, description, pattern
 
 
+@pooled
 def getaxioms(logic: str):
     """Retrieve all of the axioms of this logic."""
     
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     statement = """SELECT 
         name, 
@@ -489,14 +701,14 @@ def getaxioms(logic: str):
     else:
         rows = c.fetchall()
         connection.commit()
-        connection.close()
         return rows
     
 
+@pooled
 def addconnective(logic: str, name: str, str: str, latex: str, description: str):
     """Add a connective to a logic."""
 
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     statement = "SELECT COUNT(*) FROM connectives WHERE logic=? AND name=?"
     c.execute(
@@ -525,13 +737,13 @@ def addconnective(logic: str, name: str, str: str, latex: str, description: str)
         print(
             f'There is already a connective by the name "{name}" in the "{logic}" database.'
         )
-    connection.close()
 
 
+@pooled
 def deleteconnective(logic: str, name: str):
     """Delete an axiom from a logic."""
 
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     statement = "SELECT COUNT(*) FROM connectives WHERE logic=? AND name=?"
     c.execute(
@@ -555,13 +767,13 @@ def deleteconnective(logic: str, name: str):
         print(f'The connective "{name}" has been deleted from the "{logic}" database.')
     else:
         print(f'There is no connective by the name "{name}" in the "{logic}" database.')
-    connection.close()
 
 
+@pooled
 def getconnective(logic: str, name: str):
     """Retrieve a single connective by name."""
 
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     statement = """SELECT 
         str, 
@@ -579,14 +791,14 @@ def getconnective(logic: str, name: str):
     )
     str, latex, description = c.fetchone()
     connection.commit()
-    connection.close()
     return str, latex, description
 
 
+@pooled
 def getconnectives(logic: str):
     """Retrieve the connectors of this logic."""
 
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     statement = "SELECT name, str, latex, description FROM connectives WHERE logic=?"
     try:
@@ -596,16 +808,16 @@ def getconnectives(logic: str):
     else:
         rows = c.fetchall()
         connection.commit()
-        connection.close()
         return rows
     
 
+@pooled
 def addrule(
     logic: str, name: str, pattern: str, displayname: str, description: str
 ):
     """Add a rule to a logic."""
 
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     statement = "SELECT COUNT(*) FROM rules WHERE logic=? AND name=?"
     c.execute(
@@ -634,13 +846,13 @@ def addrule(
         print(
             f'There is already a rule by the name "{name}" in the "{logic}" database.'
         )
-    connection.close()
 
 
+@pooled
 def deleterule(logic: str, name: str):
     """Delete an rule from a logic."""
 
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     statement = "SELECT COUNT(*) FROM rules WHERE logic=? AND name=?"
     c.execute(
@@ -664,13 +876,13 @@ def deleterule(logic: str, name: str):
         print(f'The rule "{name}" has been deleted from the "{logic}" database.')
     else:
         print(f'There is no rule by the name "{name}" in the "{logic}" database.')
-    connection.close()
 
 
+@pooled
 def getrules(logic: str):
     """Retrieve the transformation rules of this logic."""
 
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     statement = """SELECT 
         name, 
@@ -688,11 +900,11 @@ def getrules(logic: str):
         rows = c.fetchall()
         #print(f"The number of rules returned is {len(rows)}.")
         connection.commit()
-        connection.close()
         return rows
     
+@pooled
 def gethowmanyrules(logic: str):
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     statement = "SELECT COUNT() FROM rules WHERE logic=?"
     c.execute(statement, (logic,))
@@ -700,12 +912,13 @@ def gethowmanyrules(logic: str):
     return rows
 
 
+@pooled
 def adddefinition(
     logic: str, name: str, pattern: str, displayname: str, description: str
 ):
     """Add a definition to a logic."""
 
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     statement = "SELECT COUNT(*) FROM definitions WHERE logic=? AND name=?"
     c.execute(
@@ -734,13 +947,13 @@ def adddefinition(
         print(
             f'There is already a definition by the name "{name}" in the "{logic}" database.'
         )
-    connection.close()
 
 
+@pooled
 def deletedefinition(logic: str, name: str):
     """Delete a definition from a logic."""
 
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     statement = "SELECT COUNT(*) FROM definitions WHERE logic=? AND name=?"
     c.execute(
@@ -764,13 +977,13 @@ def deletedefinition(logic: str, name: str):
         print(f'The definition "{name}" has been deleted from the "{logic}" database.')
     else:
         print(f'There is no definition by the name "{name}" in the "{logic}" database.')
-    connection.close()
 
 
+@pooled
 def getdefinitions(logic: str):
     """Retrieve the axioms of this logic."""
 
-    connection = sqlite3.connect(metadata)
+    connection = connect(metadata)
     c = connection.cursor()
     statement = """SELECT 
         name, 
@@ -787,10 +1000,10 @@ def getdefinitions(logic: str):
     else:
         rows = c.fetchall()
         connection.commit()
-        connection.close()
         return rows
     
 
+@pooled
 def addproof(proofdata: list, proofcode: list):
     """Add a proof to a logic."""
 
@@ -801,7 +1014,7 @@ def addproof(proofdata: list, proofcode: list):
     pattern = proofdata[0][4]
     database = getdatabase(logic)
     print(f"Connecting to {logic} using {database} to store proof {name}.")
-    connection = sqlite3.connect(database)
+    connection = connect(database)
     c = connection.cursor()
     statement = "SELECT COUNT(*) FROM proofs where name=?"
     c.execute(statement, (name,))
@@ -844,7 +1057,7 @@ def addproof(proofdata: list, proofcode: list):
             f'The proof code lines for "{name}" have been added to "{logic}".'
         )
         connection.commit()
-        connection.close()
+        lemmacache.invalidate(logic, name)
     else:
         print(
             f'Details for a proof named "{name}" already exist for "{logic}".'
@@ -852,9 +1065,10 @@ def addproof(proofdata: list, proofcode: list):
     return howmany[0]
 
 
+@pooled
 def deleteproof(logic: str, name: str):
     database = getdatabase(logic)
-    connection = sqlite3.connect(database)
+    connection = connect(database)
     c = connection.cursor()
     statement = "DELETE FROM proofdetails WHERE name=?"
     c.execute(statement, (name,))
@@ -870,12 +1084,13 @@ def deleteproof(logic: str, name: str):
     c.execute(statement, (name,))
     print(f'The proof "{name}" has been deleted from proofs for "{logic}".')
     connection.commit()
-    connection.close()
+    lemmacache.invalidate(logic, name)
 
     
+@pooled
 def getproofs(logic: str):
     database = getdatabase(logic)
-    connection = sqlite3.connect(database)
+    connection = connect(database)
     c = connection.cursor()
     statement = (
         "SELECT name, pattern, displayname, description FROM proofs ORDER BY name"
@@ -887,13 +1102,13 @@ def getproofs(logic: str):
     else:
         rows = c.fetchall()
         connection.commit()
-        connection.close()
         return rows
 
 
+@pooled
 def getproofdetails(logic: str, name: str):
     database = getdatabase(logic)
-    connection = sqlite3.connect(database)
+    connection = connect(database)
     c = connection.cursor()
     statement = """SELECT 
         item, 
@@ -914,13 +1129,13 @@ def getproofdetails(logic: str, name: str):
     else:
         rows = c.fetchall()
         connection.commit()
-        connection.close()
         return rows
     
 
+@pooled
 def getproofcodelines(logic: str, name: str):
     database = getdatabase(logic)
-    connection = sqlite3.connect(database)
+    connection = connect(database)
     c = connection.cursor()
     statement = """SELECT 
         line 
@@ -933,31 +1148,30 @@ def getproofcodelines(logic: str, name: str):
     else:
         rows = c.fetchall()
         connection.commit()
-        connection.close()
         return rows
 
 
+@pooled
 def getlemma(logic: str, displayname: str):
     database = getdatabase(logic)
-    connection = sqlite3.connect(database)
+    connection = connect(database)
     c = connection.cursor()
     statement = "SELECT name, description, pattern FROM proofs WHERE displayname=?"
     c.execute(statement, (displayname,))
     name, description, pattern = c.fetchone()
     connection.commit()
-    connection.close()
     return name, description, pattern
 
 
+@pooled
 def getsavedproof(logic: str, name: str):
     database = getdatabase(logic)
-    connection = sqlite3.connect(database)
+    connection = connect(database)
     c = connection.cursor()
     statement = "SELECT displayname, description, pattern FROM proofs WHERE name=?"
     c.execute(statement, (name,))
     displayname, description, pattern = c.fetchone()
     connection.commit()
-    connection.close()
     return displayname, description, pattern
 
 
@@ -0,0 +1,109 @@
+# discrimination.py
+"""This module provides a discrimination tree which indexes the premises of rules by their shape.
+
+A premise such as "Implies({0}, And({1}, {0}))" is written in preorder as the keys
+`("Implies", 2), "*", ("And", 2), "*", "*"` where "*" stands for any subformula.  The keys of
+every premise are stored in a trie.  A formula from a proof is written the same way and walked
+down the trie, a "*" edge skipping a whole subformula, so only the premises it could match are
+found without trying each one.  The premises found are then checked with `Template.match`,
+which also binds their placeholders.
+
+It contains the following:
+- `wildcard` - The key standing for any subformula.
+- `patternkeys(node)` - Return the keys of a template node.
+- `formulakeys(formula)` - Return the keys of a formula and where each subformula ends.
+- `DiscriminationTree` - A trie of premises keyed on their connectives in preorder.
+"""
+
+from altrea.patterns import callnode
+
+
+wildcard = "*"
+
+
+def patternkeys(node: tuple):
+    """Return the keys of a template node in preorder.
+
+    A call is keyed by its name and number of arguments.  Placeholders, names, constants and
+    lists may stand for anything and are keyed by the wildcard.
+    """
+
+    keys = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node[0] == callnode:
+            keys.append((node[1], len(node[2])))
+            stack.extend(reversed(node[2]))
+        else:
+            keys.append(wildcard)
+    return keys
+
+
+def formulakeys(formula):
+    """Return the keys of a formula in preorder and, for each key, the position after its subformula.
+
+    A node is keyed by the name of its class and its number of subformulas.
+    """
+
+    keys = []
+    ends = []
+    stack = [(formula, None)]
+    while stack:
+        node, position = stack.pop()
+        if position is not None:
+            ends[position] = len(keys)
+            continue
+        children = getattr(node, "childnodes", None)
+        if children is None:
+            children = node.children() if hasattr(node, "children") else ()
+        stack.append((node, len(keys)))
+        keys.append((type(node).__name__, len(children)))
+        ends.append(None)
+        stack.extend((i, None) for i in reversed(children))
+    return keys, ends
+
+
+class DiscriminationTree:
+    """A trie of the premises of rules keyed on their connectives in preorder.
+
+    Each premise is stored with a value such as the rule and position it comes from.  The
+    values of the premises a formula may match are returned by `candidates`.  Every premise
+    that matches the formula is among them, though some of them may not match once the
+    placeholders that occur more than once are compared.
+    """
+
+    def __init__(self):
+        self.root = {}
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def insert(self, node: tuple, value):
+        """Store the value under the keys of a template node."""
+
+        branch = self.root
+        for i in patternkeys(node):
+            branch = branch.setdefault(i, {})
+        branch.setdefault(None, []).append(value)
+        self.size += 1
+
+    def candidates(self, formula):
+        """Return the values of the premises the formula may match."""
+
+        keys, ends = formulakeys(formula)
+        found = []
+        stack = [(self.root, 0)]
+        while stack:
+            branch, position = stack.pop()
+            if position == len(keys):
+                found.extend(branch.get(None, ()))
+                continue
+            following = branch.get(wildcard)
+            if following is not None:
+                stack.append((following, ends[position]))
+            following = branch.get(keys[position])
+            if following is not None:
+                stack.append((following, position + 1))
+        return found
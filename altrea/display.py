@@ -9,6 +9,7 @@ import pandas
 
 from altrea.rules import Proof
 import altrea.data
+import altrea.wffs
 
 
 def fitchnotation(p: Proof):
@@ -30,6 +31,9 @@ def fitchnotation(p: Proof):
     p.coimplication_elim_name = "coimp elim"
     p.explosion_name = "Explosion"
 
+    # Formulas are rendered again in case the notation of their connectives changed.
+    altrea.wffs.resetrenderings()
+
 
 def definedlogics():
     rows = list(altrea.data.getdefinedlogics())
@@ -0,0 +1,348 @@
+# finitemodels.py
+"""This module searches for finite countermodels of first order arguments.
+
+As in Mace4, the domains {0}, {0, 1}, {0, 1, 2}, ... are tried in turn.  For a domain of size n
+each `ForAll` is written as the conjunction and each `ThereExists` as the disjunction of its
+formula with the variables set to every element, so the formulas become propositional formulas
+whose letters are the atoms `P(k)` of the predicates and `R(k, j)` of the relations.  These are
+given to the CDCL solver of `altrea.sat`, and a satisfying assignment is an `altrea.fol.Interpretation`
+making the formulas true.  Each subject has one letter for each element it may name and clauses
+requiring it to name exactly one of them.
+
+The encoding is incremental.  One solver is kept for every size, the letters of the atoms are
+shared between the sizes and each grounded subformula is given a literal by Tseitin clauses that
+hold whatever its value is.  The formulas to satisfy, and the clauses that a subject names an
+element of the current domain, are only assumed when the solver is called, so the clauses
+learned for one size are kept for the next.
+
+Two kinds of symmetry are broken, since permuting the elements of a model gives another:
+
+- The i-th subject met, counting from 0, names one of the elements 0 to i.
+- The elements no subject can name are ordered so that those of which the first predicate is
+    true come first.
+
+It contains the following:
+- `ModelFinder` - A search for finite models of formulas over the domains of increasing size.
+- `countermodel(premises, goal, maxsize)` - Return a finite model in which the premises hold and the goal fails.
+"""
+
+import itertools
+
+from altrea.wffs import (
+    And,
+    Or,
+    Not,
+    Implies,
+    Iff,
+    Falsehood,
+    Truth,
+    ForAll,
+    ThereExists,
+    Attribute,
+    Relation,
+    Identity,
+    Subject,
+    Variable,
+    Wff,
+)
+from altrea.sat import Encoder
+from altrea.fol import Domain, Interpretation
+
+
+class ModelFinder:
+    """A search for finite models of first order formulas.
+
+    The subjects, predicates and relations are read from the formulas given.  Other formulas may
+    be passed to `satisfiable` as long as they have no new subjects, since the symmetry breaking
+    depends on the number of subjects.  After `satisfiable` returns True, `model`
+    is an interpretation over the domain of the size tried which makes the formulas true.
+
+    Parameters:
+        formulas: The formulas, such as the premises and goal of an argument, to be searched.
+        domainname: The name of the domains of the models.
+    """
+
+    def __init__(self, formulas: list, domainname: str = "D"):
+        self.encoder = Encoder()
+        self.solver = self.encoder.solver
+        self.true = self.encoder.true
+        self.domainname = domainname
+        self.constants = {}
+        self.predicates = {}
+        self.relations = {}
+        self.atoms = {}
+        self.literals = {}
+        self.freevariables = {}
+        self.selectors = {}
+        self.ordered = 0
+        self.model = None
+        for i in formulas:
+            self.scan(i)
+
+    def scan(self, formula: Wff):
+        """Record the subjects, predicates and relations of a formula in the order they are met."""
+
+        stack = [formula]
+        while stack:
+            node = stack.pop()
+            if id(node) in self.freevariables:
+                continue
+            if isinstance(node, (Attribute, Relation, Identity)):
+                if isinstance(node, Attribute):
+                    self.predicates.setdefault(node.predicate.name, None)
+                elif isinstance(node, Relation):
+                    self.relations.setdefault(node.connective.name, None)
+                terms = self.terms(node)
+                for i in terms:
+                    if isinstance(i, Subject):
+                        self.constant(i.name)
+                    elif not isinstance(i, Variable):
+                        raise ValueError(f'The term "{i}" is neither a variable nor a subject.')
+                names = [i.name for i in terms if isinstance(i, Variable)]
+                self.freevariables[id(node)] = tuple(dict.fromkeys(names))
+            elif isinstance(node, (Truth, Falsehood)):
+                self.freevariables[id(node)] = ()
+            elif len(self.operands(node)) > 0:
+                stack.extend(self.operands(node))
+            else:
+                raise ValueError(f'The formula "{node}" cannot be interpreted over a finite domain.')
+        self.variablesof(formula)
+
+    def constant(self, name: str):
+        """Add the letters of the elements a new subject may name and the clauses that it names at most one."""
+
+        if name in self.constants:
+            return
+        elif len(self.selectors) > 0:
+            raise ValueError(f'The subject "{name}" is not in the formulas given to the model finder.')
+        choices = [self.solver.newvariable() for i in range(len(self.constants) + 1)]
+        for i, j in itertools.combinations(choices, 2):
+            self.solver.addclause([-i, -j])
+        self.constants[name] = choices
+
+    def terms(self, node: Wff):
+        if isinstance(node, Attribute):
+            return (node.subject,)
+        return (node.left, node.right)
+
+    def operands(self, node: Wff):
+        if isinstance(node, (And, Or, Implies, Iff)):
+            return (node.left, node.right)
+        elif isinstance(node, Not):
+            return (node.negated,)
+        elif isinstance(node, (ForAll, ThereExists)):
+            return (node.wff,)
+        return ()
+
+    def bound(self, node: Wff):
+        """Return the names of the distinct variables a quantifier binds."""
+
+        return tuple(dict.fromkeys(i.name for i in node.vars))
+
+    def variablesof(self, formula: Wff):
+        """Return the names of the free variables of a scanned formula in the order they are met."""
+
+        stack = [(formula, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in self.freevariables:
+                continue
+            children = self.operands(node)
+            if not expanded:
+                stack.append((node, True))
+                stack.extend((i, False) for i in reversed(children))
+                continue
+            names = [j for i in children for j in self.freevariables[id(i)]]
+            if isinstance(node, (ForAll, ThereExists)):
+                bound = self.bound(node)
+                names = [i for i in names if i not in bound]
+            self.freevariables[id(node)] = tuple(dict.fromkeys(names))
+        return self.freevariables[id(formula)]
+
+    def atom(self, name: str, elements: tuple):
+        """Return the letter of a predicate or relation holding of the elements."""
+
+        key = (name, elements)
+        if key not in self.atoms:
+            self.atoms[key] = self.solver.newvariable()
+        return self.atoms[key]
+
+    def gate(self, literals: list, conjunctive: bool):
+        """Return a literal equivalent to the conjunction, or disjunction, of the literals."""
+
+        absorbing = -self.true if conjunctive else self.true
+        unit = -absorbing
+        distinct = {}
+        for i in literals:
+            if i == absorbing or -i in distinct:
+                return absorbing
+            elif i != unit:
+                distinct[i] = True
+        distinct = list(distinct)
+        if len(distinct) == 0:
+            return unit
+        elif len(distinct) == 1:
+            return distinct[0]
+        sign = 1 if conjunctive else -1
+        x = self.solver.newvariable()
+        for i in distinct:
+            self.solver.addclause([-sign * x, sign * i])
+        self.solver.addclause([sign * x] + [-sign * i for i in distinct])
+        return x
+
+    def options(self, term: Wff, assignment: dict, size: int):
+        """Return the elements a term may denote, each with the literal of the subject naming it."""
+
+        if isinstance(term, Variable):
+            return [(assignment[term.name], self.true)]
+        choices = self.constants[term.name]
+        return [(k, choices[k]) for k in range(min(size, len(choices)))]
+
+    def ground(self, node: Wff, assignment: dict, size: int):
+        """Return the literal of an atomic formula with its variables set by the assignment."""
+
+        if isinstance(node, Truth):
+            return self.true
+        elif isinstance(node, Falsehood):
+            return -self.true
+        elif isinstance(node, Attribute):
+            name = node.predicate.name
+        elif isinstance(node, Relation):
+            name = node.connective.name
+        cases = []
+        for combination in itertools.product(*[self.options(i, assignment, size) for i in self.terms(node)]):
+            elements = tuple(i[0] for i in combination)
+            conditions = [i[1] for i in combination]
+            if isinstance(node, Identity):
+                if elements[0] != elements[1]:
+                    continue
+            else:
+                conditions.append(self.atom(name, elements))
+            cases.append(self.gate(conditions, True))
+        return self.gate(cases, False)
+
+    def instances(self, node: Wff, assignment: dict, size: int):
+        """Return the subformulas of a node with the assignments of their variables."""
+
+        if isinstance(node, (ForAll, ThereExists)):
+            bound = self.bound(node)
+            result = []
+            for elements in itertools.product(range(size), repeat=len(bound)):
+                extended = dict(assignment)
+                extended.update(zip(bound, elements))
+                result.append((node.wff, extended))
+            return result
+        return [(i, assignment) for i in self.operands(node)]
+
+    def key(self, node: Wff, assignment: dict, size: int):
+        return (id(node), size, tuple(assignment[i] for i in self.freevariables[id(node)]))
+
+    def literal(self, formula: Wff, size: int, assignment: dict = None):
+        """Return the literal of a formula over the domain of the size, adding the clauses defining it.
+
+        A subformula with the same elements for its free variables is given one literal.
+        """
+
+        assignment = {} if assignment is None else assignment
+        if id(formula) not in self.freevariables:
+            self.scan(formula)
+        missing = [i for i in self.freevariables[id(formula)] if i not in assignment]
+        if len(missing) > 0:
+            raise ValueError(f'The formula "{formula}" has the free variables {", ".join(missing)}.')
+        stack = [(formula, assignment, False)]
+        while stack:
+            node, values, expanded = stack.pop()
+            key = self.key(node, values, size)
+            if key in self.literals:
+                continue
+            children = self.instances(node, values, size)
+            if len(self.operands(node)) == 0:
+                self.literals[key] = (node, self.ground(node, values, size))
+            elif expanded:
+                operands = [self.literals[self.key(i, j, size)][1] for i, j in children]
+                self.literals[key] = (node, self.define(node, operands))
+            else:
+                stack.append((node, values, True))
+                stack.extend((i, j, False) for i, j in reversed(children))
+        return self.literals[self.key(formula, assignment, size)][1]
+
+    def define(self, node: Wff, operands: list):
+        if isinstance(node, Not):
+            return -operands[0]
+        elif isinstance(node, ForAll):
+            return self.gate(operands, True)
+        elif isinstance(node, ThereExists):
+            return self.gate(operands, False)
+        return self.encoder.define(node, operands)
+
+    def selector(self, size: int):
+        """Return the letter which, when assumed, makes each subject name an element of the domain of the size.
+
+        The clauses ordering the elements no subject can name by the first predicate are added
+        for the elements of the domain.
+        """
+
+        if size not in self.selectors:
+            selector = self.solver.newvariable()
+            for choices in self.constants.values():
+                self.solver.addclause([-selector] + choices[:size])
+            self.selectors[size] = selector
+        if len(self.predicates) > 0:
+            first = next(iter(self.predicates))
+            self.ordered = max(self.ordered, len(self.constants))
+            while self.ordered + 1 < size:
+                self.solver.addclause([-self.atom(first, (self.ordered + 1,)), self.atom(first, (self.ordered,))])
+                self.ordered += 1
+        return self.selectors[size]
+
+    def satisfiable(self, formulas: list, size: int):
+        """Check whether the formulas are true together in some interpretation over a domain of the size."""
+
+        if size < 1:
+            raise ValueError(f'The size {size} of a domain must be at least 1.')
+        assumptions = [self.selector(size)] + [self.literal(i, size) for i in formulas]
+        if not self.solver.solve(assumptions):
+            self.model = None
+            return False
+        self.model = self.modelfrom(size)
+        return True
+
+    def modelfrom(self, size: int):
+        """Return the interpretation over the domain of the size given by the solver's assignment."""
+
+        values = self.solver.model
+
+        def holds(name, elements):
+            key = (name, elements)
+            return key in self.atoms and values[self.atoms[key]]
+
+        predicates = {i: [k for k in range(size) if holds(i, (k,))] for i in self.predicates}
+        relations = {
+            i: [(k, j) for k in range(size) for j in range(size) if holds(i, (k, j))] for i in self.relations
+        }
+        subjects = {}
+        for name, choices in self.constants.items():
+            subjects[name] = next(k for k in range(min(size, len(choices))) if values[choices[k]])
+        return Interpretation(Domain(list(range(size)), self.domainname), predicates, relations, subjects)
+
+    def search(self, formulas: list, maxsize: int):
+        """Return an interpretation over the smallest domain of at most `maxsize` elements making the formulas true, or None."""
+
+        for size in range(1, maxsize + 1):
+            if self.satisfiable(formulas, size):
+                return self.model
+        return None
+
+    def countermodel(self, premises: list, goal: Wff, maxsize: int):
+        """Return an interpretation of at most `maxsize` elements making the premises true and the goal false, or None."""
+
+        return self.search(premises + [Not(goal)], maxsize)
+
+
+def countermodel(premises: list, goal: Wff, maxsize: int = 6):
+    """Return the smallest interpretation of at most `maxsize` elements making the premises true and the goal false, or None.
+
+    Finding none does not show the argument is valid, since its countermodels may all be larger.
+    """
+
+    return ModelFinder(premises + [goal]).countermodel(premises, goal, maxsize)
@@ -1,5 +1,38 @@
 # fol.py
-"""This module support first order logic."""
+"""This module support first order logic.
+
+An `Interpretation` gives the predicates, relations and subjects of formulas their meaning
+over the elements of a `Domain`.  A predicate is a NumPy boolean vector with one entry for each
+element and a relation a boolean matrix.  A formula with free variables is evaluated to a
+boolean array with one axis for each of them, the connectives combine the arrays of their
+operands by broadcasting along the axes they share, and `ForAll` and `ThereExists` reduce the
+array along the axes of the variables they bind with `all` and `any`.  So each atom is read
+once for every element at the same time rather than once for each assignment.
+
+It contains the following:
+- `Domain` - A container for the specific elements.
+- `Interpretation` - The meaning of predicates, relations and subjects over a domain.
+"""
+
+import numpy
+
+from altrea.wffs import (
+    And,
+    Or,
+    Not,
+    Implies,
+    Iff,
+    Falsehood,
+    Truth,
+    ForAll,
+    ThereExists,
+    Attribute,
+    Relation,
+    Identity,
+    Subject,
+    Variable,
+    Wff,
+)
 
 class Domain():
     """Define a container for the specific elements."""
@@ -112,5 +145,224 @@ class Domain():
     
 #     def pattern(self, objectlist: list):
 #         return f'{self.left.pattern(objectlist)}{self.right.pattern(objectlist)}'
-    
 
+
+class Interpretation:
+    """The meaning of the predicates, relations and subjects of formulas over a domain.
+
+    Parameters:
+        domain: The domain whose elements the variables range over.
+        predicates: A dictionary from the name of each predicate to the elements it is true of,
+            either as a boolean vector with one entry for each element or as a collection of
+            elements.
+        relations: A dictionary from the name of each connective of a `Relation` to the pairs of
+            elements it holds between, either as a square boolean matrix or as a collection of
+            pairs.
+        subjects: A dictionary from the name of a subject to the element it names.  A subject
+            not in it names the element written the same way.
+
+    Elements are told apart by how they are written with `str`.
+    """
+
+    def __init__(self, domain: Domain, predicates: dict = None, relations: dict = None, subjects: dict = None):
+        self.domain = domain
+        self.size = len(domain.elements)
+        if self.size == 0:
+            raise ValueError(f'The domain "{domain.name}" has no elements.')
+        self.positions = {str(j): i for i, j in enumerate(domain.elements)}
+        self.predicates = {i: self.vectorof(j) for i, j in (predicates or {}).items()}
+        self.relations = {i: self.matrixof(j) for i, j in (relations or {}).items()}
+        self.subjects = {i: self.position(j) for i, j in (subjects or {}).items()}
+        self.identity = None
+
+    def position(self, element):
+        """Return the position of an element in the domain."""
+
+        try:
+            return self.positions[str(element)]
+        except KeyError:
+            raise ValueError(f'The element "{element}" is not in the domain "{self.domain.name}".')
+
+    def vectorof(self, values):
+        """Return the boolean vector of a set of elements given as a vector or a collection of elements."""
+
+        if isinstance(values, numpy.ndarray) and values.dtype == bool:
+            if values.shape != (self.size,):
+                raise ValueError(f'The vector has shape {values.shape} instead of ({self.size},).')
+            return values
+        vector = numpy.zeros(self.size, dtype=bool)
+        vector[[self.position(i) for i in values]] = True
+        return vector
+
+    def matrixof(self, values):
+        """Return the boolean matrix of a set of pairs given as a matrix or a collection of pairs."""
+
+        if isinstance(values, numpy.ndarray) and values.dtype == bool:
+            if values.shape != (self.size, self.size):
+                raise ValueError(f'The matrix has shape {values.shape} instead of ({self.size}, {self.size}).')
+            return values
+        matrix = numpy.zeros((self.size, self.size), dtype=bool)
+        for left, right in values:
+            matrix[self.position(left), self.position(right)] = True
+        return matrix
+
+    def term(self, term: Wff):
+        """Return the name of a variable or the position of the element a subject names."""
+
+        if isinstance(term, Variable):
+            return term.name, None
+        elif isinstance(term, Subject):
+            if term.name in self.subjects:
+                return None, self.subjects[term.name]
+            return None, self.position(term.name)
+        raise ValueError(f'The term "{term}" is neither a variable nor a subject.')
+
+    def binary(self, matrix: numpy.ndarray, left: Wff, right: Wff):
+        """Return the variables and array of a binary relation between two terms."""
+
+        leftname, leftposition = self.term(left)
+        rightname, rightposition = self.term(right)
+        if leftname is None and rightname is None:
+            return (), numpy.asarray(matrix[leftposition, rightposition])
+        elif rightname is None:
+            return (leftname,), matrix[:, rightposition]
+        elif leftname is None:
+            return (rightname,), matrix[leftposition, :]
+        elif leftname == rightname:
+            return (leftname,), matrix.diagonal()
+        return (leftname, rightname), matrix
+
+    def atom(self, node: Wff):
+        """Return the variables and array of an atomic formula."""
+
+        if isinstance(node, Attribute):
+            try:
+                vector = self.predicates[node.predicate.name]
+            except KeyError:
+                raise ValueError(f'The predicate "{node.predicate}" has no extension in the interpretation.')
+            name, position = self.term(node.subject)
+            if name is None:
+                return (), numpy.asarray(vector[position])
+            return (name,), vector
+        elif isinstance(node, Relation):
+            try:
+                matrix = self.relations[node.connective.name]
+            except KeyError:
+                raise ValueError(f'The relation "{node.connective}" has no extension in the interpretation.')
+            return self.binary(matrix, node.left, node.right)
+        elif isinstance(node, Identity):
+            if self.identity is None:
+                self.identity = numpy.eye(self.size, dtype=bool)
+            return self.binary(self.identity, node.left, node.right)
+        elif isinstance(node, Truth):
+            return (), numpy.asarray(True)
+        elif isinstance(node, Falsehood):
+            return (), numpy.asarray(False)
+        raise ValueError(f'The formula "{node}" cannot be evaluated in an interpretation.')
+
+    def operands(self, node: Wff):
+        if isinstance(node, (And, Or, Implies, Iff)):
+            return (node.left, node.right)
+        elif isinstance(node, Not):
+            return (node.negated,)
+        elif isinstance(node, (ForAll, ThereExists)):
+            return (node.wff,)
+        return ()
+
+    def expand(self, variables: tuple, array: numpy.ndarray, target: tuple):
+        """Return the array with its axes in the order of the target variables, a missing one having length 1."""
+
+        order = [variables.index(i) for i in target if i in variables]
+        if len(order) > 1:
+            array = numpy.transpose(array, order)
+        return array.reshape([self.size if i in variables else 1 for i in target])
+
+    def combine(self, node: Wff, parts: list):
+        """Return the variables and array of a connective or quantifier from those of its operands."""
+
+        if isinstance(node, Not):
+            return parts[0][0], ~parts[0][1]
+        elif isinstance(node, (ForAll, ThereExists)):
+            variables, array = parts[0]
+            for i in node.vars:
+                if i.name in variables:
+                    axis = variables.index(i.name)
+                    array = array.all(axis) if isinstance(node, ForAll) else array.any(axis)
+                    variables = variables[:axis] + variables[axis + 1:]
+            return variables, numpy.asarray(array)
+        (leftvariables, left), (rightvariables, right) = parts
+        variables = leftvariables + tuple(i for i in rightvariables if i not in leftvariables)
+        left = self.expand(leftvariables, left, variables)
+        right = self.expand(rightvariables, right, variables)
+        if isinstance(node, And):
+            return variables, left & right
+        elif isinstance(node, Or):
+            return variables, left | right
+        elif isinstance(node, Implies):
+            return variables, ~left | right
+        return variables, left == right
+
+    def extension(self, formula: Wff):
+        """Return the names of the free variables of the formula and the array of where it is true.
+
+        The array has one axis for each free variable in the order of the names, and its entry
+        at a position is whether the formula is true when each variable is the element at that
+        position.  A subformula that is shared is evaluated once.
+        """
+
+        results = {}
+        stack = [(formula, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in results:
+                continue
+            children = self.operands(node)
+            if len(children) == 0:
+                results[id(node)] = self.atom(node)
+            elif expanded:
+                results[id(node)] = self.combine(node, [results[id(i)] for i in children])
+            else:
+                stack.append((node, True))
+                stack.extend((i, False) for i in reversed(children))
+        return results[id(formula)]
+
+    def evaluate(self, formula: Wff):
+        """Return whether a formula without free variables is true in the interpretation."""
+
+        variables, array = self.extension(formula)
+        if len(variables) > 0:
+            raise ValueError(f'The formula "{formula}" has the free variables {", ".join(variables)}.')
+        return bool(array)
+
+    def witnesses(self, formula: Wff, value: bool, limit: int = None):
+        """Return the assignments of elements to variables that give the formula the value.
+
+        For a formula beginning with `ForAll` or `ThereExists` the variables are those it binds
+        and the formula they are tried in is what it quantifies.  Otherwise they are the free
+        variables of the formula.  Each assignment is a dictionary from the names of the
+        variables to elements and they are listed in the order of the domain.
+        """
+
+        if isinstance(formula, (ForAll, ThereExists)):
+            names = tuple(dict.fromkeys(i.name for i in formula.vars))
+            formula = formula.wff
+        else:
+            names = ()
+        variables, array = self.extension(formula)
+        names = names + tuple(i for i in variables if i not in names)
+        array = numpy.broadcast_to(self.expand(variables, array, names), (self.size,) * len(names))
+        found = numpy.argwhere(array == value)
+        if limit is not None:
+            found = found[:limit]
+        elements = self.domain.elements
+        return [{j: elements[k] for j, k in zip(names, i)} for i in found]
+
+    def satisfying(self, formula: Wff, limit: int = None):
+        """Return the assignments that make the formula, or what it quantifies, true."""
+
+        return self.witnesses(formula, True, limit)
+
+    def falsifying(self, formula: Wff, limit: int = None):
+        """Return the assignments that make the formula, or what it quantifies, false."""
+
+        return self.witnesses(formula, False, limit)
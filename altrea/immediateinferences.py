@@ -0,0 +1,236 @@
+# immediateinferences.py
+"""This module draws the immediate inferences of categorical propositions.
+
+An immediate inference takes one proposition to another about the same terms or their
+complements, the complement of a term written with the prefix "non-":
+
+- Conversion swaps the terms of an E or I proposition, and of an A proposition giving an I
+    proposition by limitation.
+- Obversion changes the quality and takes the complement of the predicate term.
+- Contraposition swaps the terms and takes the complement of both for an A or O proposition,
+    and of an E proposition giving an O proposition by limitation.
+
+The square of opposition relates the A, E, I and O propositions with the same terms.  The A
+and O and the E and I propositions are contradictory, so one is true exactly when the other is
+false.  With existential import the A and E propositions are also contrary, so they cannot both
+be true, the I and O propositions subcontrary, so they cannot both be false, and the I and O
+propositions follow from the A and E propositions by subalternation.  Inferences by limitation
+and subalternation also need existential import, which is taken to mean that every term and
+its complement have members.
+
+The terms of a proposition and their complements fill four slots: 0 for the subject term, 1 for
+the predicate term, 2 for the complement of the subject term and 3 for the complement of the
+predicate term.  Since each inference takes one proposition to one other, the propositions
+that follow from a set of propositions are those that follow from each of them.  The
+propositions, as letters and slots, whose truth values follow from a true or false A, E, I or
+O proposition are computed when the module is imported, so the closure of a set of premises
+is found in one pass by a lookup for each premise.
+
+It contains the following:
+- `inference_conversion`, `inference_obversion`, `inference_contraposition` - The names of the inferences.
+- `opposition_contradictory`, `opposition_contrary`, `opposition_subcontrary`,
+    `opposition_subalternation` - The names of the relations of the square of opposition.
+- `inferences` - The letter of the result of each inference and whether it needs existential import.
+- `oppositions` - The relation of the square between each two letters.
+- `closures` - The propositions whose truth values follow from a true or false proposition.
+- `complement(name)` - Return the name of the complement of a term.
+- `categorical(letter, subject, predicate)` - Return the categorical proposition with the letter and terms.
+- `infer(proposition, inference, existentialimport)` - Return the result of an immediate inference or None.
+- `convert(proposition, existentialimport)` - Return the converse of a proposition or None.
+- `obvert(proposition)` - Return the obverse of a proposition.
+- `contrapose(proposition, existentialimport)` - Return the contrapositive of a proposition or None.
+- `opposition(first, second)` - Return the relation of the square between two propositions or None.
+- `closure(premises, existentialimport)` - Return the truth values of the propositions which follow from the premises.
+"""
+
+from altrea.terms import Term
+from altrea.categories import Categorical, All, Some, No, SomeNot
+from altrea.syllogisms import letter
+
+inference_conversion = "Conversion"
+inference_obversion = "Obversion"
+inference_contraposition = "Contraposition"
+
+opposition_contradictory = "Contradictory"
+opposition_contrary = "Contrary"
+opposition_subcontrary = "Subcontrary"
+opposition_subalternation = "Subalternation"
+
+complementprefix = "non-"
+
+classes = {"A": All, "E": No, "I": Some, "O": SomeNot}
+
+# The letter of the result of each inference and whether it needs existential import.
+inferences = {
+    ("A", inference_conversion): ("I", True),
+    ("E", inference_conversion): ("E", False),
+    ("I", inference_conversion): ("I", False),
+    ("A", inference_obversion): ("E", False),
+    ("E", inference_obversion): ("A", False),
+    ("I", inference_obversion): ("O", False),
+    ("O", inference_obversion): ("I", False),
+    ("A", inference_contraposition): ("A", False),
+    ("E", inference_contraposition): ("O", True),
+    ("O", inference_contraposition): ("O", False),
+}
+
+oppositions = {
+    ("A", "O"): opposition_contradictory,
+    ("O", "A"): opposition_contradictory,
+    ("E", "I"): opposition_contradictory,
+    ("I", "E"): opposition_contradictory,
+    ("A", "E"): opposition_contrary,
+    ("E", "A"): opposition_contrary,
+    ("I", "O"): opposition_subcontrary,
+    ("O", "I"): opposition_subcontrary,
+    ("A", "I"): opposition_subalternation,
+    ("I", "A"): opposition_subalternation,
+    ("E", "O"): opposition_subalternation,
+    ("O", "E"): opposition_subalternation,
+}
+
+
+def slots(inference: str, subject: int, predicate: int):
+    """Return the slots of the terms of the result of an inference from those of the proposition.
+
+    The complement of the term in a slot is in the slot given by flipping its second bit.
+    """
+
+    if inference == inference_conversion:
+        return predicate, subject
+    elif inference == inference_obversion:
+        return subject, predicate ^ 2
+    return predicate ^ 2, subject ^ 2
+
+
+def square(letter: str, value: bool, existentialimport: bool):
+    """Return the letters and truth values which follow on the square from a letter and its truth value."""
+
+    result = []
+    for (first, second), relation in oppositions.items():
+        if first != letter:
+            continue
+        if relation == opposition_contradictory:
+            result.append((second, not value))
+        elif not existentialimport:
+            continue
+        elif relation == opposition_contrary and value:
+            result.append((second, False))
+        elif relation == opposition_subcontrary and not value:
+            result.append((second, True))
+        elif relation == opposition_subalternation and value == (first in "AE"):
+            result.append((second, value))
+    return result
+
+
+def buildclosure(start: str, value: bool, existentialimport: bool):
+    """Return the letters, slots and truth values which follow from a proposition with terms in slots 0 and 1."""
+
+    found = {(start, 0, 1): value}
+    todo = [(start, 0, 1)]
+    while todo:
+        key = todo.pop()
+        current, a, b = key
+        truth = found[key]
+        following = [((i, a, b), j) for i, j in square(current, truth, existentialimport)]
+        for (first, inference), (result, limitation) in inferences.items():
+            if first != current or (limitation and not (existentialimport and truth)):
+                continue
+            following.append(((result, *slots(inference, a, b)), truth))
+        for i, j in following:
+            if i not in found:
+                found[i] = j
+                todo.append(i)
+    return tuple((i, a, b, j) for (i, a, b), j in found.items())
+
+
+closures = {
+    (i, j, k): buildclosure(i, j, k) for i in classes for j in (True, False) for k in (False, True)
+}
+
+
+def complement(name: str):
+    """Return the name of the complement of a term, removing the prefix "non-" if it has one."""
+
+    if name.startswith(complementprefix):
+        return name[len(complementprefix):]
+    return "".join([complementprefix, name])
+
+
+def categorical(letter: str, subject: str, predicate: str):
+    """Return the categorical proposition with the letter and the terms with the names."""
+
+    return classes[letter](Term(subject), Term(predicate))
+
+
+def infer(proposition: Categorical, inference: str, existentialimport: bool = False):
+    """Return the proposition which follows from a proposition by an immediate inference, or None if none does."""
+
+    key = (letter(proposition), inference)
+    if key not in inferences:
+        return None
+    result, limitation = inferences[key]
+    if limitation and not existentialimport:
+        return None
+    names = terms(proposition)
+    subject, predicate = slots(inference, 0, 1)
+    return categorical(result, names[subject], names[predicate])
+
+
+def terms(proposition: Categorical):
+    """Return the names of the terms of a proposition and their complements in the order of the slots."""
+
+    subject = proposition.subjectterm.name
+    predicate = proposition.predicateterm.name
+    return (subject, predicate, complement(subject), complement(predicate))
+
+
+def convert(proposition: Categorical, existentialimport: bool = False):
+    """Return the converse of a proposition, or None if it has none."""
+
+    return infer(proposition, inference_conversion, existentialimport)
+
+
+def obvert(proposition: Categorical):
+    """Return the obverse of a proposition."""
+
+    return infer(proposition, inference_obversion)
+
+
+def contrapose(proposition: Categorical, existentialimport: bool = False):
+    """Return the contrapositive of a proposition, or None if it has none."""
+
+    return infer(proposition, inference_contraposition, existentialimport)
+
+
+def opposition(first: Categorical, second: Categorical):
+    """Return the relation of the square of opposition between two propositions.
+
+    The relation is None unless they have the same subject and predicate terms and different
+    letters.
+    """
+
+    if (first.subjectterm.name, first.predicateterm.name) != (second.subjectterm.name, second.predicateterm.name):
+        return None
+    return oppositions.get((letter(first), letter(second)))
+
+
+def closure(premises: list, existentialimport: bool = False, values: dict = None):
+    """Return the truth values of the propositions which follow from the premises by immediate inference.
+
+    A premise is a categorical proposition, taken to be true, or a pair of one and its truth
+    value.  The result is a dictionary from the letter, subject and predicate of each
+    proposition to its truth value, which `categorical` turns back into a proposition.  The
+    values of an earlier closure may be given to be extended.  A proposition which follows as
+    both true and false raises a ValueError.
+    """
+
+    values = {} if values is None else values
+    for premise in premises:
+        proposition, value = premise if isinstance(premise, tuple) else (premise, True)
+        names = terms(proposition)
+        for i, a, b, j in closures[(letter(proposition), value, existentialimport)]:
+            key = (i, names[a], names[b])
+            if values.setdefault(key, j) != j:
+                raise ValueError(f'The proposition "{categorical(*key)}" follows as both true and false.')
+    return values
@@ -0,0 +1,261 @@
+# kripke.py
+"""This module evaluates modal formulas in a Kripke model at every world at once.
+
+A model has worlds numbered from 0, an accessibility relation stored as a square NumPy boolean
+matrix whose entry in row w and column v is True when v is accessible from w, and a valuation
+giving the set of worlds at which each letter is true.  A set of worlds is a boolean vector
+with one entry for each world, so the worlds at which a formula is true are found together.
+`Necessary` and `Possibly` are products of the matrix with such a vector:
+
+- `Possibly(A)` is true at w when some accessible world is in the set of A, which is the
+    matrix times the set of A.
+- `Necessary(A)` is true at w when no accessible world is outside the set of A, which is the
+    complement of the matrix times the complement of the set of A.
+
+`StrictImplies` and `StrictIff` are the necessity of `Implies` and `Iff` and `ConsistentWith`
+is the possibility of `And`.  As in `altrea.truthtables`, formulas are compiled into a program
+in which a subformula that is shared is computed once.
+
+It contains the following:
+- `ModalProgram` - Formulas compiled into operations on sets of worlds.
+- `KripkeModel` - A Kripke model which evaluates formulas at all of its worlds.
+"""
+
+import numpy
+
+from altrea.wffs import (
+    And,
+    Or,
+    Not,
+    Implies,
+    Iff,
+    Necessary,
+    Possibly,
+    Falsehood,
+    Truth,
+    ConsistentWith,
+    StrictIff,
+    StrictImplies,
+    Wff,
+)
+from altrea.truthtables import (
+    letterop,
+    constantop,
+    notop,
+    andop,
+    orop,
+    impliesop,
+    iffop,
+)
+
+necessaryop = 7
+possiblyop = 8
+
+binaryops = {
+    And: (andop, None),
+    ConsistentWith: (andop, possiblyop),
+    Or: (orop, None),
+    Implies: (impliesop, None),
+    StrictImplies: (impliesop, necessaryop),
+    Iff: (iffop, None),
+    StrictIff: (iffop, necessaryop),
+}
+
+
+class ModalProgram:
+    """A list of operations on sets of worlds computing the truth sets of several formulas.
+
+    Each instruction stores its result in the register with the same position.  A strict
+    connective takes two instructions, the connective and then the modality, and the node
+    is given the register of the second.
+
+    Parameters:
+        formulas: The well formed formulas to compile.
+        letters: The letters in the order of the rows of the valuation.
+    """
+
+    def __init__(self, formulas: list, letters: list):
+        self.letters = letters
+        self.positions = {id(j): i for i, j in enumerate(letters)}
+        self.instructions = []
+        self.registers = {}
+        self.outputs = [self.compile(i) for i in formulas]
+
+    def compile(self, formula: Wff):
+        stack = [(formula, False)]
+        while len(stack) > 0:
+            node, expanded = stack.pop()
+            if id(node) in self.registers:
+                continue
+            children = self.operands(node)
+            if expanded or len(children) == 0:
+                self.instructions.extend(self.instruction(node, [self.registers[id(i)] for i in children]))
+                self.registers[id(node)] = len(self.instructions) - 1
+            else:
+                stack.append((node, True))
+                for i in reversed(children):
+                    stack.append((i, False))
+        return self.registers[id(formula)]
+
+    def operands(self, node: Wff):
+        if id(node) in self.positions:
+            return ()
+        elif type(node) in binaryops:
+            return (node.left, node.right)
+        elif isinstance(node, Not):
+            return (node.negated,)
+        elif isinstance(node, (Necessary, Possibly)):
+            return (node.wff,)
+        else:
+            return ()
+
+    def instruction(self, node: Wff, registers: list):
+        """Return the instructions computing the node from the registers of its operands."""
+
+        if id(node) in self.positions:
+            return [(letterop, self.positions[id(node)])]
+        elif type(node) in binaryops:
+            op, modality = binaryops[type(node)]
+            if modality is None:
+                return [(op, registers[0], registers[1])]
+            return [(op, registers[0], registers[1]), (modality, len(self.instructions))]
+        elif isinstance(node, Not):
+            return [(notop, registers[0])]
+        elif isinstance(node, Necessary):
+            return [(necessaryop, registers[0])]
+        elif isinstance(node, Possibly):
+            return [(possiblyop, registers[0])]
+        elif isinstance(node, Truth):
+            return [(constantop, True)]
+        elif isinstance(node, Falsehood):
+            return [(constantop, False)]
+        elif type(node).subformulas == () and hasattr(node, 'name'):
+            raise ValueError(f'The letter "{node}" has no value in the model.')
+        else:
+            raise ValueError(f'The formula "{node}" cannot be evaluated in a Kripke model.')
+
+    def run(self, relation: numpy.ndarray, valuation: numpy.ndarray):
+        """Return the truth sets of the compiled formulas given the relation and the rows of the valuation."""
+
+        worlds = relation.shape[0]
+        values = []
+        for i in self.instructions:
+            op = i[0]
+            if op == letterop:
+                values.append(valuation[i[1]])
+            elif op == constantop:
+                values.append(numpy.full(worlds, i[1]))
+            elif op == notop:
+                values.append(~values[i[1]])
+            elif op == andop:
+                values.append(values[i[1]] & values[i[2]])
+            elif op == orop:
+                values.append(values[i[1]] | values[i[2]])
+            elif op == impliesop:
+                values.append(~values[i[1]] | values[i[2]])
+            elif op == iffop:
+                values.append(values[i[1]] == values[i[2]])
+            elif op == necessaryop:
+                values.append(~(relation @ ~values[i[1]]))
+            else:
+                values.append(relation @ values[i[1]])
+        return [values[i] for i in self.outputs]
+
+
+class KripkeModel:
+    """A Kripke model with its worlds numbered from 0.
+
+    Parameters:
+        relation: A square matrix, or anything NumPy can make one from, whose entry in row w
+            and column v is True when v is accessible from w.
+        valuation: A dictionary from letters to the worlds at which they are true, either as
+            a boolean vector with one entry for each world or as a collection of the numbers of
+            the worlds.
+    """
+
+    def __init__(self, relation, valuation: dict):
+        self.relation = numpy.asarray(relation, dtype=bool)
+        if self.relation.ndim != 2 or self.relation.shape[0] != self.relation.shape[1]:
+            raise ValueError(f'The accessibility relation of shape {self.relation.shape} is not a square matrix.')
+        self.worlds = self.relation.shape[0]
+        self.letters = list(valuation.keys())
+        self.valuation = numpy.zeros((len(self.letters), self.worlds), dtype=bool)
+        for i, letter in enumerate(self.letters):
+            self.valuation[i] = self.truthsetof(valuation[letter])
+
+    def truthsetof(self, worlds):
+        """Return the boolean vector of a set of worlds given as a vector or a collection of numbers."""
+
+        worlds = numpy.asarray(list(worlds) if isinstance(worlds, (set, frozenset)) else worlds)
+        if worlds.dtype == bool:
+            if worlds.shape != (self.worlds,):
+                raise ValueError(f'The set of worlds has {worlds.size} entries instead of {self.worlds}.')
+            return worlds
+        truthset = numpy.zeros(self.worlds, dtype=bool)
+        truthset[worlds.astype(int)] = True
+        return truthset
+
+    def truthsets(self, formulas: list):
+        """Return the boolean vectors of the worlds at which each formula is true."""
+
+        return ModalProgram(formulas, self.letters).run(self.relation, self.valuation)
+
+    def truthset(self, formula: Wff):
+        """Return the boolean vector of the worlds at which the formula is true."""
+
+        return self.truthsets([formula])[0]
+
+    def holds(self, formula: Wff, world: int):
+        """Check whether the formula is true at the world."""
+
+        return bool(self.truthset(formula)[world])
+
+    def valid(self, formula: Wff):
+        """Check whether the formula is true at every world of the model."""
+
+        return bool(self.truthset(formula).all())
+
+    def satisfiable(self, formula: Wff):
+        """Check whether the formula is true at some world of the model."""
+
+        return bool(self.truthset(formula).any())
+
+    def counterexample(self, premises: list, goal: Wff):
+        """Return the first world at which the premises are true and the goal false, or None if there is none."""
+
+        values = self.truthsets(premises + [goal])
+        counterexamples = ~values[-1]
+        for i in values[:-1]:
+            counterexamples &= i
+        found = numpy.flatnonzero(counterexamples)
+        return int(found[0]) if len(found) > 0 else None
+
+    def reflexive(self):
+        """Check whether every world is accessible from itself."""
+
+        return bool(self.relation.diagonal().all())
+
+    def symmetric(self):
+        """Check whether v is accessible from w whenever w is accessible from v."""
+
+        return bool((self.relation == self.relation.T).all())
+
+    def serial(self):
+        """Check whether some world is accessible from every world."""
+
+        return bool(self.relation.any(axis=1).all())
+
+    def composed(self, first: numpy.ndarray, second: numpy.ndarray):
+        """Return the boolean product of two matrices, computed in floating point so it is done by BLAS."""
+
+        return (first.astype(numpy.float32) @ second.astype(numpy.float32)) > 0
+
+    def transitive(self):
+        """Check whether u is accessible from w whenever v is accessible from w and u from v."""
+
+        return not (self.composed(self.relation, self.relation) & ~self.relation).any()
+
+    def euclidean(self):
+        """Check whether u is accessible from v whenever v and u are both accessible from some w."""
+
+        return not (self.composed(self.relation.T, self.relation) & ~self.relation).any()
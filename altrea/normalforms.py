@@ -0,0 +1,336 @@
+# normalforms.py
+"""This module puts well formed formulas into negation, conjunctive and disjunctive normal form.
+
+In negation normal form `Not` is applied only to letters and the only other connectives are
+`And`, `Or`, `Necessary` and `Possibly`.  `Implies` and `Iff` are written with `And`, `Or` and
+`Not`, `StrictImplies` and `StrictIff` as the necessity of `Implies` and `Iff`, and
+`ConsistentWith` as the possibility of `And`.  Negations are moved inward by De Morgan's laws
+and the duality of `Necessary` and `Possibly`, and `Truth` and `Falsehood` are removed from
+every formula that is not itself a constant.  Any other formula, such as a proposition or a
+quantified formula, is a letter.
+
+The conjunctive and disjunctive normal forms are read off the negation normal form, treating a
+`Necessary` or `Possibly` node as a literal.  They are returned as clauses, lists of literals
+whose disjunction is meant, or as terms, lists of literals whose conjunction is meant, and
+`formulafrom` writes them back as a formula.  Distributing `Or` over `And` may give
+exponentially many clauses, so `tseitin` also gives the Tseitin encoding which introduces a
+letter for each `And` and `Or` node and has clauses only linear in the size of the formula.
+
+Since the connectives are interned a subformula that occurs more than once is the same node
+and is converted once.  A `NormalForms` keeps what it has converted, so a batch of formulas
+sharing subformulas is best converted by one instance.
+
+It contains the following:
+- `NormalForms` - A converter which keeps the normal forms of the subformulas it has met.
+- `nnf(formula)` - Return the negation normal form of a formula.
+- `cnf(formula)` - Return the conjunctive normal form of a formula.
+- `dnf(formula)` - Return the disjunctive normal form of a formula.
+- `tseitin(formula)` - Return the clauses of the Tseitin encoding of a formula.
+"""
+
+from altrea.wffs import (
+    And,
+    Or,
+    Not,
+    Implies,
+    Iff,
+    Necessary,
+    Possibly,
+    Falsehood,
+    Truth,
+    ConsistentWith,
+    StrictIff,
+    StrictImplies,
+    Proposition,
+    Wff,
+)
+
+
+class NormalForms:
+    """A converter into normal forms which keeps the forms of the subformulas it has converted.
+
+    `Truth` has no interned default, so the formula written for true is `Not(Falsehood())` unless
+    another is given.  The letters of the Tseitin encoding are propositions named by the prefix
+    and a number, and `definitions` maps each of them to the subformula it stands for.
+    """
+
+    def __init__(self, truth: Wff = None, prefix: str = "τ"):
+        self.falsehood = Falsehood()
+        self.truth = Not(self.falsehood) if truth is None else truth
+        self.prefix = prefix
+        self.nnfs = {}
+        self.clauselists = {}
+        self.termlists = {}
+        self.gates = {}
+        self.definitions = {}
+
+    def conjoin(self, left: Wff, right: Wff):
+        if left is self.falsehood or right is self.falsehood:
+            return self.falsehood
+        elif left is self.truth or left is right:
+            return right
+        elif right is self.truth:
+            return left
+        return And(left, right)
+
+    def disjoin(self, left: Wff, right: Wff):
+        if left is self.truth or right is self.truth:
+            return self.truth
+        elif left is self.falsehood or left is right:
+            return right
+        elif right is self.falsehood:
+            return left
+        return Or(left, right)
+
+    def necessary(self, formula: Wff):
+        return self.truth if formula is self.truth else Necessary(formula)
+
+    def possibly(self, formula: Wff):
+        return self.falsehood if formula is self.falsehood else Possibly(formula)
+
+    def requirements(self, node: Wff, positive: bool):
+        """Return the subformulas and polarities whose negation normal forms the node is written with."""
+
+        if isinstance(node, Not):
+            return [(node.negated, not positive)]
+        elif isinstance(node, (And, Or, ConsistentWith)):
+            return [(node.left, positive), (node.right, positive)]
+        elif isinstance(node, (Implies, StrictImplies)):
+            return [(node.left, not positive), (node.right, positive)]
+        elif isinstance(node, (Iff, StrictIff)):
+            return [(node.left, False), (node.left, True), (node.right, False), (node.right, True)]
+        elif isinstance(node, (Necessary, Possibly)):
+            return [(node.wff, positive)]
+        return []
+
+    def rewrite(self, node: Wff, positive: bool, parts: list):
+        """Return the negation normal form of the node, or of its negation, from those of its subformulas."""
+
+        if isinstance(node, Not):
+            return parts[0]
+        elif isinstance(node, (And, Implies)):
+            join = self.conjoin if positive == isinstance(node, And) else self.disjoin
+            return join(parts[0], parts[1])
+        elif isinstance(node, Or):
+            join = self.disjoin if positive else self.conjoin
+            return join(parts[0], parts[1])
+        elif isinstance(node, ConsistentWith):
+            if positive:
+                return self.possibly(self.conjoin(parts[0], parts[1]))
+            return self.necessary(self.disjoin(parts[0], parts[1]))
+        elif isinstance(node, StrictImplies):
+            if positive:
+                return self.necessary(self.disjoin(parts[0], parts[1]))
+            return self.possibly(self.conjoin(parts[0], parts[1]))
+        elif isinstance(node, (Iff, StrictIff)):
+            negatedleft, left, negatedright, right = parts
+            if positive:
+                both = self.conjoin(self.disjoin(negatedleft, right), self.disjoin(left, negatedright))
+            else:
+                both = self.conjoin(self.disjoin(left, right), self.disjoin(negatedleft, negatedright))
+            if isinstance(node, Iff):
+                return both
+            return self.necessary(both) if positive else self.possibly(both)
+        elif isinstance(node, Necessary):
+            return self.necessary(parts[0]) if positive else self.possibly(parts[0])
+        elif isinstance(node, Possibly):
+            return self.possibly(parts[0]) if positive else self.necessary(parts[0])
+        elif isinstance(node, Falsehood):
+            return self.falsehood if positive else self.truth
+        elif isinstance(node, Truth):
+            return self.truth if positive else self.falsehood
+        return node if positive else Not(node)
+
+    def nnf(self, formula: Wff, positive: bool = True):
+        """Return the negation normal form of the formula, or of its negation if `positive` is False."""
+
+        stack = [(formula, positive, False)]
+        while stack:
+            node, positive, expanded = stack.pop()
+            key = (id(node), positive)
+            if key in self.nnfs:
+                continue
+            needed = self.requirements(node, positive)
+            if expanded or len(needed) == 0:
+                parts = [self.nnfs[(id(i), j)][1] for i, j in needed]
+                self.nnfs[key] = (node, self.rewrite(node, positive, parts))
+            else:
+                stack.append((node, positive, True))
+                stack.extend((i, j, False) for i, j in reversed(needed))
+        return self.nnfs[(id(formula), positive)][1]
+
+    def complement(self, literal: Wff):
+        """Return the literal in negation normal form that is the negation of a literal."""
+
+        return self.nnf(literal, False)
+
+    def merge(self, first: tuple, second: tuple):
+        """Join two clauses or terms, returning None if the result has a literal and its complement."""
+
+        merged = list(first)
+        ids = set(id(i) for i in first)
+        for i in second:
+            if id(i) in ids:
+                continue
+            if id(self.complement(i)) in ids:
+                return None
+            merged.append(i)
+            ids.add(id(i))
+        return tuple(merged)
+
+    def distribute(self, formula: Wff, conjunctive: bool):
+        """Return the clauses of the formula if `conjunctive` is True and its terms if it is False.
+
+        The lists of the `And` and `Or` nodes of the negation normal form are kept, so a shared
+        node is distributed once.  A list is joined to another by concatenation when the node is
+        `And` for clauses or `Or` for terms and by distribution otherwise.
+        """
+
+        lists = self.clauselists if conjunctive else self.termlists
+        joined = And if conjunctive else Or
+        root = self.nnf(formula)
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in lists:
+                continue
+            if isinstance(node, (And, Or)) and not expanded:
+                stack.append((node, True))
+                stack.append((node.right, False))
+                stack.append((node.left, False))
+                continue
+            if node is self.truth:
+                groups = [] if conjunctive else [()]
+            elif node is self.falsehood:
+                groups = [()] if conjunctive else []
+            elif isinstance(node, (And, Or)):
+                left = lists[id(node.left)][1]
+                right = lists[id(node.right)][1]
+                if isinstance(node, joined):
+                    candidates = left + right
+                else:
+                    candidates = [self.merge(i, j) for i in left for j in right]
+                groups = []
+                seen = set()
+                for i in candidates:
+                    if i is None:
+                        continue
+                    key = frozenset(id(j) for j in i)
+                    if key not in seen:
+                        seen.add(key)
+                        groups.append(i)
+            else:
+                groups = [(node,)]
+            lists[id(node)] = (node, groups)
+        return lists[id(root)][1]
+
+    def clauses(self, formula: Wff):
+        """Return the clauses of the conjunctive normal form of the formula as tuples of literals."""
+
+        return self.distribute(formula, True)
+
+    def terms(self, formula: Wff):
+        """Return the terms of the disjunctive normal form of the formula as tuples of literals."""
+
+        return self.distribute(formula, False)
+
+    def formulafrom(self, groups: list, conjunctive: bool = True):
+        """Write clauses, or terms if `conjunctive` is False, as a formula joined from the left."""
+
+        inner, outer = (Or, And) if conjunctive else (And, Or)
+        empty, none = (self.falsehood, self.truth) if conjunctive else (self.truth, self.falsehood)
+        formula = None
+        for group in groups:
+            part = empty if len(group) == 0 else group[0]
+            for i in group[1:]:
+                part = inner(part, i)
+            formula = part if formula is None else outer(formula, part)
+        return none if formula is None else formula
+
+    def cnf(self, formula: Wff):
+        """Return the conjunctive normal form of the formula."""
+
+        return self.formulafrom(self.clauses(formula), True)
+
+    def dnf(self, formula: Wff):
+        """Return the disjunctive normal form of the formula."""
+
+        return self.formulafrom(self.terms(formula), False)
+
+    def gate(self, node: Wff):
+        """Return the letter of an `And` or `Or` node and the clauses making it equivalent to the node.
+
+        The letters of its subformulas must already be known.
+        """
+
+        if id(node) in self.gates:
+            return self.gates[id(node)][1:]
+        letter = Proposition(f"{self.prefix}{len(self.gates) + 1}")
+        left = self.literal(node.left)
+        right = self.literal(node.right)
+        negated = Not(letter)
+        if isinstance(node, And):
+            defining = [(negated, left), (negated, right), (letter, self.complement(left), self.complement(right))]
+        else:
+            defining = [(letter, self.complement(left)), (letter, self.complement(right)), (negated, left, right)]
+        self.gates[id(node)] = (node, letter, defining)
+        self.definitions[letter] = node
+        return letter, defining
+
+    def literal(self, node: Wff):
+        if isinstance(node, (And, Or)):
+            return self.gates[id(node)][1]
+        return node
+
+    def tseitin(self, formula: Wff):
+        """Return the clauses of the Tseitin encoding of the formula.
+
+        The clauses are satisfiable exactly when the formula is and every assignment satisfying
+        them satisfies the formula.  Each `And` and `Or` node of the negation normal form is given
+        a letter with three clauses defining it and the last clause asserts the letter of the
+        root.  A node met in an earlier call keeps its letter and its clauses are given again.
+        """
+
+        root = self.nnf(formula)
+        if root is self.truth:
+            return []
+        elif root is self.falsehood:
+            return [()]
+        result = []
+        seen = set()
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                result.extend(self.gate(node)[1])
+            elif isinstance(node, (And, Or)) and id(node) not in seen:
+                seen.add(id(node))
+                stack.append((node, True))
+                stack.append((node.right, False))
+                stack.append((node.left, False))
+        result.append((self.literal(root),))
+        return result
+
+
+def nnf(formula: Wff):
+    """Return the negation normal form of a formula."""
+
+    return NormalForms().nnf(formula)
+
+
+def cnf(formula: Wff):
+    """Return the conjunctive normal form of a formula."""
+
+    return NormalForms().cnf(formula)
+
+
+def dnf(formula: Wff):
+    """Return the disjunctive normal form of a formula."""
+
+    return NormalForms().dnf(formula)
+
+
+def tseitin(formula: Wff):
+    """Return the clauses of the Tseitin encoding of a formula."""
+
+    return NormalForms().tseitin(formula)
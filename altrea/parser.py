@@ -0,0 +1,270 @@
+# parser.py
+"""This module reads formulas written as text and returns the `altrea.wffs` objects they describe.
+
+Two syntaxes are read, and they can be mixed in the same text:
+- The tree syntax produced by `tree()` such as "Implies(And(A, Not(B)), C)".
+- The infix syntax produced by `__str__` such as "(A & ~B) ⊃ C".  ASCII alternatives such
+    as ">" for implication are also accepted, so "A & ~B > C" is read the same way.
+
+Nothing is passed to `eval`.  The text is read in a single pass by a precedence climbing
+parser and each connective is built directly, so the result is made of interned nodes.  The
+parser keeps its own stack, so it reads formulas nested as deeply as the renderers write.
+
+From the tightest to the loosest the infix connectives are:
+- `~ ¬` Not, `☐ □` Necessary and `◇ ⋄` Possibly, which are prefixes.
+- `=` Identity.
+- `& ∧` And.
+- `| ∨` Or.
+- `⊃ > -> →` Implies and `⊰` StrictImplies, which group to the right.
+- `≡ <> <-> ↔` Iff, `≣` StrictIff and `∘` ConsistentWith.
+The other binary connectives group to the left.  `Falsehood` and `⊥` stand for a falsehood
+and `Truth` and `⊤` for a truth.
+
+It contains the following:
+- `parseformula(text, dictionary)` - Return the formula a text describes.
+- `FormulaParser` - The parser used by `parseformula`.
+"""
+
+import re
+
+from altrea.wffs import (
+    And,
+    ConsistentWith,
+    Falsehood,
+    Identity,
+    Iff,
+    Implies,
+    Necessary,
+    Not,
+    Or,
+    Possibly,
+    Proposition,
+    StrictIff,
+    StrictImplies,
+    Truth,
+)
+
+
+prefixoperators = {
+    "~": Not,
+    "¬": Not,
+    "☐": Necessary,
+    "□": Necessary,
+    "◇": Possibly,
+    "⋄": Possibly,
+}
+
+# Each binary operator is given its class, its precedence and whether it groups to the right.
+binaryoperators = {
+    "=": (Identity, 5, False),
+    "&": (And, 4, False),
+    "∧": (And, 4, False),
+    "|": (Or, 3, False),
+    "∨": (Or, 3, False),
+    "⊃": (Implies, 2, True),
+    ">": (Implies, 2, True),
+    "->": (Implies, 2, True),
+    "→": (Implies, 2, True),
+    "⊰": (StrictImplies, 2, True),
+    "≡": (Iff, 1, False),
+    "<>": (Iff, 1, False),
+    "<->": (Iff, 1, False),
+    "↔": (Iff, 1, False),
+    "≣": (StrictIff, 1, False),
+    "∘": (ConsistentWith, 1, False),
+}
+
+constructors = {
+    "And": And,
+    "ConsistentWith": ConsistentWith,
+    "Falsehood": Falsehood,
+    "Identity": Identity,
+    "Iff": Iff,
+    "Implies": Implies,
+    "Necessary": Necessary,
+    "Not": Not,
+    "Or": Or,
+    "Possibly": Possibly,
+    "StrictIff": StrictIff,
+    "StrictImplies": StrictImplies,
+}
+
+falsehoods = {"Falsehood", "⊥"}
+truths = {"Truth", "⊤"}
+
+operatortokens = sorted(
+    [i for i in list(prefixoperators) + list(binaryoperators) if len(i) > 1], key=len, reverse=True
+)
+
+# A token is a name, one of the operators longer than one character or any other single character.
+tokenpattern = re.compile(
+    "|".join([r"[^\W\d]\w*"] + [re.escape(i) for i in operatortokens] + [r"\S"])
+)
+
+punctuation = {"(", ")", ","}
+
+
+class FormulaParser:
+    """A precedence climbing parser for the tree and infix syntax of formulas.
+
+    The operators, brackets and connective calls still waiting for their operands are kept on
+    an explicit stack rather than in recursive calls, so the depth of a formula is limited only
+    by memory and the text written by `tree()` or `__str__` of any formula can be read back.
+
+    Names that are not connectives are looked up in the dictionary.  A name that is not in the
+    dictionary becomes a new `Proposition` which is added to the dictionary so that the same
+    name always stands for the same object.
+    """
+
+    def __init__(self, dictionary: dict = None):
+        self.dictionary = {} if dictionary is None else dictionary
+
+    def parse(self, text: str):
+        """Return the formula the text describes."""
+
+        self.text = text
+        self.tokens = tokenpattern.findall(text)
+        self.tokens.append(None)
+        self.position = 0
+        self.operands = []
+        self.operators = []
+        tokens = self.tokens
+        expecting = True
+        while True:
+            token = tokens[self.position]
+            if expecting:
+                expecting = self.operand(token)
+            elif token in binaryoperators:
+                connective, precedence, right = binaryoperators[token]
+                self.reduce(precedence if right else precedence - 1)
+                self.operators.append(("binary", connective, precedence))
+                self.position += 1
+                expecting = True
+            elif token == ")" or token == ",":
+                self.reduce(0)
+                opened = self.operators[-1] if self.operators else None
+                if opened is None:
+                    self.error(f'has "{token}" left over')
+                elif token == ",":
+                    if opened[0] != "call":
+                        self.error('expected ")" but found ","')
+                    self.position += 1
+                    expecting = True
+                else:
+                    self.close()
+            elif token is None:
+                self.reduce(0)
+                if self.operators:
+                    self.error('expected ")" but found the end')
+                return self.operands[0]
+            else:
+                self.reduce(0)
+                if self.operators:
+                    self.error(f'expected ")" but found "{token}"')
+                self.error(f'has "{token}" left over')
+
+    def error(self, message: str):
+        raise ValueError(f'The formula "{self.text}" {message} at token {self.position + 1}.')
+
+    def expect(self, value: str):
+        found = self.tokens[self.position]
+        if found != value:
+            self.error(f'expected "{value}" but found ' + ("the end" if found is None else f'"{found}"'))
+        self.position += 1
+
+    def operand(self, token: str):
+        """Read the token where an operand is expected and return whether one is still expected."""
+
+        tokens = self.tokens
+        self.position += 1
+        if token in prefixoperators:
+            self.operators.append(("prefix", prefixoperators[token]))
+            return True
+        elif token == "(":
+            self.operators.append(("group",))
+            return True
+        elif token in falsehoods or token in truths:
+            if tokens[self.position] == "(":
+                self.position += 1
+                self.expect(")")
+            self.push(Falsehood() if token in falsehoods else Truth())
+            return False
+        elif token == ")" and self.operators and self.operators[-1][0] == "call" and self.operators[-1][2] == len(self.operands):
+            self.position -= 1
+            self.close()
+            return False
+        elif token is not None and token not in punctuation and token not in binaryoperators:
+            if token[0].isalpha() or token[0] == "_":
+                if tokens[self.position] == "(":
+                    if token not in constructors:
+                        self.position -= 1
+                        self.error(f'uses "{token}" which is not a connective')
+                    self.position += 1
+                    self.operators.append(("call", token, len(self.operands)))
+                    return True
+                try:
+                    self.push(self.dictionary[token])
+                except KeyError:
+                    letter = Proposition(token)
+                    self.dictionary[token] = letter
+                    self.push(letter)
+                return False
+        self.position -= 1
+        self.error("expected a formula but found " + ("the end" if token is None else f'"{token}"'))
+
+    def push(self, formula):
+        """Push a complete operand after applying the prefix operators waiting for it."""
+
+        operators = self.operators
+        while operators and operators[-1][0] == "prefix":
+            formula = operators.pop()[1](formula)
+        self.operands.append(formula)
+
+    def reduce(self, minimum: int):
+        """Apply the binary operators on the stack whose precedence is above the minimum."""
+
+        operators, operands = self.operators, self.operands
+        while operators and operators[-1][0] == "binary" and operators[-1][2] > minimum:
+            connective = operators.pop()[1]
+            right = operands.pop()
+            left = operands.pop()
+            operands.append(connective(left, right))
+
+    def close(self):
+        """Close the bracket or connective call at the top of the stack at a ")"."""
+
+        opened = self.operators.pop()
+        self.position += 1
+        if opened[0] == "group":
+            self.push(self.operands.pop())
+            return
+        kind, name, start = opened
+        connective = constructors[name]
+        arguments = self.operands[start:]
+        del self.operands[start:]
+        if len(arguments) != len(connective.subformulas):
+            self.position -= 1
+            self.error(f"gives {name} {len(arguments)} arguments instead of {len(connective.subformulas)}")
+        self.push(connective(*arguments))
+
+
+def parseformula(text: str, dictionary: dict = None):
+    """Return the formula described by the text in either the tree or the infix syntax.
+
+    Parameters:
+        text: The formula such as "And(A, Not(B))" or "A & ~B".
+        dictionary: The objects the names stand for such as `Proof.objectdictionary`.  New
+            propositions are added to it for names it does not have.
+
+    Examples:
+        >>> from altrea.parser import parseformula
+        >>> letters = {}
+        >>> parseformula("A & ~B > C", letters).tree()
+        'Implies(And(A, Not(B)), C)'
+        >>> parseformula("Implies(And(A, Not(B)), C)", letters) is parseformula("(A & ~B) ⊃ C", letters)
+        True
+
+    A ValueError is raised if the text cannot be read.
+    """
+
+    return FormulaParser(dictionary).parse(text)
@@ -0,0 +1,261 @@
+# patterns.py
+"""This module compiles the pattern strings of rules, axioms, definitions and saved proofs
+into templates that can be instantiated without formatting strings or calling `eval`.
+
+A pattern such as "ConclusionPremises({1}, [{0}, Implies({0}, {1})])" is parsed once into
+a tree of template nodes.  Instantiating the template with a list of substitutions
+constructs the objects directly, looking up class and object names in a dictionary
+such as `Proof.objectdictionary`.
+
+A template can also be matched against objects, which is how the substitutions for a rule
+are inferred from the lines of a proof its premises refer to.
+
+It contains the following:
+- `Template` - A compiled pattern.
+- `compilepattern(pattern)` - Return the cached template for a pattern string.
+"""
+
+import ast
+import functools
+import re
+
+
+tokenpattern = re.compile(
+    r"""\s*(?:
+        (?P<slot>\{\s*(?P<index>\d+)\s*\})
+        |(?P<name>[^\W\d]\w*)
+        |(?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+        |(?P<number>-?\d+(?:\.\d+)?)
+        |(?P<punctuation>[()\[\],=])
+    )""",
+    re.VERBOSE,
+)
+
+slotnode = 0
+namenode = 1
+callnode = 2
+listnode = 3
+constantnode = 4
+
+
+class Template:
+    """A pattern compiled into a tree of template nodes.
+
+    Each node is a tuple whose first item is its kind:
+    - `(slotnode, index)` - The placeholder `{index}`.
+    - `(namenode, name)` - A name looked up in the dictionary.
+    - `(callnode, name, arguments, keywords)` - A call of the named class or function.
+    - `(listnode, items)` - A list such as the premises of a rule.
+    - `(constantnode, value)` - A string or number.
+    """
+
+    def __init__(self, pattern: str, root: tuple):
+        self.pattern = pattern
+        self.root = root
+        self.slots = self.countslots(root)
+
+    def __str__(self):
+        return self.pattern
+
+    def countslots(self, node: tuple):
+        kind = node[0]
+        if kind == slotnode:
+            return node[1] + 1
+        elif kind == callnode:
+            return max(
+                [self.countslots(i) for i in node[2]] + [self.countslots(i) for i in node[3].values()] + [0]
+            )
+        elif kind == listnode:
+            return max([self.countslots(i) for i in node[1]] + [0])
+        else:
+            return 0
+
+    def instantiate(self, subs: list, dictionary: dict):
+        """Construct the object the pattern describes with `subs[i]` in place of `{i}`.
+
+        An `IndexError` is raised if there are fewer substitutions than placeholders and a
+        `NameError` if a name is not in the dictionary.
+        """
+
+        if len(subs) < self.slots:
+            raise IndexError(f'The pattern "{self.pattern}" requires {self.slots} substitutions.')
+        return self.build(self.root, subs, dictionary)
+
+    def build(self, node: tuple, subs: list, dictionary: dict):
+        kind = node[0]
+        if kind == slotnode:
+            return subs[node[1]]
+        elif kind == callnode:
+            try:
+                function = dictionary[node[1]]
+            except KeyError:
+                raise NameError(f'The name "{node[1]}" is not defined.')
+            arguments = [self.build(i, subs, dictionary) for i in node[2]]
+            if len(node[3]) == 0:
+                return function(*arguments)
+            keywords = {k: self.build(v, subs, dictionary) for k, v in node[3].items()}
+            return function(*arguments, **keywords)
+        elif kind == namenode:
+            try:
+                return dictionary[node[1]]
+            except KeyError:
+                raise NameError(f'The name "{node[1]}" is not defined.')
+        elif kind == listnode:
+            return [self.build(i, subs, dictionary) for i in node[1]]
+        else:
+            return node[1]
+
+    def conclusion(self):
+        """Return the template node of the conclusion of a "ConclusionPremises(conclusion, [premises])" pattern."""
+
+        root = self.root
+        if root[0] != callnode or root[1] != 'ConclusionPremises':
+            return None
+        if len(root[2]) > 0:
+            return root[2][0]
+        return root[3].get('conclusion')
+
+    def premises(self):
+        """Return the template nodes of the premises of a "ConclusionPremises(conclusion, [premises])" pattern."""
+
+        root = self.root
+        if root[0] != callnode or root[1] != 'ConclusionPremises':
+            return ()
+        if len(root[2]) > 1:
+            premises = root[2][1]
+        else:
+            premises = root[3].get('premises', (listnode, ()))
+        if premises[0] != listnode:
+            return ()
+        return premises[1]
+
+    def match(self, node: tuple, value, subs: dict, dictionary: dict):
+        """Check whether the object has the form the template node describes.
+
+        Placeholders that are not yet in `subs` are bound to the part of the object in their place
+        and placeholders that are must be the same object.  The object is walked once alongside
+        the template and nothing is rendered as a string.  A call node matches an interned node of
+        the named class whose arguments match, arguments not written in the pattern taking their
+        defaults.
+        """
+
+        kind = node[0]
+        if kind == slotnode:
+            bound = subs.get(node[1])
+            if bound is None:
+                subs[node[1]] = value
+                return True
+            return bound is value or (hasattr(bound, 'equals') and bound.equals(value))
+        elif kind == callnode:
+            function = dictionary.get(node[1])
+            arguments = getattr(value, 'arguments', None)
+            if function is None or type(value) is not function or arguments is None:
+                return False
+            if len(node[2]) > len(arguments):
+                return False
+            for i in range(len(node[2])):
+                if not self.match(node[2][i], arguments[i], subs, dictionary):
+                    return False
+            for i in range(len(node[2]), len(arguments)):
+                name, default = function.parameters[i]
+                if name in node[3]:
+                    if not self.match(node[3][name], arguments[i], subs, dictionary):
+                        return False
+                elif arguments[i] != default:
+                    return False
+            return True
+        elif kind == namenode:
+            named = dictionary.get(node[1])
+            return named is value or (hasattr(named, 'equals') and named.equals(value))
+        elif kind == listnode:
+            if not isinstance(value, (list, tuple)) or len(value) != len(node[1]):
+                return False
+            return all(self.match(i, j, subs, dictionary) for i, j in zip(node[1], value))
+        else:
+            return type(node[1]) is type(value) and node[1] == value
+
+
+class PatternParser:
+    """A recursive descent parser for the call syntax used by patterns and `tree()` strings."""
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.tokens = self.tokenize(pattern)
+        self.position = 0
+
+    def tokenize(self, pattern: str):
+        tokens = []
+        position = 0
+        end = len(pattern.rstrip())
+        while position < end:
+            match = tokenpattern.match(pattern, position)
+            if match is None or match.end() == position:
+                raise ValueError(f'The pattern "{pattern}" cannot be read at position {position}.')
+            kind = match.lastgroup if match.lastgroup != 'index' else 'slot'
+            tokens.append((kind, match.group(kind), match.group('index')))
+            position = match.end()
+        return tokens
+
+    def peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return (None, None, None)
+
+    def expect(self, value: str):
+        token = self.peek()
+        if token[1] != value:
+            raise ValueError(f'The pattern "{self.pattern}" expected "{value}" but found "{token[1]}".')
+        self.position += 1
+
+    def parse(self):
+        root = self.expression()
+        if self.position != len(self.tokens):
+            raise ValueError(f'The pattern "{self.pattern}" has unexpected text after "{self.tokens[self.position - 1][1]}".')
+        return root
+
+    def expression(self):
+        kind, value, index = self.peek()
+        self.position += 1
+        if kind == 'slot':
+            return (slotnode, int(index))
+        elif kind == 'name':
+            if self.peek()[1] == '(':
+                self.position += 1
+                arguments, keywords = self.arguments(')')
+                return (callnode, value, tuple(arguments), keywords)
+            return (namenode, value)
+        elif kind == 'string':
+            return (constantnode, ast.literal_eval(value))
+        elif kind == 'number':
+            return (constantnode, ast.literal_eval(value))
+        elif value == '[':
+            items, keywords = self.arguments(']')
+            if len(keywords) > 0:
+                raise ValueError(f'The pattern "{self.pattern}" has a keyword inside a list.')
+            return (listnode, tuple(items))
+        else:
+            raise ValueError(f'The pattern "{self.pattern}" has an unexpected "{value}".')
+
+    def arguments(self, closing: str):
+        arguments = []
+        keywords = {}
+        while self.peek()[1] != closing:
+            kind, value, index = self.peek()
+            if kind == 'name' and self.position + 1 < len(self.tokens) and self.tokens[self.position + 1][1] == '=':
+                self.position += 2
+                keywords[value] = self.expression()
+            else:
+                arguments.append(self.expression())
+            if self.peek()[1] == ',':
+                self.position += 1
+            elif self.peek()[1] != closing:
+                raise ValueError(f'The pattern "{self.pattern}" expected "," or "{closing}" but found "{self.peek()[1]}".')
+        self.expect(closing)
+        return arguments, keywords
+
+
+@functools.lru_cache(maxsize=4096)
+def compilepattern(pattern: str):
+    """Return the template for a pattern string, compiling it only the first time it is seen."""
+
+    return Template(pattern, PatternParser(pattern).parse())
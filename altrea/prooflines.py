@@ -0,0 +1,280 @@
+# prooflines.py
+"""This module provides compact storage for the lines of a proof.
+
+A line of a proof used to be a list of nine items reached through the indexes `Proof.statementindex`,
+`Proof.levelindex` and so on.  A `ProofLine` keeps the same nine fields in slots instead of a list
+and codes the rule and line type as integers, since the same few strings repeat on every line.
+Indexing a `ProofLine` with the old indexes still works.
+
+The data saved with a proof was also kept as copies of the lines.  `ProofData` and
+`ProofDataFinal` are views over the lines of the proof built only when they are read.
+
+It contains the following:
+- `Codes` - Integer codes for strings that repeat on many lines.
+- `ProofLine` - A line of a proof.
+- `ProofLines` - The list of lines of a proof.
+- `ProofData` - A view of the lines of a proof in the layout used to save them.
+- `ProofDataFinal` - A view of `ProofData` with the statements written as patterns.
+"""
+
+
+class Codes:
+    """Integer codes for strings, each string being given the next code the first time it is seen."""
+
+    def __init__(self):
+        self.values = []
+        self.codes = {}
+
+    def encode(self, value):
+        try:
+            return self.codes[value]
+        except KeyError:
+            code = len(self.values)
+            self.values.append(value)
+            self.codes[value] = code
+            return code
+        except TypeError:
+            return value
+
+    def decode(self, code):
+        if type(code) is int:
+            return self.values[code]
+        return code
+
+
+rulecodes = Codes()
+typecodes = Codes()
+
+
+class ProofLine:
+    """A line of a proof.
+
+    The fields can be read and written by name or by the indexes of `Proof`:
+    0 statement, 1 level, 2 proofid, 3 rule, 4 lines, 5 proofs, 6 comment, 7 linetype and
+    8 subproofstatus.  The rule and linetype are stored as integer codes.
+    """
+
+    __slots__ = (
+        "statement",
+        "level",
+        "proofid",
+        "rulecode",
+        "lines",
+        "proofs",
+        "comment",
+        "typecode",
+        "subproofstatus",
+    )
+
+    fields = 9
+
+    def __init__(
+        self,
+        statement="",
+        level: int = 0,
+        proofid: int = 0,
+        rule: str = "",
+        lines: str = "",
+        proofs: str = "",
+        comment: str = "",
+        linetype: str = "",
+        subproofstatus: str = "",
+    ):
+        self.statement = statement
+        self.level = level
+        self.proofid = proofid
+        self.rulecode = rulecodes.encode(rule)
+        self.lines = lines
+        self.proofs = proofs
+        self.comment = comment
+        self.typecode = typecodes.encode(linetype)
+        self.subproofstatus = subproofstatus
+
+    @property
+    def rule(self):
+        return rulecodes.decode(self.rulecode)
+
+    @rule.setter
+    def rule(self, value):
+        self.rulecode = rulecodes.encode(value)
+
+    @property
+    def linetype(self):
+        return typecodes.decode(self.typecode)
+
+    @linetype.setter
+    def linetype(self, value):
+        self.typecode = typecodes.encode(value)
+
+    def __len__(self):
+        return self.fields
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.tolist()[index]
+        if index < 0:
+            index += self.fields
+        if index == 0:
+            return self.statement
+        elif index == 1:
+            return self.level
+        elif index == 2:
+            return self.proofid
+        elif index == 3:
+            return rulecodes.decode(self.rulecode)
+        elif index == 4:
+            return self.lines
+        elif index == 5:
+            return self.proofs
+        elif index == 6:
+            return self.comment
+        elif index == 7:
+            return typecodes.decode(self.typecode)
+        elif index == 8:
+            return self.subproofstatus
+        raise IndexError("The index of a proof line must be between 0 and 8.")
+
+    def __setitem__(self, index, value):
+        if index < 0:
+            index += self.fields
+        if index == 0:
+            self.statement = value
+        elif index == 1:
+            self.level = value
+        elif index == 2:
+            self.proofid = value
+        elif index == 3:
+            self.rulecode = rulecodes.encode(value)
+        elif index == 4:
+            self.lines = value
+        elif index == 5:
+            self.proofs = value
+        elif index == 6:
+            self.comment = value
+        elif index == 7:
+            self.typecode = typecodes.encode(value)
+        elif index == 8:
+            self.subproofstatus = value
+        else:
+            raise IndexError("The index of a proof line must be between 0 and 8.")
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __eq__(self, other):
+        try:
+            return self.tolist() == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return repr(self.tolist())
+
+    def tolist(self):
+        return [
+            self.statement,
+            self.level,
+            self.proofid,
+            rulecodes.decode(self.rulecode),
+            self.lines,
+            self.proofs,
+            self.comment,
+            typecodes.decode(self.typecode),
+            self.subproofstatus,
+        ]
+
+
+class ProofLines(list):
+    """The lines of a proof.  A line appended as a list is stored as a `ProofLine`."""
+
+    def __init__(self, lines=()):
+        super().__init__(i if isinstance(i, ProofLine) else ProofLine(*i) for i in lines)
+
+    def append(self, line):
+        if not isinstance(line, ProofLine):
+            line = ProofLine(*line)
+        super().append(line)
+
+
+class ProofData:
+    """A view of the lines of a proof in the layout in which they are saved.
+
+    The first row is the header holding the name, display name and description of the proof
+    followed by its logic once one is set.  Each other row is built when it is read from the
+    line of the proof it records:
+    name, statement, level, proofid, rule, lines, proofs, comment, linetype and subproofstatus.
+    """
+
+    def __init__(self, proof, header: list):
+        self.proof = proof
+        self.header = header
+        self.recorded = []
+
+    def record(self, line: int):
+        """Record the line of the proof with this index as the next row."""
+
+        self.recorded.append(line)
+
+    def row(self, line: int):
+        return [self.proof.name] + self.proof.lines[line].tolist()
+
+    def __len__(self):
+        return len(self.recorded) + 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index == 0:
+            return self.header
+        return self.row(self.recorded[index - 1])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class ProofDataFinal:
+    """A view of `ProofData` with each statement written as a pattern, as the proof is saved.
+
+    The view is empty until `complete` is called.  The first row holds the name, display name,
+    description and logic of the proof followed by the pattern of the proof as a whole.  The rows
+    are built together the first time the view is read since the patterns of the statements share
+    one list of propositions.
+    """
+
+    def __init__(self, proofdata: ProofData):
+        self.proofdata = proofdata
+        self.conclusionpremises = None
+        self.rowcount = 0
+        self.rows = None
+
+    def complete(self, conclusionpremises):
+        """Record the proof as complete with the rows recorded so far."""
+
+        self.conclusionpremises = conclusionpremises
+        self.rowcount = len(self.proofdata)
+        self.rows = None
+
+    def build(self):
+        if self.rows is None:
+            self.rows = []
+            if self.conclusionpremises is not None:
+                propositionlist = []
+                header = self.proofdata[0]
+                self.rows.append(header[0:4] + [self.conclusionpremises.pattern(propositionlist)])
+                for i in range(1, self.rowcount):
+                    row = self.proofdata[i]
+                    row[1] = row[1].pattern(propositionlist)
+                    self.rows.append(row)
+        return self.rows
+
+    def __len__(self):
+        return len(self.build())
+
+    def __getitem__(self, index):
+        return self.build()[index]
+
+    def __iter__(self):
+        return iter(self.build())
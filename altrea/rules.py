@@ -41,6 +41,7 @@ AltRea uses the following.
 
 - `python` - This is for general processing.
 - `pandas` - This is for displaying proofs and other displays.
+- `numpy` - This is for evaluating truth tables.
 - `sqlite3` - This is for storing and retrieving proofs.
 
 Anyone finding an issue with the code, whether a python programmer, a user or a logician
@@ -56,6 +57,8 @@ Examples:
     >>> import myaltrea.rules
 """
 
+import itertools
+import numpy
 import pandas
 from datetime import date
 import IPython.display
@@ -90,10 +93,47 @@ from altrea.wffs import (
     Couple,
     Identity,
     Relation,
+    postorder,
 )
+from altrea.patterns import compilepattern
+from altrea.tables import RuleTable
+from altrea.discrimination import DiscriminationTree
+from altrea.prooflines import ProofLines, ProofData, ProofDataFinal
+import altrea.bdd
+import altrea.finitemodels
+import altrea.sat
+import altrea.search
+import altrea.tableau
+import altrea.truthtables
 import altrea.data
 
 
+class LogMessage:
+    """A log message whose text is built the first time it is read.
+
+    Messages that render formulas are logged this way so that the renderings are only made
+    when the log is displayed or printed as it is collected.
+    """
+
+    __slots__ = ("build", "text")
+
+    def __init__(self, build):
+        self.build = build
+        self.text = None
+
+    def __str__(self):
+        if self.text is None:
+            self.text = self.build()
+            self.build = None
+        return self.text
+
+    def __format__(self, spec: str):
+        return format(str(self), spec)
+
+    def startswith(self, prefix: str):
+        return str(self).startswith(prefix)
+
+
 class Proof:
     """
     This class contains methods to construct and verify proofs in
@@ -142,6 +182,7 @@ class Proof:
     color_conclusion = "\\color{blue}"
 
     addhypothesis_name = "Add Hypothesis"
+    autoprove_name = "Auto Prove"
     axiom_name = "Axiom"
     binaryconnective_name = "Binary Connective"
     closestrictsubproof_name = "Close Strict Subproof"
@@ -205,6 +246,8 @@ class Proof:
 
     # This set of strings provides information for stopped messages and their associated logging.
 
+    stopped_cannotinfersubs = "The substitutions cannot be inferred from the referenced lines."
+    log_cannotinfersubs = '{0}: The metavariables {1} of "{2}" are not in a premise so they cannot be inferred from the lines.'
     stopped_closemainproof = "The main proof cannot be closed only completed."
     log_closemainproof = "{0}: The main proof cannot be closed only completed."
     stopped_closewrongsubproof = "Attempting to close a subproof that is not open."
@@ -310,6 +353,8 @@ class Proof:
 
     """Strings to log messages upon successful completion of tasks."""
 
+    log_autoprove = '{0}: A derivation of "{1}" was found at depth {2} after searching {3} goals.'
+    log_autoprovefailed = '{0}: No derivation of "{1}" was found within depth {2}, {3} goals and {4} seconds.'
     log_axiom = '{0}: Item "{1}" has been added through the "{2}" axiom.'
     log_axiomalreadyexists = '{0}: An axiom with the name "{1}" already exists.'
     log_axiomnotfound = '{0}: An axiom with the name "{1}" was not found.'
@@ -482,6 +527,12 @@ class Proof:
     linetype_substitution = "SUB"
     linetype_transformationrule = "TR"
 
+    """The following tags name the methods that can decide the validity of an argument."""
+
+    method_truthtable = "truthtable"
+    method_sat = "sat"
+    method_bdd = "bdd"
+
     rule_naturaldeduction = "Natural Deducation"
     rule_categorical = "Categorical"
     rule_axiomatic = "Axiomatic"
@@ -591,7 +642,7 @@ class Proof:
             # ("\\backsimeq ", "Modal Strict Coimplication"),
             # ("\\circ ", "Modal Consistent With"),
         ]
-        self.logicrules = [
+        self.logicrules = RuleTable([
             (
                 "coimp elim", 
                 "ConclusionPremises(And(Implies({0}, {1}), Implies({1}, {0})), [Iff({0}, {1})])", 
@@ -764,8 +815,8 @@ class Proof:
                 "De Morgan",
                 "De Morgan Not-Or To And",
             ),
-        ]
-        self.logicaxiomsunrestricted = [
+        ])
+        self.logicaxiomsunrestricted = RuleTable([
             (
                 "explosion",
                 "ConclusionPremises({1}, [{0}, Not({0})])",
@@ -838,8 +889,8 @@ class Proof:
                 "Modus Ponens",
                 "Given A and A > B Derive B",
             ),
-        ]
-        self.logicaxioms = [
+        ])
+        self.logicaxioms = RuleTable([
             (
                 "id intro", 
                 "ConclusionPremises(Identity({0}, {0}), [])", 
@@ -852,8 +903,8 @@ class Proof:
                 "id LEM", 
                 "Excluded Middle Identity"
             ),
-        ]
-        self.logicdefinitionsunrestricted = [
+        ])
+        self.logicdefinitionsunrestricted = RuleTable([
             (
                 "iff intro",
                 "ConclusionPremises(Iff({0}, {1}), [And(Implies({0}, {1}), Implies({1}, {0}))])",
@@ -866,10 +917,15 @@ class Proof:
                 "\\equiv E",
                 "Coimplication Elimination",
             ),
-        ]
-        self.logicdefinitions = []
+        ])
+        self.logicdefinitions = RuleTable()
         self.logiclemmas = []
-        self.lines = [["", 0, 0, "", "", "", "", "", ""]]
+        self.premisetree = None
+        self.premisetreesignature = None
+        self.linecandidates = {}
+        self.bdd = None
+        self.tableaus = {}
+        self.lines = ProofLines([["", 0, 0, "", "", "", "", "", ""]])
         self.previousproofchain = []
         self.previousproofid = -1
         self.currentproof = [1]
@@ -878,8 +934,8 @@ class Proof:
         self.subproof_status = self.subproof_normal
         self.subproofavailable = self.subproofavailable_not
         self.subproofchain = ""
-        self.proofdata = [[self.name, self.displayname, self.description]]
-        self.proofdatafinal = []
+        self.proofdata = ProofData(self, [self.name, self.displayname, self.description])
+        self.proofdatafinal = ProofDataFinal(self.proofdata)
         self.prooflist = [
             [
                 self.lowestlevel,
@@ -995,56 +1051,18 @@ class Proof:
     """
 
     def appendproofdata(self, statement: Wff):
-        """Append a list representing a line of the proof which will be used to save the proof
-        lines as a string.
+        """Record the last line of the proof as a line to be saved.
+
+        The line is not copied.  `self.proofdata` and `self.proofdatafinal` are views that build
+        the rows to be saved from the lines of the proof when they are read.
         """
 
         length = len(self.lines) - 1
-        self.proofdata.append(
-            [
-                self.name,
-                statement,
-                self.lines[length][self.levelindex],
-                self.lines[length][self.proofidindex],
-                self.lines[length][self.ruleindex],
-                self.lines[length][self.linesindex],
-                self.lines[length][self.proofsindex],
-                self.lines[length][self.commentindex],
-                self.lines[length][self.typeindex],
-                self.lines[length][self.subproofstatusindex],
-            ]
-        )
+        self.proofdata.record(length)
         if type(statement) == Necessary:
             self.necessarylines.append(length)
         if self.status == self.complete:
-            finalresult = self.buildconclusionpremises()
-            propositionlist = []
-            self.proofdatafinal.append(
-                [
-                    self.proofdata[0][self.proofdata_nameindex],
-                    self.proofdata[0][self.proofdata_statementindex],
-                    self.proofdata[0][self.proofdata_levelindex],
-                    self.proofdata[0][self.proofdata_proofidindex],
-                    finalresult.pattern(propositionlist),
-                ]
-            )
-            for i in range(len(self.proofdata)):
-                if i > 0:
-                    self.proofdatafinal.append(
-                        [
-                            self.proofdata[i][self.proofdata_nameindex],
-                            self.proofdata[i][self.proofdata_statementindex].pattern(propositionlist),
-                            self.proofdata[i][self.proofdata_levelindex],
-                            self.proofdata[i][self.proofdata_proofidindex],
-                            self.proofdata[i][self.proofdata_ruleindex],
-                            self.proofdata[i][self.proofdata_linesindex],
-                            self.proofdata[i][self.proofdata_proofsindex],
-                            self.proofdata[i][self.proofdata_commentindex],
-                            self.proofdata[i][self.proofdata_typeindex],
-                            self.proofdata[i][self.proofdata_subproofstatusindex],
-                        ]
-                    )
-
+            self.proofdatafinal.complete(self.buildconclusionpremises())
 
     def buildconclusionpremises(self):
         """Saved proofs, definitions and axioms are used as ConclusionPremises objects.
@@ -1077,7 +1095,7 @@ class Proof:
         lines = []
         for i in lineslist:
             if self.goodline(i, caller, displayname, comment):
-                p.append(self.item(i).tree())
+                p.append(self.item(i))
                 lines.append(i)
             else:
                 break
@@ -1100,7 +1118,7 @@ class Proof:
         matchpremiselist: list = [],
     ):
         if len(premiselist) > 0:
-            premises = [i.tree() for i in premiselist]
+            premises = premiselist
             if len(premises) != len(matchpremiselist):
                 self.logstep(self.log_premiseslengthsdontmatch.format(caller.upper(), len(premises), len(matchpremiselist)))
                 self.stopproof(
@@ -1113,8 +1131,8 @@ class Proof:
                 )
             else:
                 for i in range(len(premises)):
-                    if premises[i] != matchpremiselist[i]:
-                        self.logstep(self.log_premisesdontmatch.format(caller.upper(), premises[i]))
+                    if not premises[i].equals(matchpremiselist[i]):
+                        self.logstep(self.log_premisesdontmatch.format(caller.upper(), premises[i].tree()))
                         self.stopproof(
                             self.stopped_premisesdontmatch,
                             self.blankstatement,
@@ -1125,6 +1143,297 @@ class Proof:
                         )
                         break
 
+    def infersubs(
+        self,
+        caller: str,
+        displayname: str,
+        comment: str,
+        pattern: str,
+        matchpremiselist: list,
+        template=None,
+    ):
+        """Return the substitutions that make the premises of a pattern match the referenced lines.
+
+        This is used by `rule`, `axiom`, `definition` and `lemma` when they are given an empty list of
+        substitutions.  Each premise of the compiled pattern is matched against the item on its line in
+        one walk, binding each placeholder to the part of the item in its place.  The proof is stopped
+        if the number of premises differs from the number of lines, if a premise does not match its
+        line or if a placeholder only occurs in the conclusion.
+        """
+
+        if template is None:
+            template = compilepattern(pattern)
+        premises = template.premises()
+        if len(premises) != len(matchpremiselist):
+            self.logstep(self.log_premiseslengthsdontmatch.format(caller.upper(), len(premises), len(matchpremiselist)))
+            self.stopproof(
+                self.stopped_premiseslengthsdontmatch,
+                self.blankstatement,
+                displayname,
+                "",
+                "",
+                comment,
+            )
+            return []
+        subs = {}
+        for i in range(len(premises)):
+            if not template.match(premises[i], matchpremiselist[i], subs, self.objectdictionary):
+                self.logstep(self.log_premisesdontmatch.format(caller.upper(), matchpremiselist[i].tree()))
+                self.stopproof(
+                    self.stopped_premisesdontmatch,
+                    self.blankstatement,
+                    displayname,
+                    "",
+                    "",
+                    comment,
+                )
+                return []
+        missing = [i for i in range(template.slots) if i not in subs]
+        if len(missing) > 0:
+            self.logstep(
+                self.log_cannotinfersubs.format(
+                    caller.upper(), ", ".join(["".join(["{", str(i), "}"]) for i in missing]), pattern
+                )
+            )
+            self.stopproof(
+                self.stopped_cannotinfersubs,
+                self.blankstatement,
+                displayname,
+                "",
+                "",
+                comment,
+            )
+            return []
+        return [subs[i] for i in range(template.slots)]
+
+    def premisetables(self):
+        """Return the rules, axioms, definitions and saved proofs of the logic with the name of the method using each."""
+
+        return [
+            (self.rule_name, self.logicrules),
+            (self.axiom_name, self.logicaxioms),
+            (self.definition_name, self.logicdefinitions),
+            (self.lemma_name, self.logiclemmas),
+        ]
+
+    def premiseindex(self):
+        """Return the discrimination tree of the premises of the rules, axioms, definitions and saved proofs.
+
+        The tree is built the first time it is needed and again only when one of the tables changes.
+        The value stored for each premise is the kind, the name and the position of the premise.
+        """
+
+        tables = self.premisetables()
+        signature = tuple((id(table), len(table), getattr(table, "version", 0)) for kind, table in tables)
+        if self.premisetree is None or signature != self.premisetreesignature:
+            tree = DiscriminationTree()
+            for kind, table in tables:
+                names = set()
+                for row in table:
+                    if row[0] in names:
+                        continue
+                    names.add(row[0])
+                    try:
+                        premises = compilepattern(row[1]).premises()
+                    except ValueError:
+                        continue
+                    for position in range(len(premises)):
+                        tree.insert(premises[position], (kind, row[0], position))
+            self.premisetree = tree
+            self.premisetreesignature = signature
+            self.linecandidates = {}
+        return self.premisetree
+
+    def applicablerules(self):
+        """Return the rules, axioms, definitions and saved proofs that can be used on the lines in scope.
+
+        Each entry is a list `[kind, name, lines, subs]`.  The kind is `rule_name`, `axiom_name`,
+        `definition_name` or `lemma_name`, whose lower case is the name of the method to call.  The
+        lines match the premises in order and the substitutions are those the premises give.  A
+        metavariable which only occurs in the conclusion, as in disjunction introduction, has the
+        substitution None and has to be supplied by the caller.  Entries without premises are not
+        listed since they do not depend on the lines.
+
+        The premises are indexed by a discrimination tree so that each line is only matched against
+        the premises having its shape.  The premises each line may match are kept, so as lines are
+        added only the new ones are looked up.
+
+        Examples:
+            >>> from altrea.wffs import And, Implies
+            >>> from altrea.rules import Proof
+            >>> prf = Proof()
+            >>> A = prf.proposition("A")
+            >>> B = prf.proposition("B")
+            >>> prf.setlogic()
+            >>> prf.goal(B)
+            >>> prf.premise(A)
+            >>> prf.premise(Implies(A, B))
+            >>> [i[3] for i in prf.applicablerules() if i[1] == "imp elim"] == [[A, B]]
+            True
+        """
+
+        tree = self.premiseindex()
+        candidates = {}
+        for line in range(1, len(self.lines)):
+            if self.lines[line][self.proofidindex] != self.currentproofid:
+                continue
+            statement = self.lines[line][self.statementindex]
+            cached = self.linecandidates.get(line)
+            if cached is None or cached[0] is not statement:
+                found = tree.candidates(statement) if isinstance(statement, Wff) else []
+                cached = self.linecandidates[line] = (statement, found)
+            for i in cached[1]:
+                candidates.setdefault(i, []).append(line)
+        applicable = []
+        for kind, table in self.premisetables():
+            names = set()
+            for row in table:
+                if row[0] in names:
+                    continue
+                names.add(row[0])
+                try:
+                    template = compilepattern(row[1])
+                except ValueError:
+                    continue
+                premises = template.premises()
+                if len(premises) == 0:
+                    continue
+                pools = [candidates.get((kind, row[0], i), []) for i in range(len(premises))]
+                for lines in itertools.product(*pools):
+                    subs = {}
+                    if all(
+                        template.match(premises[i], self.item(lines[i]), subs, self.objectdictionary)
+                        for i in range(len(premises))
+                    ):
+                        applicable.append([kind, row[0], list(lines), [subs.get(i) for i in range(template.slots)]])
+        return applicable
+
+    def autoprove(
+        self,
+        goal: Wff = None,
+        maxdepth: int = 10,
+        maxnodes: int = 100000,
+        timeout: float = 10.0,
+        processes: int = 1,
+    ):
+        """Search for a derivation of the goals and, if one is found, add it to the proof.
+
+        The search in `altrea.search` chains forward through the rules, axioms, definitions and saved
+        proofs of the logic and works backward from the goal, proving an implication by a subproof
+        whose hypothesis is its antecedent.  It deepens one step at a time up to `maxdepth` and gives
+        up once it has searched `maxnodes` goals or taken `timeout` seconds.  A derivation that is
+        found is entered through `opensubproof`, `hypothesis`, `reiterate`, `closesubproof`,
+        `implication_intro`, `rule`, `axiom`, `definition` and `lemma` as if by hand, so it has the
+        same lines and `proofcode` and can be saved with `saveproof`.
+
+        With more than one process the backward steps from each goal are divided among a pool of
+        processes which share the goals they close and stop as soon as one of them finds a derivation.
+
+        Parameters:
+            goal: The statement to derive in the current subproof.  If it is None the goals of the
+                proof not yet derived are used.
+            maxdepth: The deepest the backward search may go.
+            maxnodes: The number of goals that may be searched.
+            timeout: The number of seconds the search may take for each goal.
+            processes: The number of processes to search with.
+
+        Returns:
+            True if every goal was derived and False otherwise.
+
+        Examples:
+            >>> from altrea.wffs import And, Implies
+            >>> from altrea.rules import Proof
+            >>> prf = Proof()
+            >>> A = prf.proposition("A")
+            >>> B = prf.proposition("B")
+            >>> C = prf.proposition("C")
+            >>> prf.setlogic()
+            >>> prf.goal(Implies(A, C))
+            >>> prf.premise(Implies(A, B))
+            >>> prf.premise(Implies(B, C))
+            >>> prf.autoprove()
+            True
+            >>> prf.status
+            'COMPLETE'
+        """
+
+        if goal is None:
+            goals = [i for i in self.goalswff if not any(i.equals(j) for j in self.derivedgoalswff)]
+        else:
+            goals = [goal]
+        if processes > 1:
+            search = altrea.search.ParallelSearch(
+                self.premisetables(), self.objectdictionary, maxdepth, maxnodes, timeout, processes
+            )
+        else:
+            search = altrea.search.Search(
+                self.premisetables(), self.objectdictionary, maxdepth, maxnodes, timeout
+            )
+        for i in goals:
+            if not self.canproceed():
+                break
+            scopes = self.availablelines()
+            nodes = search.nodes
+            derivation = search.prove(list(itertools.chain.from_iterable(scopes)), i)
+            if derivation is None:
+                self.logstep(
+                    self.log_autoprovefailed.format(
+                        self.autoprove_name.upper(), i, search.depth, search.nodes - nodes, timeout
+                    )
+                )
+                return False
+            self.logstep(
+                self.log_autoprove.format(
+                    self.autoprove_name.upper(), i, search.depth, search.nodes - nodes
+                )
+            )
+            self.enterderivation(derivation, scopes)
+        return self.status != self.stopped
+
+    def availablelines(self):
+        """Return for the main proof and each open subproof down to the current one a dictionary
+        from each statement that may be used in the current subproof to its first line.
+        """
+
+        chain = self.previousproofchain + [self.currentproofid]
+        scopes = [{} for i in chain]
+        for line in range(1, len(self.lines)):
+            proofid = self.lines[line][self.proofidindex]
+            statement = self.lines[line][self.statementindex]
+            if proofid in chain and isinstance(statement, Wff):
+                scopes[chain.index(proofid)].setdefault(statement, line)
+        return scopes
+
+    def enterderivation(self, derivation: tuple, scopes: list):
+        """Enter the lines of a derivation from `altrea.search` and return the line of the statement it derives.
+
+        The scopes are the dictionaries from `availablelines` and are updated with the lines entered.
+        A statement in an enclosing subproof is reiterated into the current one before it is used.
+        """
+
+        statement = derivation[-1]
+        if statement in scopes[-1]:
+            return scopes[-1][statement]
+        for scope in reversed(scopes[:-1]):
+            if statement in scope:
+                self.reiterate(scope[statement])
+                scopes[-1][statement] = len(self.lines) - 1
+                return scopes[-1][statement]
+        if derivation[0] == "apply":
+            lines = [self.enterderivation(i, scopes) for i in derivation[4]]
+            if self.canproceed():
+                getattr(self, derivation[1].lower())(derivation[2], derivation[3], lines)
+        elif derivation[0] == "assume":
+            self.opensubproof()
+            self.hypothesis(derivation[1])
+            scopes.append({derivation[1]: len(self.lines) - 1})
+            self.enterderivation(derivation[2], scopes)
+            scopes.pop()
+            self.closesubproof()
+            self.implication_intro()
+        scopes[-1][statement] = len(self.lines) - 1
+        return scopes[-1][statement]
+
     def checksubs(self, caller: str, displayname: str, comment: str, subslist: list):
         s = []
         for i in subslist:
@@ -1499,8 +1808,8 @@ class Proof:
                 self.status = self.vacuous
                 newcomment = self.vacuous
                 self.logstep(self.log_vacuous)
-            elif str(statement) in self.goals:
-                if str(statement) not in self.derivedgoals:
+            elif any(i.equals(statement) for i in self.goalswff):
+                if not any(i.equals(statement) for i in self.derivedgoalswff):
                     self.derivedgoals.append(str(statement))
                     self.derivedgoalswff.append(statement)
                     if len(self.derivedgoals) < len(self.goals):
@@ -1514,7 +1823,9 @@ class Proof:
                         self.consequences.append(statement)
                         self.logstep(self.log_complete)
             for i in self.goalswff:
-                if str(Not(statement)) == str(i) or str(statement) == str(Not(i)):
+                if (isinstance(statement, Not) and statement.negated.equals(i)) or (
+                    isinstance(i, Not) and i.negated.equals(statement)
+                ):
                     self.status = self.contradicted
                     newcomment = self.contradicted
                     self.logstep(self.log_contradicted.format(statement, i))
@@ -1695,7 +2006,8 @@ class Proof:
 
     def logstep(self, message: str):
         """This function adds a log message collected during the proof construction
-        so it can be displayed later or in an ongoing manner.
+        so it can be displayed later or in an ongoing manner.  The message may be a
+        `LogMessage` whose text is only built when it is displayed.
         """
 
         self.log.append([message, len(self.lines)])
@@ -1891,8 +2203,7 @@ class Proof:
             # Log code
             self.proofcode.append(f'{self.proofcodevariable}.identity_elim({wff}, {first}, {second}, {line})')
 
-            replaced = wff.tree().replace(first.tree(), second.tree(), 1)
-            evaluated = eval(replaced, self.objectdictionary)
+            evaluated = wff.replace(first, second)
 
             #self.premises.append(premise)
             #nextline = len(self.lines)
@@ -1915,59 +2226,53 @@ class Proof:
             self.appendproofdata(evaluated)
 
 
-    def substitute(self, originalstring: str, subs: list, displayname: str):
-        """Substitute placeholders for strings representing the desired objects.  Then eval (evaluate) the resulting
-        string to return the desired objects.
+    def substitute(self, originalstring: str, subs: list, displayname: str, template=None):
+        """Substitute objects for the placeholders in a pattern string and return the object the
+        pattern describes.
 
         Although this function is not called directly by the user, how this is done is a key component of a logic.
-        AltRea uses the Python string function `format` to do the substitution on an arbitrary number of objects (*subs)
-        which will replace the placeholders in the string (originalstring).
+        The pattern string (originalstring) is compiled once by `altrea.patterns.compilepattern` into a
+        template tree.  The template is then instantiated by constructing the objects it names directly
+        with the substitutions (subs) in place of the placeholders.  No string is formatted and
+        nothing is passed to `eval`.
 
-        This generates a list of strings that is different that what the strings of the objects would normally
-        be printed as.  For example, if the object is And(A, B) then str(And(A, B)) would be "A & B".  However,
-        And(A, B).tree() would be "And(A, B)".  If the originalstring is "{0}" then {0} would be substitued
-        with "And(A, B)" using the print format function.
-
-        The self.objectdirectory dictionary knows what And, A and B are allowing the string "And(A, B)" to be evaluated
-        as And(A, B) with all of its properties.
+        The self.objectdictionary dictionary knows what the names in the pattern such as And, A and B are
+        allowing the template "And({0}, B)" to be built as And(A, B) with all of its properties when
+        A is the first substitution.
 
         Parameters:
             originalstring: The original string with the placeholders.
-            *subs: An arbitrarily long list of objects, not strings.  The calling function makes sure these are all objects.
-                This function converts those objects into a special form of string that can be evaluated to
-                return objects to the caller.
+            subs: A list of objects, not strings.  The calling function makes sure these are all objects.
+                The object in position i replaces the placeholder {i}.
+            displayname: The name of the rule used if the proof has to be stopped.
+            template: The template already compiled from the original string, if the caller has it.
 
         Examples:
             Let the original string be "{0}" containing only the placeholder {0}.  Let the first subs arguemnt
-            be the object And(A, B).  Then And(A, B).tree() becomes the string "And(A, B)".  This is handed
-            to the Python string format function which does the substitution returning "And(A, B)".  That is then
-            evaluated using a dictionary of objects that has been constructed as the objects were defined.
-            Both A and B are in this dictionary along with And and the other named objects of the proof.
-            The eval function takes the string "And(A, B)" and useds the dictionary to return And(A, B).
+            be the object And(A, B).  The template for "{0}" is a single placeholder so the object
+            And(A, B) itself is returned.
 
             As a more complicated example suppose the original string is "And({0}, {1})".  The subs contain A and B
-            in that order.  Then A.tree() becomes "A" and B.tree() becomes "B".  These are substituted into the
-            originalstring by the string format function to produce "And(A, B)" where the "A" replaced "{0}"
-            and the "B" replaced "{1}".  The eval function took this string and using the dictionary of
-            objects returned not the string "And(A, B)" but the object And(A, B).
+            in that order.  The template is a call of And with the placeholders {0} and {1} as its arguments.
+            Instantiating it looks up And in the dictionary and returns And(A, B).
 
         See Also:
-            In altrea.wffs.Wff the tree() function is defined for each object instantiated.  When And(A, B).tree()
-            is called it returns "And("+A.tree()+", "+B.tree()+")" which in turn returns since A.tree() = "A" and
-            B.tree() = "B" the string that is ultimately returned is "And(A, B)".
+            - `altrea.patterns.compilepattern`
         """
 
         if len(subs) > 0:
-            prep = [i.tree() for i in subs]
+            if template is None:
+                template = compilepattern(originalstring)
             try:
-                substitutedstring = originalstring.format(*prep)
-                reconstructedobject = eval(substitutedstring, self.objectdictionary)
+                reconstructedobject = template.instantiate(subs, self.objectdictionary)
                 self.logstep(
-                    self.log_substitute.format(
-                        self.substitute_name.upper(),
-                        originalstring,
-                        prep,
-                        substitutedstring,
+                    LogMessage(
+                        lambda subs=list(subs): self.log_substitute.format(
+                            self.substitute_name.upper(),
+                            originalstring,
+                            [i.tree() for i in subs],
+                            reconstructedobject.tree(),
+                        )
                     )
                 )
                 return reconstructedobject
@@ -2008,8 +2313,8 @@ class Proof:
 
 
     def metasubstitute(self, pattern: str):
-        substitutedstring = pattern.format(*self.metaletters)
-        reconstructedobject = eval(substitutedstring, self.metaobjectdictionary)
+        metavariables = [self.metaobjectdictionary[i] for i in self.metaletters]
+        reconstructedobject = compilepattern(pattern).instantiate(metavariables, self.metaobjectdictionary)
         return reconstructedobject
 
     def axioms(self, latex: bool = True, html: bool = True):
@@ -2770,25 +3075,35 @@ class Proof:
             self.logicaxioms = self.logicaxiomsunrestricted
             self.logicdefinitions = self.logicdefinitionsunrestricted
         elif self.logic == "" and self.restricted:
-            self.logicaxioms = []
-            self.logicdefinitions = []
+            self.logicaxioms = RuleTable()
+            self.logicdefinitions = RuleTable()
         self.logstep(
             self.log_restricted.format(self.restricted_name.upper(), booleanvalue)
         )
 
 
-    def truthtable(self, latex: bool = True, useint: bool = False):
+    def truthtable(self, latex: bool = True, useint: bool = False, verdict: bool = False):
         """Display a truth table built from the premises and goal of the proof.
 
+        The premises and goal are compiled into array operations by `altrea.truthtables`
+        and evaluated over all of the rows at once, a chunk of rows at a time.
+
+        Parameters:
+            latex: Display the column headings and marks in LaTeX.
+            useint: Display the truth values as 1 and 0 rather than True and False.
+            verdict: Return only the status from the summary row, such as "Valid" or
+                "Invalid", without building the table.
+
         Examples:
 
         """
 
-        def flip(v: bool):
-            if v:
-                return False
-            else:
-                return True
+        # Required conclusion
+        goals = self.joinedgoals()
+        letters = [i[0] for i in self.letters]
+
+        if verdict:
+            return self.truthtablestatus(*altrea.truthtables.summarize(self.premises, goals, letters))
 
         columns = []
 
@@ -2825,100 +3140,64 @@ class Proof:
             columns.append("|=")
 
         # Required conclusion
-        if len(self.goalswff) > 0:
-            goals = self.goalswff[0]
-            if len(self.goalswff) > 1:
-                for i in range(len(self.goalswff)):
-                    if i > 0:
-                        goals = And(goals, self.goalswff[i])
-            if latex:
-                columns.append("".join(["$", goals.latex(), "$"]))
-            else:
-                columns.append(self.goals_string)
-            columns.append(" ")
+        if latex:
+            columns.append("".join(["$", goals.latex(), "$"]))
         else:
-            raise ValueError(
-                "A goal needs to be set before a truth table can be constructed."
-            )
+            columns.append(self.goals_string)
+        columns.append(" ")
 
-        tt = []
-        letters = len(self.letters)
-        countfalsegoal = 0
+        def display(values):
+            if useint:
+                return values.astype(int).tolist()
+            else:
+                return values.tolist()
+
+        ttrows = 2 ** len(letters)
+        program = altrea.truthtables.Program(self.premises + [goals], letters)
+        tt = numpy.full((ttrows + 1, len(columns)), " ", dtype=object)
+        truthcolumn = len(letters)
+        premisecolumn = truthcolumn + len(self.truths) + 1
+        goalcolumn = premisecolumn + len(self.premises) + 1
+        tt[:ttrows, truthcolumn:premisecolumn - 1] = int(True) if useint else True
+        tt[:ttrows, premisecolumn - 1] = "$\\parallel $" if latex else "|"
+        if latex:
+            error = "".join(["$", self.label_errorlatex, "$"])
+            checkmark = "".join(["$", self.label_checkmarklatex, "$"])
+        else:
+            error = self.label_error
+            checkmark = self.label_checkmark
         counttruepremises = 0
-        ttrows = 2**letters
-        status = "Valid"
-
-        for letter in self.letters:
-            letter[0].booleanvalue = True
-        for total in range(ttrows):
-            row = []
+        countfalsegoal = 0
+        countcounterexamples = 0
+        for start in range(0, ttrows, altrea.truthtables.chunksize):
+            stop = min(start + altrea.truthtables.chunksize, ttrows)
 
             # Display the letters
-            for i in self.letters:
-                if useint:
-                    row.append(int(i[0].booleanvalue))
-                else:
-                    row.append(i[0].booleanvalue)
-            for i in self.truths:
-                if useint:
-                    row.append(int(True))
-                else:
-                    row.append(True)
-            if latex:
-                row.append("$\\parallel $")
-            else:
-                row.append("|")
+            for n, values in enumerate(altrea.truthtables.assignments(len(letters), start, stop)):
+                tt[start:stop, n] = display(values)
 
             # Display the optional premises
-            premisesvalue = True
-            if len(self.premises) > 0:
-                for i in self.premises:
-                    if useint:
-                        row.append(int(i.getvalue()))
-                    else:
-                        row.append(i.getvalue())
-                    premisesvalue = premisesvalue and i.getvalue()
-                if premisesvalue:
-                    counttruepremises += 1
+            values = program.run(start, stop)
+            premisesvalues = numpy.ones(stop - start, dtype=bool)
+            for n, premisevalues in enumerate(values[:-1]):
+                tt[start:stop, premisecolumn + n] = display(premisevalues)
+                premisesvalues &= premisevalues
 
             # Display the goal and assessment of the interpretation on the line.
-            row.append(" ")
-            goalvalue = goals.getvalue()
-            if not goalvalue:
-                countfalsegoal += 1
-            if useint:
-                row.append(int(goalvalue))
-            else:
-                row.append(goalvalue)
-            if premisesvalue and not goalvalue:
-                if latex:
-                    row.append("".join(["$", self.label_errorlatex, "$"]))
-                else:
-                    row.append(self.label_error)
-                status = self.label_invalid
-            elif premisesvalue and goalvalue:
-                if latex:
-                    row.append("".join(["$", self.label_checkmarklatex, "$"]))
-                else:
-                    row.append(self.label_checkmark)
-            else:
-                row.append(" ")
-            tt.append(row)
-            for n in range(letters):
-                if (total + 1) % (2 ** (letters - 1 - n)) == 0:
-                    self.letters[n][0].booleanvalue = flip(
-                        self.letters[n][0].booleanvalue
-                    )
+            goalvalues = values[-1]
+            tt[start:stop, goalcolumn] = display(goalvalues)
+            tt[start:stop, goalcolumn + 1] = numpy.where(
+                premisesvalues & ~goalvalues,
+                error,
+                numpy.where(premisesvalues & goalvalues, checkmark, " "),
+            )
+            counttruepremises += int(premisesvalues.sum())
+            countfalsegoal += int((~goalvalues).sum())
+            countcounterexamples += int((premisesvalues & ~goalvalues).sum())
 
-        if len(self.premises) > 0 and counttruepremises == 0:
-            if self.restricted:
-                status = self.label_vacuous
-            else:
-                status = self.label_valid
-        elif countfalsegoal == 0:
-            status = self.label_tautology
+        status = self.truthtablestatus(counttruepremises, countfalsegoal, countcounterexamples)
         index = []
-        for i in range(len(tt)):
+        for i in range(ttrows):
             index.append(i + 1)
         index.append(self.displayname)
         summaryrow = []
@@ -2926,38 +3205,245 @@ class Proof:
             summaryrow.append(" ")
         if status == self.label_tautology:
             for i in range(len(self.premises)):
-                if latex:
-                    summaryrow.append("".join(["$", self.label_errorlatex, "$"]))
-                else:
-                    summaryrow.append(self.label_error)
+                summaryrow.append(error)
         else:
             for i in range(len(self.premises)):
                 summaryrow.append(" ")
         summaryrow.append(status)
         summaryrow.append(" ")
         summaryrow.append(" ")
-        tt.append(summaryrow)
+        tt[ttrows] = summaryrow
 
         df = pandas.DataFrame(tt, index=index, columns=columns)
         return df
 
+    def checkvalidity(self, method: str = "truthtable"):
+        """Check whether the premises of the proof entail its goal without building a truth table.
+
+        With the truthtable method the rows are evaluated in growing chunks and the search
+        stops at the first row where the premises are true and the goal is false.  With the
+        sat method the premises and the negated goal are encoded as clauses and given to the
+        solver in `altrea.sat` which scales to many more letters.  With the bdd method the
+        premises and the goal are converted to decision diagrams by `altrea.bdd` and the
+        counterexample is the first in the order of the truth table.
+
+        Parameters:
+            method: Either "truthtable", "sat" or "bdd".
+
+        Returns:
+            The status that would appear in the summary row of `truthtable` and, if the
+            status is "Invalid", a dictionary from the name of each letter to its value in
+            the first counterexample.  Otherwise the second value is None.
+
+        Examples:
+            >>> from altrea.wffs import Or
+            >>> from altrea.rules import Proof
+            >>> prf = Proof()
+            >>> A = prf.proposition("A")
+            >>> B = prf.proposition("B")
+            >>> prf.setlogic()
+            >>> prf.goal(A)
+            >>> prf.premise(Or(A, B))
+            >>> prf.checkvalidity()
+            ('Invalid', {'A': False, 'B': True})
+        """
+
+        goals = self.joinedgoals()
+        letters = [i[0] for i in self.letters]
+        if method == self.method_sat:
+            truepremises, falsegoal, values = altrea.sat.checkentailment(self.premises, goals, letters)
+        elif method == self.method_truthtable:
+            truepremises, falsegoal, values = altrea.truthtables.findcounterexample(self.premises, goals, letters)
+        elif method == self.method_bdd:
+            truepremises, falsegoal, values = altrea.bdd.checkentailment(self.premises, goals, letters)
+        else:
+            raise ValueError(
+                f'The method "{method}" is not one of "{self.method_truthtable}", "{self.method_sat}" or "{self.method_bdd}".'
+            )
+        if values is None:
+            return self.truthtablestatus(int(truepremises), int(falsegoal), 0), None
+        else:
+            return self.label_invalid, {self.letters[i][1]: values[i] for i in range(len(letters))}
+
+    def decisiondiagrams(self):
+        """Return the `altrea.bdd.BDD` of the proof, testing the letters in the order they were defined."""
+
+        if self.bdd is None:
+            self.bdd = altrea.bdd.BDD([i[0] for i in self.letters])
+        return self.bdd
+
+    def equivalent(self, first: Wff, second: Wff):
+        """Return whether two statements are true in the same rows of a truth table.
+
+        Both are converted to nodes of the decision diagrams of the proof, which are the same
+        node exactly when the statements are equivalent.
+
+        Examples:
+            >>> from altrea.wffs import Implies, Or, Not
+            >>> from altrea.rules import Proof
+            >>> prf = Proof()
+            >>> A = prf.proposition("A")
+            >>> B = prf.proposition("B")
+            >>> prf.equivalent(Implies(A, B), Or(Not(A), B))
+            True
+        """
+
+        manager = self.decisiondiagrams()
+        return manager.node(first) == manager.node(second)
+
+    def soundness(self):
+        """Check which rules, axioms, definitions and saved proofs of the logic are truth functionally sound.
+
+        The pattern of each is built with a new letter for each metavariable and it is sound if the
+        conjunction of its premises implies its conclusion in every row.  Patterns with modal,
+        strict or identity connectives cannot be checked by a truth table.
+
+        Returns:
+            A list of `[kind, name, sound]` in the order of the tables where sound is True, False
+            or None if the pattern cannot be checked.
+        """
+
+        manager = altrea.bdd.BDD()
+        checked = []
+        for kind, table in self.premisetables():
+            for row in table:
+                sound = None
+                try:
+                    template = compilepattern(row[1])
+                    letters = [Proposition(f"{{{i}}}") for i in range(template.slots)]
+                    conclusionpremises = template.instantiate(letters, self.objectdictionary)
+                    formulas = [conclusionpremises.conclusion] + list(conclusionpremises.premises)
+                    if all(
+                        type(j) in altrea.bdd.truthfunctional or altrea.bdd.isletter(j)
+                        for i in formulas
+                        for j in postorder(i)
+                    ):
+                        joined = manager.keep(manager.conjoin([manager.node(i) for i in formulas[1:]]))
+                        conclusion = manager.node(formulas[0])
+                        manager.release(joined)
+                        implied = manager.apply(altrea.bdd.operator_implies, joined, conclusion)
+                        sound = implied == manager.true
+                except (ValueError, NameError, IndexError, TypeError):
+                    sound = None
+                checked.append([kind, row[0], sound])
+        return checked
+
+    def checkmodal(self, frame: str = "K"):
+        """Check whether the premises of the proof entail its goal in every model of a frame class.
+
+        The premises and the negated goal are given to the tableau prover of `altrea.tableau`,
+        which either closes every branch or returns a Kripke model where they are all true at
+        world 0.  The tableau of each frame class is kept, so labels it has already decided are
+        not expanded again.
+
+        Parameters:
+            frame: One of "K", "T", "S4" or "S5".
+
+        Returns:
+            The status that would appear in the summary row of `truthtable` and, if the status
+            is "Invalid", the `altrea.kripke.KripkeModel` of the counterexample.  Otherwise the
+            second value is None.
+
+        Examples:
+            >>> from altrea.wffs import Necessary, Possibly
+            >>> from altrea.rules import Proof
+            >>> prf = Proof()
+            >>> A = prf.proposition("A")
+            >>> prf.setlogic()
+            >>> prf.goal(Necessary(Possibly(A)))
+            >>> prf.premise(A)
+            >>> prf.checkmodal("S5")[0]
+            'Valid'
+            >>> prf.checkmodal("S4")[0]
+            'Invalid'
+        """
+
+        if frame not in self.tableaus:
+            self.tableaus[frame] = altrea.tableau.Tableau(frame)
+        tableau = self.tableaus[frame]
+        goals = self.joinedgoals()
+        model = tableau.countermodel(self.premises, goals)
+        if model is not None:
+            return self.label_invalid, model
+        truepremises = tableau.satisfiable(self.premises)
+        falsegoal = tableau.satisfiable([Not(goals)])
+        return self.truthtablestatus(int(truepremises), int(falsegoal), 0), None
+
+    def findcountermodel(self, maxsize: int = 6):
+        """Search for a finite interpretation in which the premises of the proof are true and its goal false.
+
+        The domains of 1 to `maxsize` elements are tried in turn by `altrea.finitemodels`.  Finding
+        no countermodel does not show the goal follows from the premises, since the countermodels
+        of a first order argument may all be larger or infinite.
+
+        Parameters:
+            maxsize: The number of elements of the largest domain tried.
+
+        Returns:
+            The `altrea.fol.Interpretation` over the smallest domain which is a countermodel, or
+            None if there is none with at most `maxsize` elements.
+
+        Examples:
+            >>> from altrea.wffs import Attribute, ForAll, ThereExists, Variable
+            >>> from altrea.rules import Proof
+            >>> prf = Proof()
+            >>> x = Variable("x")
+            >>> P = prf.predicate("P", "P")
+            >>> prf.setlogic()
+            >>> prf.goal(ForAll([x], Attribute(P, x)))
+            >>> prf.premise(ThereExists([x], Attribute(P, x)))
+            >>> model = prf.findcountermodel()
+            >>> len(model.domain.elements)
+            2
+        """
+
+        return altrea.finitemodels.countermodel(self.premises, self.joinedgoals(), maxsize)
+
+    def joinedgoals(self):
+        """Return the goal of the proof or, if there are several, their conjunction."""
+
+        if len(self.goalswff) > 0:
+            goals = self.goalswff[0]
+            if len(self.goalswff) > 1:
+                for i in range(len(self.goalswff)):
+                    if i > 0:
+                        goals = And(goals, self.goalswff[i])
+            return goals
+        else:
+            raise ValueError(
+                "A goal needs to be set before a truth table can be constructed."
+            )
+
+    def truthtablestatus(self, counttruepremises: int, countfalsegoal: int, countcounterexamples: int):
+        """Return the status of the summary row of a truth table from the number of rows with
+        true premises, with a false goal and with true premises and a false goal."""
+
+        status = self.label_valid
+        if countcounterexamples > 0:
+            status = self.label_invalid
+        if len(self.premises) > 0 and counttruepremises == 0:
+            if self.restricted:
+                status = self.label_vacuous
+            else:
+                status = self.label_valid
+        elif countfalsegoal == 0:
+            status = self.label_tautology
+        return status
+
     def multivaluetruthtable(self, latex: bool = True):
         """Display a truth table built from the premises and goal of the proof.
 
+        Each letter takes the values True, (True, False) and False.  The premises and
+        goal are compiled by `altrea.truthtables` into lookup tables applied to all of
+        the rows at once, a chunk of rows at a time.
+
         Examples:
 
         """
 
-        def flip(v):
-            if v:
-                return (True, False)
-            elif v == (True, False):
-                return False
-            elif not v:
-                return True
-
+        goals = self.joinedgoals()
+        letters = [i[0] for i in self.letters]
         columns = []
-        values = 3
 
         # Letters
         for i in self.letters:
@@ -2992,87 +3478,63 @@ class Proof:
             columns.append("|=")
 
         # Required conclusion
-        if len(self.goalswff) > 0:
-            goals = self.goalswff[0]
-            if len(self.goalswff) > 1:
-                for i in range(len(self.goalswff)):
-                    if i > 0:
-                        goals = And(goals, self.goalswff[i])
-            if latex:
-                columns.append("".join(["$", goals.latex(), "$"]))
-            else:
-                columns.append(self.goals_string)
-            columns.append(" ")
+        if latex:
+            columns.append("".join(["$", goals.latex(), "$"]))
         else:
-            raise ValueError(
-                "A goal needs to be set before a truth table can be constructed."
-            )
+            columns.append(self.goals_string)
+        columns.append(" ")
 
-        tt = []
-        letters = len(self.letters)
-        countfalsegoal = 0
-        counttruepremises = 0
-        ttrows = values**letters
-        status = "Valid"
+        display = numpy.empty(3, dtype=object)
+        for i in range(3):
+            display[i] = altrea.truthtables.multivalues[i]
 
-        for letter in self.letters:
-            letter[0].multivalue = True
-        for total in range(ttrows):
-            row = []
+        values = 3
+        ttrows = values ** len(letters)
+        program = altrea.truthtables.MultivalueProgram(self.premises + [goals], letters)
+        tt = numpy.full((ttrows + 1, len(columns)), " ", dtype=object)
+        truthcolumn = len(letters)
+        premisecolumn = truthcolumn + len(self.truths) + 1
+        goalcolumn = premisecolumn + len(self.premises) + 1
+        tt[:ttrows, truthcolumn:premisecolumn - 1] = (True)
+        tt[:ttrows, premisecolumn - 1] = "$\\parallel $" if latex else "|"
+        if latex:
+            error = "".join(["$", self.label_errorlatex, "$"])
+            checkmark = "".join(["$", self.label_checkmarklatex, "$"])
+        else:
+            error = self.label_error
+            checkmark = self.label_checkmark
+        counttruepremises = 0
+        countfalsegoal = 0
+        countcounterexamples = 0
+        for start in range(0, ttrows, altrea.truthtables.chunksize):
+            stop = min(start + altrea.truthtables.chunksize, ttrows)
 
             # Display the letters
-            for i in self.letters:
-                row.append(i[0].multivalue)
-            for i in self.truths:
-                # row.append(1)
-                row.append((True))
-            if latex:
-                row.append("$\\parallel $")
-            else:
-                row.append("|")
+            for n, codes in enumerate(altrea.truthtables.multivalueassignments(len(letters), start, stop)):
+                tt[start:stop, n] = display[codes]
 
             # Display the optional premises
-            premisesvalue = True
-            if len(self.premises) > 0:
-                for i in self.premises:
-                    row.append(i.getmultivalue())
-                    premisesvalue = premisesvalue and i.getmultivalue()
-                if premisesvalue:
-                    counttruepremises += 1
+            codes = program.run(start, stop)
+            premisesvalues = numpy.ones(stop - start, dtype=bool)
+            for n, premisecodes in enumerate(codes[:-1]):
+                tt[start:stop, premisecolumn + n] = display[premisecodes]
+                premisesvalues &= premisecodes != 0
 
             # Display the goal and assessment of the interpretation on the line.
-            row.append(" ")
-            goalvalue = goals.getmultivalue()
-            if not goalvalue:
-                countfalsegoal += 1
-            row.append(goalvalue)
-            if premisesvalue and not goalvalue:
-                if latex:
-                    row.append("".join(["$", self.label_errorlatex, "$"]))
-                else:
-                    row.append(self.label_error)
-                status = self.label_invalid
-            elif premisesvalue and goalvalue:
-                if latex:
-                    row.append("".join(["$", self.label_checkmarklatex, "$"]))
-                else:
-                    row.append(self.label_checkmark)
-            else:
-                row.append(" ")
-            tt.append(row)
-            for n in range(letters):
-                if (total + 1) % (values ** (letters - 1 - n)) == 0:
-                    self.letters[n][0].multivalue = flip(self.letters[n][0].multivalue)
+            tt[start:stop, goalcolumn] = display[codes[-1]]
+            goalvalues = codes[-1] != 0
+            tt[start:stop, goalcolumn + 1] = numpy.where(
+                premisesvalues & ~goalvalues,
+                error,
+                numpy.where(premisesvalues & goalvalues, checkmark, " "),
+            )
+            counttruepremises += int(premisesvalues.sum())
+            countfalsegoal += int((~goalvalues).sum())
+            countcounterexamples += int((premisesvalues & ~goalvalues).sum())
 
-        if len(self.premises) > 0 and counttruepremises == 0:
-            if self.restricted:
-                status = self.label_vacuous
-            else:
-                status = self.label_valid
-        elif countfalsegoal == 0:
-            status = self.label_tautology
+        status = self.truthtablestatus(counttruepremises, countfalsegoal, countcounterexamples)
         index = []
-        for i in range(len(tt)):
+        for i in range(ttrows):
             index.append(i + 1)
         index.append(self.displayname)
         summaryrow = []
@@ -3080,17 +3542,14 @@ class Proof:
             summaryrow.append(" ")
         if status == self.label_tautology:
             for i in range(len(self.premises)):
-                if latex:
-                    summaryrow.append("".join(["$", self.label_errorlatex, "$"]))
-                else:
-                    summaryrow.append(self.label_error)
+                summaryrow.append(error)
         else:
             for i in range(len(self.premises)):
                 summaryrow.append(" ")
         summaryrow.append(status)
         summaryrow.append(" ")
         summaryrow.append(" ")
-        tt.append(summaryrow)
+        tt[ttrows] = summaryrow
 
         df = pandas.DataFrame(tt, index=index, columns=columns)
         return df
@@ -3656,17 +4115,13 @@ class Proof:
         # Look for errors
 
         # If no errors, perform the task
-        indexfound = -1
-        for i in range(len(self.logicaxioms)):
-            if self.logicaxioms[i][0] == name:
-                indexfound = i
-                break
-        if indexfound == -1:
+        found = self.logicaxioms.find(name)
+        if found is None:
             print(
                 self.log_axiomnotfound.format(self.removeaxiom_name.upper(), name)
             )
         else:
-            self.logicaxioms.pop(i)
+            self.logicaxioms.remove(found)
             if self.logicdatabase != self.label_nodatabase:
                 altrea.data.deleteaxiom(self.logic, name)
                 print(
@@ -3687,19 +4142,15 @@ class Proof:
         # Look for errors
 
         # If no errors, perform the task
-        indexfound = -1
-        for i in range(len(self.logicdefinitions)):
-            if self.logicdefinitions[i][0] == name:
-                indexfound = i
-                break
-        if indexfound == -1:
+        found = self.logicdefinitions.find(name)
+        if found is None:
             print(
                 self.log_definitionnotfound.format(
                     self.removedefinition_name.upper(), name
                 )
             )
         else:
-            self.logicdefinitions.pop(i)
+            self.logicdefinitions.remove(found)
             if self.logicdatabase != self.label_nodatabase:
                 altrea.data.deletedefinition(self.logic, name)
                 print(
@@ -3741,15 +4192,11 @@ class Proof:
         # Look for errors
 
         # If no errors, perform the task
-        indexfound = -1
-        for i in range(len(self.logicrules)):
-            if self.logicrules[i][0] == name:
-                indexfound = i
-                break
-        if indexfound == -1:
+        found = self.logicrules.find(name)
+        if found is None:
             print(self.valueerror_rulenotfound.format(self.removerule_name.upper(), name))
         else:
-            self.logicrules.pop(i)
+            self.logicrules.remove(found)
             if self.logicdatabase != self.label_nodatabase:
                 altrea.data.deleterule(self.logic, name)
                 print(
@@ -3794,12 +4241,7 @@ class Proof:
                 propositionlist
             )
             axiom = [name, conclusionpremise, displayname, description]
-            found = False
-            for i in self.logicaxioms:
-                if i[0] == name:
-                    found = True
-                    break
-            if found:
+            if self.logicaxioms.find(name) is not None:
                 print(
                     self.log_axiomalreadyexists.format(
                         self.saveaxiom_name.upper(), name
@@ -3857,12 +4299,7 @@ class Proof:
                 propositionlist
             )
             definition = [name, conclusionpremise, displayname, description]
-            found = False
-            for i in self.logicdefinitions:
-                if i[0] == name:
-                    found = True
-                    break
-            if found:
+            if self.logicdefinitions.find(name) is not None:
                 print(
                     self.log_definitionalreadyexists.format(
                         self.savedefinition_name.upper(), name
@@ -4003,12 +4440,7 @@ class Proof:
             propositionlist
         )
         rule = [name, conclusionpremise, displayname, description]
-        found = False
-        for i in self.logicrules:
-            if i[0] == name:
-                found = True
-                break
-        if found:
+        if self.logicrules.find(name) is not None:
             print(
                 self.log_rulereadyexists.format(
                     self.saverule_name.upper(), name
@@ -4286,7 +4718,7 @@ class Proof:
         Parameters:
             name: The name of the axiom one wishes to use.
             subslist: A list of wff object instances which will be used as substitutes in the order they are provided
-                for the string metavariables.
+                for the string metavariables.  If the list is empty they are inferred from the premises.
             premiselist: A list of integers referencing previous lines of the proof which will be matched to those required
                 to use the axiom in the order the axiom specifies.  Some axioms require no premises.
             comment: An optional comment the user may add to this line of the proof.
@@ -4315,20 +4747,16 @@ class Proof:
 
         # Look for errors: Find the axiom.
         if self.canproceed():
-            foundindex = -1
-            for i in range(len(self.logicaxioms)):
-                if self.logicaxioms[i][0] == name:
-                    foundindex = i
-                    break
-            if foundindex < 0:
+            found = self.logicaxioms.find(name)
+            if found is None:
                 self.logstep(self.log_nosuchaxiom.format(self.axiom_name.upper(), name))
                 self.stopproof(
                     self.stopped_nosuchaxiom, self.blankstatement, name, "", "", comment
                 )
         if self.canproceed():
-            pattern = self.logicaxioms[foundindex][1]
-            displayname = self.logicaxioms[foundindex][2]
-            description = self.logicaxioms[foundindex][3]
+            pattern = found[1]
+            displayname = found[2]
+            description = found[3]
 
         # Look for errors: Check the substitution values.
         if self.canproceed():
@@ -4342,6 +4770,12 @@ class Proof:
                 self.axiom_name.upper(), displayname, comment, premiselist
             )
 
+        # Infer the substitutions from the lines if none were given.
+        if self.canproceed() and len(subs) == 0:
+            subs = self.infersubs(
+                self.axiom_name.upper(), displayname, comment, pattern, matchpremiselist
+            )
+
         # Look for errors: Can substitutions be made
         if self.canproceed():
             conclusionpremises = self.substitute(pattern, subs, displayname)
@@ -4404,6 +4838,7 @@ class Proof:
                 such line number, but putting them in a list allows for more than one.
             subslist: An arbitrary long list of substitutions that will be made into the retrieved definition string
                 before forming the object and testing whether the definition matches lines in the proof.
+                If the list is empty the substitutions are inferred from the lines.
             comment: An optional comment the user may add to this line of the proof.
 
         Examples:
@@ -4412,12 +4847,8 @@ class Proof:
 
         # Look for errors: Find the definitions
         if self.canproceed():
-            foundindex = -1
-            for i in range(len(self.logicdefinitions)):
-                if self.logicdefinitions[i][0] == name:
-                    foundindex = i
-                    break
-            if foundindex < 0:
+            found = self.logicdefinitions.find(name)
+            if found is None:
                 self.logstep(
                     self.log_nosuchdefinition.format(self.definition_name.upper(), name)
                 )
@@ -4430,9 +4861,9 @@ class Proof:
                     comment,
                 )
             else:
-                definition = self.logicdefinitions[foundindex][1]
-                displayname = self.logicdefinitions[foundindex][2]
-                description = self.logicdefinitions[foundindex][3]
+                definition = found[1]
+                displayname = found[2]
+                description = found[3]
 
         # Look for errors: Check the substitution values.
         if self.canproceed():
@@ -4446,6 +4877,12 @@ class Proof:
                 self.definition_name.upper(), displayname, comment, premiselist
             )
 
+        # Infer the substitutions from the lines if none were given.
+        if self.canproceed() and len(subs) == 0:
+            subs = self.infersubs(
+                self.definition_name.upper(), displayname, comment, definition, matchpremiselist
+            )
+
         # Look for errors: Try to make the requested substitutions.
         if self.canproceed():
             conclusionpremises = self.substitute(definition, subs, displayname)
@@ -5560,21 +5997,21 @@ class Proof:
             )
             if self.logic != "":
                 try:
-                    self.logicaxioms = altrea.data.getaxioms(logic)
+                    self.logicaxioms = RuleTable(altrea.data.getaxioms(logic))
                 except TypeError:
-                    self.logicaxioms = []
+                    self.logicaxioms = RuleTable()
                 try:
-                    self.logicdefinitions = altrea.data.getdefinitions(logic)
+                    self.logicdefinitions = RuleTable(altrea.data.getdefinitions(logic))
                 except TypeError:
-                    self.logicdefinitions = []
+                    self.logicdefinitions = RuleTable()
                 try:
                     self.logiclemmas = altrea.data.getproofs(logic)
                 except TypeError:
                     self.logicsavedoriifs = []
                 try:
-                    self.logicrules = altrea.data.getrules(logic)
+                    self.logicrules = RuleTable(altrea.data.getrules(logic))
                 except TypeError:
-                    self.logicrules = []
+                    self.logicrules = RuleTable()
                 try:
                     self.logicconnectives = altrea.data.getconnectives(logic)
                 except TypeError:
@@ -5680,7 +6117,8 @@ class Proof:
         Parameters:
             name: The name of the saved proof one wishes to use.
             subslist: A list of object substitutions, not strings, given in the order that they will be
-                substituted into the rule.
+                substituted into the rule.  If the list is empty the substitutions are inferred by matching
+                the premises of the rule against the lines.
             lines: A list of integers representing the lines in the proof that stand for the premises required
                 by the rule.  After the substitutions are made and they match between the rule and these
                 lines then the conclusion of the rule will be made available.
@@ -5702,12 +6140,8 @@ class Proof:
                 self.rule_name,
                 comment
             ):
-                foundindex = -1
-                for i in range(len(self.logicrules)):
-                    if self.logicrules[i][0] == name:
-                        foundindex = i
-                        break
-                if foundindex < 0:
+                found = self.logicrules.find(name)
+                if found is None:
                     self.logstep(
                         self.log_notransformationrule.format(self.rule_name.upper(), name)
                     )
@@ -5720,9 +6154,9 @@ class Proof:
                         comment,
                     )
                 else:
-                    pattern = self.logicrules[foundindex][1]
-                    displayname = self.logicrules[foundindex][2]
-                    description = self.logicrules[foundindex][3]
+                    pattern = found[1]
+                    displayname = found[2]
+                    description = found[3]
                 # if self.subproofavailable not in [
                 #         self.subproofavailable_not
                 #     ]:
@@ -5753,6 +6187,12 @@ class Proof:
                 self.rule_name.upper(), displayname, comment, lines
             )
 
+        # Infer the substitutions from the lines if none were given.
+        if self.canproceed() and len(subs) == 0:
+            subs = self.infersubs(
+                self.rule_name.upper(), displayname, comment, pattern, matchlist
+            )
+
         # Look for errors: Check if substitutions can be made.
         if self.canproceed():
             conclusionpremises = self.substitute(pattern, subs, displayname)
@@ -5813,6 +6253,15 @@ class Proof:
         )
         return newtruth
 
+    def lemmacacheinfo(self):
+        """Return the number of hits, misses and entries and the maximum size of the lemma cache.
+
+        The cache is shared by all proofs.  It holds the saved proofs used by `lemma` keyed by
+        logic and name together with their compiled patterns.
+        """
+
+        return altrea.data.lemmacache.info()
+
     def lemma(
         self, name: str, subslist: list, premiselist: list = [], comment: str = ""
     ):
@@ -5824,9 +6273,13 @@ class Proof:
         use them later.  Also, if one connects to a logic that already has a database, one can use
         whatever proof are stored there as well as add to them.
 
+        Saved proofs are read through the lemma cache in `altrea.data` so a saved proof used many times
+        is queried and compiled only once.  Saving or removing a proof drops it from the cache.
+
         Parameters:
             name: The name of the saved proof one wishes to use.
             subslist: A list of object substitutions, not strings, given in order that they will be made.
+                If the list is empty they are inferred from the premises.
             premiselist: A list of integers representing the lines in the code that stand for the premises of the
                 proof being used.  After the substitutions are made and they match between the saved proof and these
                 lines then the conclusion of the saved proof will be made available.
@@ -5837,13 +6290,14 @@ class Proof:
         See Also:
             - `setlogic`
             - `saveproof`
+            - `lemmacacheinfo`
 
         """
 
         # Look for errors: Get the saved proof.
         if self.canproceed():
             try:
-                displayname, description, pattern = altrea.data.getsavedproof(
+                displayname, description, pattern, template = altrea.data.getcachedproof(
                     self.logic, name
                 )
             except TypeError:
@@ -5871,9 +6325,15 @@ class Proof:
                 self.lemma_name.upper(), displayname, comment, premiselist
             )
 
+        # Infer the substitutions from the lines if none were given.
+        if self.canproceed() and len(subs) == 0:
+            subs = self.infersubs(
+                self.lemma_name.upper(), displayname, comment, pattern, matchpremiselist, template
+            )
+
         # Look for errors: Check if substitutions can be made.
         if self.canproceed():
-            conclusionpremises = self.substitute(pattern, subs, displayname)
+            conclusionpremises = self.substitute(pattern, subs, displayname, template)
 
         # Look for errors: Check if premises match identified lines in the current proof.
         if self.canproceed():
@@ -0,0 +1,427 @@
+# sat.py
+"""This module decides propositional entailment with a conflict driven clause learning
+(CDCL) SAT solver.
+
+The premises and the negation of the goal are translated into clauses by the Tseitin
+encoding which introduces one new variable for each distinct subformula so that the
+number of clauses grows linearly with the size of the formulas.  Interned subformulas
+that are shared are encoded once.  If the clauses can be satisfied the satisfying
+assignment is a counterexample to the entailment.
+
+It contains the following:
+- `Solver` - A CDCL SAT solver with watched literals, clause learning, activity based
+    branching and restarts.
+- `Encoder` - The Tseitin encoding of well formed formulas into the clauses of a solver.
+- `checkentailment(premises, goal, letters)` - Decide whether the premises entail the goal.
+"""
+
+import heapq
+
+from altrea.wffs import (
+    And,
+    Or,
+    Not,
+    Implies,
+    Iff,
+    Necessary,
+    Possibly,
+    Falsehood,
+    Truth,
+    ConsistentWith,
+    StrictIff,
+    StrictImplies,
+    Wff,
+)
+
+
+def luby(i: int):
+    """Return the i-th term, starting from 1, of the Luby sequence 1, 1, 2, 1, 1, 2, 4, ..."""
+
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    while i != (1 << k) - 1:
+        i -= (1 << (k - 1)) - 1
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+    return 1 << (k - 1)
+
+
+class Solver:
+    """A CDCL SAT solver.
+
+    Variables are the positive integers returned by `newvariable` and a literal is a
+    variable or its negation.  Clauses are lists of literals.  `solve` may be called
+    several times with different assumptions and the learned clauses are kept between
+    the calls.
+    """
+
+    restartinterval = 100
+    activitydecay = 0.95
+
+    def __init__(self):
+        self.variables = 0
+        self.clauses = []
+        self.watches = [[], []]
+        self.values = [0]
+        self.levels = [0]
+        self.reasons = [None]
+        self.activity = [0.0]
+        self.polarity = [False]
+        self.trail = []
+        self.separators = []
+        self.head = 0
+        self.increment = 1.0
+        self.heap = []
+        self.inconsistent = False
+        self.conflicts = 0
+        self.decisions = 0
+        self.model = None
+
+    def newvariable(self):
+        """Add a variable and return it."""
+
+        self.variables += 1
+        self.watches.extend([[], []])
+        self.values.append(0)
+        self.levels.append(0)
+        self.reasons.append(None)
+        self.activity.append(0.0)
+        self.polarity.append(False)
+        heapq.heappush(self.heap, (0.0, self.variables))
+        return self.variables
+
+    def index(self, literal: int):
+        return 2 * literal if literal > 0 else 1 - 2 * literal
+
+    def value(self, literal: int):
+        if literal > 0:
+            return self.values[literal]
+        return -self.values[-literal]
+
+    def addclause(self, literals: list):
+        """Add a clause.  Returns False if the clauses can no longer be satisfied."""
+
+        if self.inconsistent:
+            return False
+        self.backtrack(0)
+        clause = []
+        for i in literals:
+            if -i in clause or self.value(i) == 1:
+                return True
+            elif i not in clause and self.value(i) == 0:
+                clause.append(i)
+        if len(clause) == 0:
+            self.inconsistent = True
+        elif len(clause) == 1:
+            self.enqueue(clause[0], None)
+            if self.propagate() is not None:
+                self.inconsistent = True
+        else:
+            self.attach(clause)
+        return not self.inconsistent
+
+    def attach(self, clause: list):
+        self.clauses.append(clause)
+        position = len(self.clauses) - 1
+        self.watches[self.index(clause[0])].append(position)
+        self.watches[self.index(clause[1])].append(position)
+        return position
+
+    def enqueue(self, literal: int, reason):
+        variable = abs(literal)
+        self.values[variable] = 1 if literal > 0 else -1
+        self.levels[variable] = len(self.separators)
+        self.reasons[variable] = reason
+        self.trail.append(literal)
+
+    def propagate(self):
+        """Assign the literals forced by unit clauses.  Returns a conflicting clause or None."""
+
+        values = self.values
+        while self.head < len(self.trail):
+            false = -self.trail[self.head]
+            self.head += 1
+            watching = self.watches[self.index(false)]
+            kept = []
+            self.watches[self.index(false)] = kept
+            i = 0
+            while i < len(watching):
+                position = watching[i]
+                i += 1
+                clause = self.clauses[position]
+                if clause[0] == false:
+                    clause[0], clause[1] = clause[1], false
+                first = clause[0]
+                firstvalue = values[first] if first > 0 else -values[-first]
+                if firstvalue == 1:
+                    kept.append(position)
+                    continue
+                for k in range(2, len(clause)):
+                    literal = clause[k]
+                    if (values[literal] if literal > 0 else -values[-literal]) != -1:
+                        clause[1], clause[k] = literal, false
+                        self.watches[self.index(literal)].append(position)
+                        break
+                else:
+                    kept.append(position)
+                    if firstvalue == -1:
+                        kept.extend(watching[i:])
+                        self.head = len(self.trail)
+                        return position
+                    self.enqueue(first, position)
+        return None
+
+    def analyze(self, conflict: int):
+        """Derive the first unique implication point clause from a conflict.
+
+        Returns the learned clause, with its asserting literal first, and the level to
+        backtrack to.
+        """
+
+        seen = set()
+        learned = [0]
+        counter = 0
+        literal = None
+        position = conflict
+        index = len(self.trail) - 1
+        level = len(self.separators)
+        while True:
+            clause = self.clauses[position]
+            for i in clause if literal is None else clause[1:]:
+                variable = abs(i)
+                if variable not in seen and self.levels[variable] > 0:
+                    seen.add(variable)
+                    self.bump(variable)
+                    if self.levels[variable] >= level:
+                        counter += 1
+                    else:
+                        learned.append(i)
+            while abs(self.trail[index]) not in seen:
+                index -= 1
+            literal = self.trail[index]
+            index -= 1
+            position = self.reasons[abs(literal)]
+            seen.discard(abs(literal))
+            counter -= 1
+            if counter == 0:
+                break
+        learned[0] = -literal
+        if len(learned) == 1:
+            return learned, 0
+        highest = max(range(1, len(learned)), key=lambda i: self.levels[abs(learned[i])])
+        learned[1], learned[highest] = learned[highest], learned[1]
+        return learned, self.levels[abs(learned[1])]
+
+    def bump(self, variable: int):
+        self.activity[variable] += self.increment
+        if self.activity[variable] > 1e100:
+            self.activity = [i * 1e-100 for i in self.activity]
+            self.increment *= 1e-100
+            self.heap = [(-self.activity[i], i) for i in range(1, self.variables + 1) if self.values[i] == 0]
+            heapq.heapify(self.heap)
+        elif self.values[variable] == 0:
+            heapq.heappush(self.heap, (-self.activity[variable], variable))
+
+    def backtrack(self, level: int):
+        if len(self.separators) > level:
+            for i in range(len(self.trail) - 1, self.separators[level] - 1, -1):
+                variable = abs(self.trail[i])
+                self.polarity[variable] = self.trail[i] > 0
+                self.values[variable] = 0
+                self.reasons[variable] = None
+                heapq.heappush(self.heap, (-self.activity[variable], variable))
+            del self.trail[self.separators[level]:]
+            del self.separators[level:]
+            self.head = len(self.trail)
+        if len(self.heap) > 4 * self.variables + 100:
+            self.heap = [(-self.activity[i], i) for i in range(1, self.variables + 1) if self.values[i] == 0]
+            heapq.heapify(self.heap)
+
+    def branch(self):
+        while len(self.heap) > 0:
+            variable = heapq.heappop(self.heap)[1]
+            if self.values[variable] == 0:
+                return variable if self.polarity[variable] else -variable
+        return None
+
+    def search(self, limit: int, assumptions: list):
+        conflicts = 0
+        while True:
+            conflict = self.propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                conflicts += 1
+                if len(self.separators) == 0:
+                    self.inconsistent = True
+                    return False
+                learned, level = self.analyze(conflict)
+                self.backtrack(level)
+                if len(learned) == 1:
+                    self.enqueue(learned[0], None)
+                else:
+                    self.enqueue(learned[0], self.attach(learned))
+                self.increment /= self.activitydecay
+            elif conflicts >= limit:
+                self.backtrack(0)
+                return None
+            else:
+                decision = None
+                while len(self.separators) < len(assumptions):
+                    assumption = assumptions[len(self.separators)]
+                    if self.value(assumption) == 1:
+                        self.separators.append(len(self.trail))
+                    elif self.value(assumption) == -1:
+                        return False
+                    else:
+                        decision = assumption
+                        break
+                if decision is None:
+                    decision = self.branch()
+                    if decision is None:
+                        return True
+                    self.decisions += 1
+                self.separators.append(len(self.trail))
+                self.enqueue(decision, None)
+
+    def solve(self, assumptions: list = []):
+        """Return True if the clauses and assumed literals can all be satisfied.
+
+        When they can, `model` holds the value of each variable indexed by the variable.
+        """
+
+        self.model = None
+        if self.inconsistent:
+            return False
+        self.backtrack(0)
+        if self.propagate() is not None:
+            self.inconsistent = True
+            return False
+        restarts = 0
+        while True:
+            restarts += 1
+            result = self.search(luby(restarts) * self.restartinterval, assumptions)
+            if result is not None:
+                break
+        if result:
+            self.model = [i == 1 for i in self.values]
+        self.backtrack(0)
+        return result
+
+
+class Encoder:
+    """The Tseitin encoding of well formed formulas into the clauses of a solver.
+
+    Each distinct subformula is given a literal which the added clauses make equivalent
+    to it.  `Not` reuses the negated literal of its operand and `Necessary` the literal of
+    its operand, while `Truth`, `Possibly` and `Falsehood` are constants.  `StrictImplies`,
+    `StrictIff` and `ConsistentWith` are read as `Implies`, `Iff` and `And` as they are by
+    `altrea.truthtables`.  Any other leaf is a letter.
+    """
+
+    def __init__(self, solver: Solver = None):
+        self.solver = Solver() if solver is None else solver
+        self.literals = {}
+        self.encoded = []
+        self.letters = {}
+        self.true = self.solver.newvariable()
+        self.solver.addclause([self.true])
+
+    def letter(self, letter: Wff):
+        """Return the variable of a letter, adding one if it has not been seen."""
+
+        if id(letter) not in self.letters:
+            self.letters[id(letter)] = self.solver.newvariable()
+            self.encoded.append(letter)
+        return self.letters[id(letter)]
+
+    def literal(self, formula: Wff):
+        """Return the literal equivalent to the formula, adding the clauses that define it."""
+
+        stack = [(formula, False)]
+        while len(stack) > 0:
+            node, expanded = stack.pop()
+            if id(node) in self.literals:
+                continue
+            children = self.operands(node)
+            if expanded or len(children) == 0:
+                self.literals[id(node)] = self.define(node, [self.literals[id(i)] for i in children])
+                self.encoded.append(node)
+            else:
+                stack.append((node, True))
+                for i in reversed(children):
+                    stack.append((i, False))
+        return self.literals[id(formula)]
+
+    def operands(self, node: Wff):
+        if isinstance(node, (And, ConsistentWith, Or, Implies, StrictImplies, Iff, StrictIff)):
+            return (node.left, node.right)
+        elif isinstance(node, Not):
+            return (node.negated,)
+        elif isinstance(node, Necessary):
+            return (node.wff,)
+        else:
+            return ()
+
+    def define(self, node: Wff, operands: list):
+        add = self.solver.addclause
+        if isinstance(node, Not):
+            return -operands[0]
+        elif isinstance(node, Necessary):
+            return operands[0]
+        elif isinstance(node, (Truth, Possibly)):
+            return self.true
+        elif isinstance(node, Falsehood):
+            return -self.true
+        elif len(operands) == 0:
+            if type(node).subformulas == () and hasattr(node, 'name'):
+                return self.letter(node)
+            raise ValueError(f'The formula "{node}" cannot be encoded as clauses.')
+        a, b = operands
+        x = self.solver.newvariable()
+        if isinstance(node, (And, ConsistentWith)):
+            add([-x, a])
+            add([-x, b])
+            add([x, -a, -b])
+        elif isinstance(node, Or):
+            add([x, -a])
+            add([x, -b])
+            add([-x, a, b])
+        elif isinstance(node, (Implies, StrictImplies)):
+            add([x, a])
+            add([x, -b])
+            add([-x, -a, b])
+        else:
+            add([-x, -a, b])
+            add([-x, a, -b])
+            add([x, a, b])
+            add([x, -a, -b])
+        return x
+
+
+def checkentailment(premises: list, goal: Wff, letters: list):
+    """Decide whether the premises entail the goal.
+
+    Returns whether the premises can all be true, whether the goal can be false and the
+    values of the letters in a counterexample, with the letters that do not occur set to
+    True, or None if there is no counterexample.  This is the same form as
+    `altrea.truthtables.findcounterexample` except that the first two values are always
+    decided for every assignment.
+    """
+
+    encoder = Encoder()
+    assumptions = [encoder.literal(i) for i in premises]
+    negatedgoal = -encoder.literal(goal)
+    solver = encoder.solver
+    if solver.solve(assumptions + [negatedgoal]):
+        counterexample = []
+        for i in letters:
+            if id(i) in encoder.letters:
+                counterexample.append(solver.model[encoder.letters[id(i)]])
+            else:
+                counterexample.append(True)
+        return True, True, counterexample
+    truepremises = solver.solve(assumptions)
+    falsegoal = solver.solve([negatedgoal])
+    return truepremises, falsegoal, None
@@ -0,0 +1,467 @@
+# search.py
+"""This module searches for natural deduction derivations of a goal from a set of facts.
+
+The search combines two directions.  Forward chaining closes the facts of a scope under the
+rules, axioms, definitions and saved proofs whose premises are all among them, keeping only
+conclusions that are subformulas of the problem so the closure is finite.  Backward search
+then works from the goal: an implication is proved by assuming its antecedent in a new scope
+and proving its consequent, and any other goal by a rule whose conclusion matches it, the
+premises becoming new goals.  Metavariables that only occur in the premises are bound by
+matching those premises against the facts.
+
+The backward search is run with iterative deepening so the shallowest derivation is found
+first.  A transposition table keyed on the scope and the goal keeps the derivations found and
+the deepest depth at which each goal failed, so work is not repeated between or within the
+iterations.  The search stops when it runs out of depth, goals or time.
+
+A derivation is a tuple whose first item is its kind:
+- `("have", formula)` - The formula is a line of the proof or of an enclosing subproof.
+- `("apply", kind, name, subs, derivations, formula)` - The rule `name` of the given kind
+    applied with the substitutions to the lines the derivations of its premises give.
+- `("assume", hypothesis, derivation, formula)` - The implication derived by a subproof
+    starting with the hypothesis and ending with the derivation of the consequent.
+
+The backward steps from the goal can also be divided among a pool of processes, each of which
+compiles the rules once from their text and shares the goals it closes with the others.
+
+It contains the following:
+- `slotsof(node)` - Return the placeholders of a template node.
+- `Search` - A search for derivations within a budget of depth, goals and time.
+- `encode(item)` - Replace the formulas of a derivation by text to send it to another process.
+- `decode(item, dictionary)` - Read the formulas of an encoded derivation.
+- `startworker(tables, dictionary, budget, shared, cancel)` - Build the search of a worker process.
+- `provetask(task)` - Search from one backward step in a worker process.
+- `ParallelSearch` - A search dividing the backward steps from the goal among processes.
+"""
+
+import multiprocessing
+import time
+
+from altrea.wffs import Falsehood, Implies, Wff, postorder
+from altrea.patterns import compilepattern, slotnode, callnode, listnode
+from altrea.discrimination import DiscriminationTree
+from altrea.parser import parseformula
+
+
+def slotsof(node: tuple):
+    """Return the set of the indexes of the placeholders in a template node."""
+
+    slots = set()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node[0] == slotnode:
+            slots.add(node[1])
+        elif node[0] == callnode:
+            stack.extend(node[2])
+            stack.extend(node[3].values())
+        elif node[0] == listnode:
+            stack.extend(node[1])
+    return slots
+
+
+class Search:
+    """A search for derivations using the rules of a logic.
+
+    Parameters:
+        tables: A list of pairs of a kind and a table of rows `(name, pattern, ...)` such as
+            `Proof.premisetables()`.  Of rows with the same pattern only the first is used.
+        dictionary: The dictionary from names to classes the patterns are built with.
+        maxdepth: The deepest the backward search may go.
+        maxnodes: The number of goals that may be searched.
+        timeout: The number of seconds the search may take.
+    """
+
+    def __init__(
+        self,
+        tables: list,
+        dictionary: dict,
+        maxdepth: int = 10,
+        maxnodes: int = 100000,
+        timeout: float = 10.0,
+    ):
+        self.dictionary = dictionary
+        self.maxdepth = maxdepth
+        self.maxnodes = maxnodes
+        self.timeout = timeout
+        self.entries = []
+        self.premisetree = DiscriminationTree()
+        patterns = set()
+        for kind, table in tables:
+            for row in table:
+                if row[1] in patterns:
+                    continue
+                patterns.add(row[1])
+                try:
+                    template = compilepattern(row[1])
+                except ValueError:
+                    continue
+                conclusion = template.conclusion()
+                if conclusion is None:
+                    continue
+                premises = template.premises()
+                for position in range(len(premises)):
+                    self.premisetree.insert(premises[position], (len(self.entries), position))
+                binding = [(i, slotsof(i)) for i in sorted(premises, key=lambda i: i[0] == slotnode)]
+                self.entries.append((kind, row[0], template, conclusion, premises, binding))
+        self.table = {}
+        self.closures = {}
+        self.universe = set()
+        self.nodes = 0
+        self.startnodes = 0
+        self.depth = 0
+        self.deadline = None
+        self.exhausted = False
+
+    def start(self, givens: frozenset, goal):
+        """Clear the tables and set the subformulas and the deadline for a new problem."""
+
+        self.table = {}
+        self.closures = {}
+        self.universe = {Falsehood()}
+        for i in list(givens) + [goal]:
+            self.universe.update(postorder(i))
+        self.deadline = time.time() + self.timeout
+        self.begin()
+
+    def begin(self):
+        """Start a new budget of `maxnodes` goals without clearing the tables.
+
+        `nodes` keeps counting the goals searched over the life of the search.
+        """
+
+        self.startnodes = self.nodes
+        self.exhausted = False
+
+    def prove(self, facts: list, goal):
+        """Return a derivation of the goal from the facts or None if none was found within the budget."""
+
+        givens = frozenset(facts)
+        self.start(givens, goal)
+        for depth in range(self.maxdepth + 1):
+            self.depth = depth
+            derivation = self.search(givens, goal, depth, set())
+            if derivation is not None or self.exhausted:
+                return derivation
+        return None
+
+    def provestep(self, step: tuple, goal):
+        """Return a derivation of the goal that begins with the backward step or None if none was found.
+
+        The new goals of the step are searched with iterative deepening as `prove` does.
+        """
+
+        for depth in range(self.maxdepth):
+            self.depth = depth + 1
+            derivations = []
+            for scope, subgoal in step[-1]:
+                derivation = self.search(scope, subgoal, depth, set())
+                if derivation is None:
+                    break
+                derivations.append(derivation)
+            if len(derivations) == len(step[-1]):
+                return self.combine(step, derivations, goal)
+            if self.exhausted:
+                return None
+        return None
+
+    def spend(self):
+        """Count a goal against the budget and return whether the budget is exhausted."""
+
+        self.nodes += 1
+        if self.nodes % 64 == 0 and (time.time() > self.deadline or self.cancelled()):
+            self.exhausted = True
+        if self.nodes - self.startnodes > self.maxnodes:
+            self.exhausted = True
+        return self.exhausted
+
+    def cancelled(self):
+        """Return whether the search has been cancelled from outside."""
+
+        return False
+
+    def search(self, givens: frozenset, goal, depth: int, path: set):
+        """Return a derivation of the goal in the scope of the givens using at most `depth` backward steps."""
+
+        if self.spend():
+            return None
+        key = (givens, goal)
+        known = self.table.get(key)
+        if isinstance(known, tuple):
+            return known
+        if known is not None and known >= depth:
+            return None
+        closure = self.closure(givens)
+        derivation = closure.get(goal)
+        if derivation is None and depth > 0 and key not in path:
+            derivation = self.recall(key, depth)
+            if derivation is None:
+                path.add(key)
+                derivation = self.backward(givens, closure, goal, depth - 1, path)
+                path.discard(key)
+                if derivation is not None:
+                    self.remember(key, depth, derivation)
+        if derivation is not None:
+            self.table[key] = derivation
+        elif not self.exhausted:
+            self.table[key] = depth
+        return derivation
+
+    def recall(self, key: tuple, depth: int):
+        """Return a derivation of a goal found elsewhere or None.  Only goals in the table are known here."""
+
+        return None
+
+    def remember(self, key: tuple, depth: int, derivation: tuple):
+        """Make a derivation found by a backward step known elsewhere.  The table is enough here."""
+
+        pass
+
+    def backward(self, givens: frozenset, closure: dict, goal, depth: int, path: set):
+        """Return a derivation of the goal by one backward step followed by searches of the new goals."""
+
+        for step in self.steps(givens, closure, goal):
+            if self.exhausted:
+                return None
+            derivations = []
+            for scope, subgoal in step[-1]:
+                derivation = self.search(scope, subgoal, depth, path)
+                if derivation is None:
+                    break
+                derivations.append(derivation)
+            if len(derivations) == len(step[-1]):
+                return self.combine(step, derivations, goal)
+        return None
+
+    def steps(self, givens: frozenset, closure: dict, goal):
+        """Yield the backward steps that reduce the goal to new goals.
+
+        A step is either `("assume", hypothesis, newgoals)` or `("apply", kind, name, subs, newgoals)`
+        where the new goals are a list of pairs of the givens of their scope and the goal.
+        """
+
+        if isinstance(goal, Implies):
+            yield ("assume", goal.left, [(givens | {goal.left}, goal.right)])
+        for kind, name, template, conclusion, premises, binding in self.entries:
+            subs = {}
+            if not template.match(conclusion, goal, subs, self.dictionary):
+                continue
+            for bound in self.bind(template, binding, 0, subs, closure):
+                subslist = [bound.get(i) for i in range(template.slots)]
+                try:
+                    instances = [template.build(i, subslist, self.dictionary) for i in premises]
+                except (NameError, TypeError):
+                    continue
+                yield ("apply", kind, name, subslist, [(givens, i) for i in instances])
+
+    def combine(self, step: tuple, derivations: list, goal):
+        """Return the derivation of the goal by the backward step from the derivations of its new goals."""
+
+        if step[0] == "assume":
+            return ("assume", step[1], derivations[0], goal)
+        return ("apply", step[1], step[2], step[3], derivations, goal)
+
+    def bind(self, template, binding: list, position: int, subs: dict, closure: dict):
+        """Yield the substitutions binding every placeholder of the premises from `position` on.
+
+        The binding is a list of the premises and their placeholders with the premises that are
+        not bare placeholders first, since they are matched by fewer facts.  A premise whose
+        placeholders are all bound is left to the backward search.  Any other is matched against
+        each fact of the closure in turn.
+        """
+
+        if position == len(binding):
+            if all(subs.get(i) is not None for i in range(template.slots)):
+                yield subs
+            return
+        premise, slots = binding[position]
+        if all(i in subs for i in slots):
+            yield from self.bind(template, binding, position + 1, subs, closure)
+            return
+        for fact in list(closure):
+            extended = dict(subs)
+            if template.match(premise, fact, extended, self.dictionary):
+                yield from self.bind(template, binding, position + 1, extended, closure)
+
+    def closure(self, givens: frozenset):
+        """Return the facts that follow from the givens by forward chaining, each with its derivation."""
+
+        closure = self.closures.get(givens)
+        if closure is not None:
+            return closure
+        closure = {i: ("have", i) for i in givens}
+        queue = list(givens)
+        while queue:
+            fact = queue.pop()
+            for index, position in self.premisetree.candidates(fact):
+                kind, name, template, conclusion, premises, binding = self.entries[index]
+                subs = {}
+                if not template.match(premises[position], fact, subs, self.dictionary):
+                    continue
+                for bound, used in self.forward(template, premises, 0, position, fact, subs, closure, []):
+                    subslist = [bound.get(i) for i in range(template.slots)]
+                    if any(i is None for i in subslist):
+                        continue
+                    try:
+                        derived = template.build(conclusion, subslist, self.dictionary)
+                    except (NameError, TypeError):
+                        continue
+                    if derived in self.universe and derived not in closure:
+                        closure[derived] = ("apply", kind, name, subslist, [closure[i] for i in used], derived)
+                        queue.append(derived)
+        self.closures[givens] = closure
+        return closure
+
+    def forward(self, template, premises: tuple, position: int, fixed: int, fact, subs: dict, closure: dict, used: list):
+        """Yield the substitutions and facts matching every premise with the premise at `fixed` already matched by the fact."""
+
+        if position == len(premises):
+            yield subs, used
+        elif position == fixed:
+            yield from self.forward(template, premises, position + 1, fixed, fact, subs, closure, used + [fact])
+        else:
+            for i in list(closure):
+                extended = dict(subs)
+                if template.match(premises[position], i, extended, self.dictionary):
+                    yield from self.forward(template, premises, position + 1, fixed, fact, extended, closure, used + [i])
+
+
+def encode(item):
+    """Return a derivation, step or formula with each formula replaced by its `tree()` text.
+
+    Formulas are sent between processes as text since the propositions of one process are not
+    those of another.  Tuples, lists and frozensets are copied and other items kept.
+    """
+
+    if isinstance(item, Wff):
+        return ("formula", item.tree())
+    elif isinstance(item, (tuple, list, frozenset)):
+        return type(item)(encode(i) for i in item)
+    return item
+
+
+def decode(item, dictionary: dict):
+    """Return the derivation, step or formula that `encode` was given, reading the formulas with the dictionary."""
+
+    if isinstance(item, tuple) and len(item) == 2 and item[0] == "formula":
+        return parseformula(item[1], dictionary)
+    elif isinstance(item, (tuple, list, frozenset)):
+        return type(item)(decode(i, dictionary) for i in item)
+    return item
+
+
+worker = None
+
+
+def startworker(tables: list, dictionary: dict, budget: tuple, deadline: float, shared, cancel):
+    """Build the search of a worker process once from the rows of the tables.
+
+    The rows are passed as text, so a worker compiles them without reading the database.
+    """
+
+    global worker
+    worker = ParallelSearch(tables, dictionary, *budget)
+    worker.enddeadline = deadline
+    worker.shared = shared
+    worker.cancel = cancel
+
+
+def provetask(task: tuple):
+    """Search for a derivation beginning with one backward step in a worker process.
+
+    The transposition table of the worker is kept from one task to the next of the same problem,
+    while each task is given its own budget of `maxnodes` goals.  Returns the encoded derivation
+    or None, the number of goals searched and the depth reached.
+    """
+
+    facts, goal, step = decode(task, worker.dictionary)
+    problem = (frozenset(facts), goal)
+    nodes = worker.nodes
+    if worker.problem != problem:
+        worker.start(*problem)
+        worker.problem = problem
+    else:
+        worker.begin()
+    worker.deadline = worker.enddeadline
+    derivation = worker.provestep(step, goal)
+    if derivation is not None:
+        worker.cancel.set()
+    return encode(derivation), worker.nodes - nodes, worker.depth
+
+
+class ParallelSearch(Search):
+    """A search that divides the backward steps from the goal among a pool of processes.
+
+    The steps are handed out one at a time, so a process that finishes takes the next step left.
+    Goals closed by a backward step at a depth of at least `shareddepth` are kept in a dictionary
+    shared by the processes, so each is proved once.  When one process finds a derivation the
+    others are cancelled.
+
+    Parameters:
+        processes: The number of processes.  The other parameters are those of `Search`.
+    """
+
+    shareddepth = 2
+
+    def __init__(
+        self,
+        tables: list,
+        dictionary: dict,
+        maxdepth: int = 10,
+        maxnodes: int = 100000,
+        timeout: float = 10.0,
+        processes: int = 2,
+    ):
+        self.rows = [(kind, [(row[0], row[1]) for row in table]) for kind, table in tables]
+        super().__init__(self.rows, dictionary, maxdepth, maxnodes, timeout)
+        self.processes = processes
+        self.problem = None
+        self.enddeadline = None
+        self.shared = None
+        self.cancel = None
+
+    def cancelled(self):
+        return self.cancel is not None and self.cancel.is_set()
+
+    def sharedkey(self, key: tuple):
+        return (tuple(sorted(i.tree() for i in key[0])), key[1].tree())
+
+    def recall(self, key: tuple, depth: int):
+        if self.shared is None or depth < self.shareddepth:
+            return None
+        found = self.shared.get(self.sharedkey(key))
+        return None if found is None else decode(found, self.dictionary)
+
+    def remember(self, key: tuple, depth: int, derivation: tuple):
+        if self.shared is not None and depth >= self.shareddepth:
+            self.shared.setdefault(self.sharedkey(key), encode(derivation))
+
+    def prove(self, facts: list, goal):
+        """Return a derivation of the goal from the facts found by the pool or None."""
+
+        givens = frozenset(facts)
+        self.start(givens, goal)
+        closure = self.closure(givens)
+        if goal in closure:
+            self.depth = 0
+            return closure[goal]
+        tasks = [encode((list(givens), goal, i)) for i in self.steps(givens, closure, goal)]
+        self.depth = 1
+        if len(tasks) == 0:
+            return None
+        budget = (self.maxdepth, self.maxnodes, self.timeout)
+        with multiprocessing.Manager() as manager:
+            shared = manager.dict()
+            cancel = manager.Event()
+            with multiprocessing.Pool(
+                min(self.processes, len(tasks)),
+                initializer=startworker,
+                initargs=(self.rows, self.dictionary, budget, self.deadline, shared, cancel),
+            ) as pool:
+                for derivation, nodes, depth in pool.imap_unordered(provetask, tasks):
+                    self.nodes += nodes
+                    self.depth = max(self.depth, depth)
+                    if derivation is not None:
+                        cancel.set()
+                        return decode(derivation, self.dictionary)
+        return None
@@ -0,0 +1,186 @@
+# syllogisms.py
+"""This module decides the validity of categorical syllogisms by looking up their form.
+
+A syllogism has a major premise containing the major term P, a minor premise containing the
+minor term S, both containing the middle term M, and the conclusion "S ... P".  Its form is the
+mood, the letters A, E, I or O of the major premise, minor premise and conclusion, followed by
+the figure, which is where the middle term stands:
+
+- 1: M-P, S-M
+- 2: P-M, S-M
+- 3: M-P, M-S
+- 4: P-M, M-S
+
+The three terms divide a Venn diagram into eight regions, numbered by the bits 1 for S, 2 for P
+and 4 for M.  A model says which of the regions have members, so there are 256 models, and a
+set of models is a 256 bit integer.  A universal proposition is true in the models in which
+the regions it empties have no members and a particular one in the models in which some region
+it marks has a member.  A form is valid when no model makes the premises true and the
+conclusion false.  With existential import only the models in which S, P and M each have a
+member are counted.
+
+The verdicts of all 4 x 4 x 4 x 4 = 256 forms are computed once when the module is imported, so
+checking a syllogism is a lookup in a table.
+
+It contains the following:
+- `letters` - The letters of the propositions in the order of the table.
+- `formindex(mood, figure)` - Return the position of a form in the tables.
+- `booleantable`, `aristoteliantable` - The validity of each form without and with existential import.
+- `validforms(existentialimport)` - Return the names of the valid forms.
+- `letter(proposition)` - Return the letter A, E, I or O of a categorical proposition.
+- `Syllogism` - A syllogism built from the propositions of `altrea.categories`.
+- `checksyllogism(major, minor, conclusion, existentialimport)` - Check whether a syllogism is valid.
+"""
+
+from altrea.categories import Categorical
+
+letters = "AEIO"
+
+minorbit = 1
+majorbit = 2
+middlebit = 4
+
+# The bits of the subject and predicate terms of the major and minor premises in each figure.
+figures = {
+    1: ((middlebit, majorbit), (minorbit, middlebit)),
+    2: ((majorbit, middlebit), (minorbit, middlebit)),
+    3: ((middlebit, majorbit), (middlebit, minorbit)),
+    4: ((majorbit, middlebit), (middlebit, minorbit)),
+}
+
+
+def regions(subjectbit: int, predicatebit: int, predicateinside: bool):
+    """Return the bit mask of the regions inside the subject and inside, or outside, the predicate."""
+
+    mask = 0
+    for region in range(8):
+        if region & subjectbit and bool(region & predicatebit) == predicateinside:
+            mask |= 1 << region
+    return mask
+
+
+def models(letter: str, subjectbit: int, predicatebit: int):
+    """Return the set of models, as a 256 bit integer, in which a proposition is true."""
+
+    if letter in "AO":
+        mask = regions(subjectbit, predicatebit, False)
+    else:
+        mask = regions(subjectbit, predicatebit, True)
+    universal = letter in "AE"
+    result = 0
+    for model in range(256):
+        if (model & mask == 0) == universal:
+            result |= 1 << model
+    return result
+
+
+def formindex(mood: str, figure: int):
+    """Return the position in the tables of the form with the mood, such as "AAA", and the figure."""
+
+    index = 0
+    for i in mood:
+        index = 4 * index + letters.index(i)
+    return 4 * index + figure - 1
+
+
+def buildtable(existentialimport: bool):
+    """Return the validity of each form in the order of `formindex`."""
+
+    counted = (1 << 256) - 1
+    if existentialimport:
+        counted = 0
+        for model in range(256):
+            if all(model & regions(i, i, True) for i in (minorbit, majorbit, middlebit)):
+                counted |= 1 << model
+    table = []
+    for major in letters:
+        for minor in letters:
+            for conclusion in letters:
+                falseconclusion = ~models(conclusion, minorbit, majorbit)
+                for figure in range(1, 5):
+                    (majorsubject, majorpredicate), (minorsubject, minorpredicate) = figures[figure]
+                    counterexamples = counted & falseconclusion
+                    counterexamples &= models(major, majorsubject, majorpredicate)
+                    counterexamples &= models(minor, minorsubject, minorpredicate)
+                    table.append(counterexamples == 0)
+    return tuple(table)
+
+
+booleantable = buildtable(False)
+aristoteliantable = buildtable(True)
+
+
+def validforms(existentialimport: bool = False):
+    """Return the names, such as "AAA-1", of the valid forms in the order of the table."""
+
+    table = aristoteliantable if existentialimport else booleantable
+    names = []
+    for major in letters:
+        for minor in letters:
+            for conclusion in letters:
+                for figure in range(1, 5):
+                    mood = "".join([major, minor, conclusion])
+                    if table[formindex(mood, figure)]:
+                        names.append(f"{mood}-{figure}")
+    return names
+
+
+class Syllogism:
+    """A categorical syllogism.
+
+    Terms are matched by their names.  The major term is the predicate term of the conclusion,
+    the minor term its subject term and the middle term the other term of the major premise.
+
+    Parameters:
+        major: The premise containing the major term.
+        minor: The premise containing the minor term.
+        conclusion: The conclusion.
+    """
+
+    def __init__(self, major: Categorical, minor: Categorical, conclusion: Categorical):
+        self.major = major
+        self.minor = minor
+        self.conclusion = conclusion
+        self.minorterm = conclusion.subjectterm.name
+        self.majorterm = conclusion.predicateterm.name
+        if self.minorterm == self.majorterm:
+            raise ValueError(f'The conclusion "{conclusion}" has the same subject and predicate term.')
+        majorterms = (major.subjectterm.name, major.predicateterm.name)
+        minorterms = (minor.subjectterm.name, minor.predicateterm.name)
+        if self.majorterm not in majorterms:
+            raise ValueError(f'The major premise "{major}" does not contain the major term {self.majorterm}.')
+        self.middleterm = majorterms[1] if majorterms[0] == self.majorterm else majorterms[0]
+        if self.middleterm in (self.majorterm, self.minorterm):
+            raise ValueError(f'The major premise "{major}" has no middle term.')
+        if sorted(minorterms) != sorted((self.minorterm, self.middleterm)):
+            raise ValueError(f'The minor premise "{minor}" does not contain the terms {self.minorterm} and {self.middleterm}.')
+        self.mood = "".join([letter(major), letter(minor), letter(conclusion)])
+        middlefirst = (majorterms[0] == self.middleterm, minorterms[0] == self.middleterm)
+        self.figure = {(True, False): 1, (False, False): 2, (True, True): 3, (False, True): 4}[middlefirst]
+        self.form = f"{self.mood}-{self.figure}"
+        self.index = formindex(self.mood, self.figure)
+
+    def __str__(self):
+        return "\n".join([str(self.major), str(self.minor), str(self.conclusion)])
+
+    def valid(self, existentialimport: bool = False):
+        """Check whether the form of the syllogism is valid, with existential import if asked."""
+
+        if existentialimport:
+            return aristoteliantable[self.index]
+        return booleantable[self.index]
+
+
+def letter(proposition: Categorical):
+    """Return the letter A, E, I or O of a categorical proposition."""
+
+    value = getattr(proposition, "letter", None)
+    if not isinstance(value, str) or len(value) != 1 or value not in letters:
+        raise ValueError(f'The proposition "{proposition}" is not an A, E, I or O proposition.')
+    return proposition.letter
+
+
+def checksyllogism(major: Categorical, minor: Categorical, conclusion: Categorical, existentialimport: bool = False):
+    """Check whether the syllogism with the premises and conclusion is valid."""
+
+    return Syllogism(major, minor, conclusion).valid(existentialimport)
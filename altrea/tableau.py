@@ -0,0 +1,336 @@
+# tableau.py
+"""This module decides modal satisfiability and entailment with a labelled tableau.
+
+The formulas are put in negation normal form by `altrea.normalforms`, so `StrictImplies`,
+`StrictIff` and `ConsistentWith` become `Necessary` and `Possibly` of truth functional
+formulas.  Each world of the tableau is labelled by a set of formulas.  The `And` and `Or`
+formulas of a label are expanded, `Or` by trying its left and then its right formula, until
+only literals, `Necessary` and `Possibly` formulas remain or a formula and its negation meet.
+Each `Possibly(A)` of an open label then needs a successor world labelled by `A` and the
+formulas which the frame class carries along the accessibility relation:
+
+- K: the operand of each `Necessary` formula.
+- T: as K and each `Necessary(A)` also gives `A` at its own world.
+- S4: as T and each `Necessary` formula is carried along as well.
+
+In S4 a successor whose label is contained in the label of itself or a world it is reached
+from is not expanded again but made accessible to that world, which keeps the tableau
+finite.  In S5 every world is accessible from every other, so the worlds are kept together
+on one branch: each `Necessary(A)` gives `A` at every world and each distinct `Possibly(A)`
+one new world where `A` holds.
+
+A label found to be unsatisfiable is remembered so it is not expanded again.  A satisfiable
+label is remembered with its world unless the world was only found by blocking on a world it
+is reached from.  When the root world is open the worlds form a `altrea.kripke.KripkeModel` whose
+world 0 satisfies the formulas.
+
+Worlds are expanded with an explicit stack, so the depth of the tableau is limited only by
+memory.
+
+It contains the following:
+- `frame_k`, `frame_t`, `frame_s4`, `frame_s5` - The names of the frame classes.
+- `Tableau` - A tableau prover for one frame class.
+- `countermodel(premises, goal, frame)` - Return a model in which the premises hold and the goal fails.
+"""
+
+import numpy
+
+from altrea.wffs import And, Or, Not, Necessary, Possibly, Falsehood, Truth, Wff
+from altrea.normalforms import NormalForms
+from altrea.kripke import KripkeModel
+
+frame_k = "K"
+frame_t = "T"
+frame_s4 = "S4"
+frame_s5 = "S5"
+
+frames = (frame_k, frame_t, frame_s4, frame_s5)
+
+
+class Expansion:
+    """A world of the tableau being expanded.
+
+    `branches` yields the open expansions of the label, `branch` is the one being tried, `world`
+    its number, `diamonds` its `Possibly` formulas and `successors` the worlds found so far for
+    them.  `dependency` is the depth of the highest world made accessible by blocking from this
+    world or the worlds below it, which is its own depth when it does not depend on the worlds
+    it is reached from.
+    """
+
+    def __init__(self, label: tuple, branches, parent):
+        self.label = label
+        self.branches = branches
+        self.parent = parent
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.dependency = self.depth
+        self.branch = None
+        self.world = None
+        self.diamonds = []
+        self.successors = []
+
+
+class Tableau:
+    """A labelled tableau prover for the frame class K, T, S4 or S5.
+
+    The labels, worlds and remembered results are kept between calls, so formulas sharing
+    subformulas are best decided by one tableau.  After `satisfiable` returns True, `model`
+    is a Kripke model whose world 0 satisfies the formulas.
+    """
+
+    def __init__(self, frame: str = frame_k):
+        if frame not in frames:
+            raise ValueError(f'The frame class "{frame}" is not one of {", ".join(frames)}.')
+        self.frame = frame
+        self.normalforms = NormalForms()
+        self.labels = []
+        self.edges = []
+        self.unsatisfiable = set()
+        self.satisfied = {}
+        self.model = None
+
+    def branches(self, label: tuple):
+        """Yield the expansions of a label which do not contain a formula and its negation.
+
+        An expansion is a dictionary whose keys are its formulas in the order they were added.
+        """
+
+        reflexive = self.frame != frame_k
+        falsehood = self.normalforms.falsehood
+        complement = self.normalforms.complement
+        stack = [({}, list(reversed(label)))]
+        while stack:
+            done, todo = stack.pop()
+            closed = False
+            while todo:
+                formula = todo.pop()
+                if formula in done:
+                    continue
+                if formula is falsehood or complement(formula) in done:
+                    closed = True
+                    break
+                done[formula] = True
+                if isinstance(formula, And):
+                    todo.append(formula.right)
+                    todo.append(formula.left)
+                elif isinstance(formula, Or):
+                    stack.append((dict(done), todo + [formula.right]))
+                    todo.append(formula.left)
+                elif reflexive and isinstance(formula, Necessary):
+                    todo.append(formula.wff)
+            if not closed:
+                yield done
+
+    def successor(self, branch: dict, diamond: Possibly):
+        """Return the label of the world needed for a `Possibly` formula of an open expansion."""
+
+        label = {diamond.wff: True}
+        for i in branch:
+            if isinstance(i, Necessary):
+                label[i.wff] = True
+                if self.frame == frame_s4:
+                    label[i] = True
+        return tuple(label)
+
+    def blocking(self, expansion: Expansion, label: tuple):
+        """Return the expansion or one it is reached from whose branch contains the label in S4."""
+
+        if self.frame == frame_s4:
+            while expansion is not None:
+                if all(i in expansion.branch for i in label):
+                    return expansion
+                expansion = expansion.parent
+        return None
+
+    def expand(self, label: tuple):
+        """Return the world satisfying the label in K, T or S4 or None if it is unsatisfiable."""
+
+        key = frozenset(label)
+        if key in self.unsatisfiable:
+            return None
+        elif key in self.satisfied:
+            return self.satisfied[key]
+        stack = [Expansion(label, self.branches(label), None)]
+        result = None
+        returned = None
+        while stack:
+            expansion = stack[-1]
+            if returned is not None:
+                if result is None:
+                    expansion.branch = None
+                else:
+                    expansion.successors.append(result)
+                    expansion.dependency = min(expansion.dependency, returned.dependency)
+                returned = None
+            if expansion.branch is None:
+                expansion.branch = next(expansion.branches, None)
+                if expansion.branch is None:
+                    self.unsatisfiable.add(frozenset(expansion.label))
+                    stack.pop()
+                    result, returned = None, expansion
+                    continue
+                expansion.world = len(self.labels)
+                self.labels.append(expansion.branch)
+                expansion.diamonds = [i for i in expansion.branch if isinstance(i, Possibly)]
+                expansion.successors = []
+                expansion.dependency = expansion.depth
+            if len(expansion.successors) == len(expansion.diamonds):
+                self.edges.extend((expansion.world, i) for i in expansion.successors)
+                if expansion.dependency >= expansion.depth:
+                    self.satisfied[frozenset(expansion.label)] = expansion.world
+                stack.pop()
+                result, returned = expansion.world, expansion
+                continue
+            label = self.successor(expansion.branch, expansion.diamonds[len(expansion.successors)])
+            key = frozenset(label)
+            if key in self.unsatisfiable:
+                expansion.branch = None
+            elif key in self.satisfied:
+                expansion.successors.append(self.satisfied[key])
+            else:
+                blocked = self.blocking(expansion, label)
+                if blocked is None:
+                    stack.append(Expansion(label, self.branches(label), expansion))
+                else:
+                    expansion.successors.append(blocked.world)
+                    expansion.dependency = min(expansion.dependency, blocked.depth)
+        return result
+
+    def cluster(self, label: tuple):
+        """Return the labels of the worlds of an S5 model whose first world satisfies the label, or None.
+
+        A branch holds the formulas of every world, the operands of its `Necessary` formulas and
+        its `Possibly` formulas which already have a world.  Choosing between the formulas of an
+        `Or` copies the whole branch.
+        """
+
+        if frozenset(label) in self.unsatisfiable:
+            return None
+        falsehood = self.normalforms.falsehood
+        complement = self.normalforms.complement
+        stack = [([{}], {}, set(), [(0, i) for i in reversed(label)])]
+        while stack:
+            worlds, boxes, witnessed, todo = stack.pop()
+            closed = False
+            while todo:
+                world, formula = todo.pop()
+                done = worlds[world]
+                if formula in done:
+                    continue
+                if formula is falsehood or complement(formula) in done:
+                    closed = True
+                    break
+                done[formula] = True
+                if isinstance(formula, And):
+                    todo.append((world, formula.right))
+                    todo.append((world, formula.left))
+                elif isinstance(formula, Or):
+                    copied = [dict(i) for i in worlds]
+                    stack.append((copied, dict(boxes), set(witnessed), todo + [(world, formula.right)]))
+                    todo.append((world, formula.left))
+                elif isinstance(formula, Necessary) and formula.wff not in boxes:
+                    boxes[formula.wff] = True
+                    todo.extend((i, formula.wff) for i in range(len(worlds)))
+                elif isinstance(formula, Possibly) and formula.wff not in witnessed:
+                    witnessed.add(formula.wff)
+                    worlds.append({})
+                    todo.append((len(worlds) - 1, formula.wff))
+                    todo.extend((len(worlds) - 1, i) for i in boxes)
+            if not closed:
+                return worlds
+        self.unsatisfiable.add(frozenset(label))
+        return None
+
+    def satisfiable(self, formulas: list):
+        """Check whether the formulas are true together at some world of a model of the frame class."""
+
+        label = tuple(dict.fromkeys(self.normalforms.nnf(i) for i in formulas))
+        if self.frame == frame_s5:
+            labels = self.cluster(label)
+            if labels is None:
+                self.model = None
+                return False
+            relation = numpy.ones((len(labels), len(labels)), dtype=bool)
+            self.model = KripkeModel(relation, self.valuation(formulas, labels))
+            return True
+        root = self.expand(label)
+        if root is None:
+            self.model = None
+            return False
+        self.model = self.modelfrom(root, formulas)
+        return True
+
+    def modelfrom(self, root: int, formulas: list):
+        """Return the Kripke model of the worlds reached from the root, the root becoming world 0."""
+
+        successors = {}
+        for i, j in self.edges:
+            successors.setdefault(i, []).append(j)
+        numbers = {root: 0}
+        order = [root]
+        for i in order:
+            for j in successors.get(i, ()):
+                if j not in numbers:
+                    numbers[j] = len(order)
+                    order.append(j)
+        relation = numpy.zeros((len(order), len(order)), dtype=bool)
+        for i in order:
+            for j in successors.get(i, ()):
+                relation[numbers[i], numbers[j]] = True
+        if self.frame != frame_k:
+            numpy.fill_diagonal(relation, True)
+        if self.frame == frame_s4:
+            closure = relation.astype(numpy.float32)
+            while True:
+                wider = (closure @ closure) > 0
+                if (wider == (closure > 0)).all():
+                    break
+                closure = wider.astype(numpy.float32)
+            relation = closure > 0
+        return KripkeModel(relation, self.valuation(formulas, [self.labels[i] for i in order]))
+
+    def valuation(self, formulas: list, labels: list):
+        """Return the worlds at which each letter of the formulas is true, a letter being true where it is in the label."""
+
+        return {i: numpy.array([i in j for j in labels], dtype=bool) for i in self.letters(formulas)}
+
+    def letters(self, formulas: list):
+        """Return the distinct letters of the formulas in the order they are met."""
+
+        letters = []
+        seen = set()
+        stack = list(reversed(formulas))
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            children = node.children()
+            if len(children) == 0:
+                if not isinstance(node, (Falsehood, Truth)):
+                    letters.append(node)
+            else:
+                stack.extend(reversed(children))
+        return letters
+
+    def countermodel(self, premises: list, goal: Wff):
+        """Return a model whose world 0 makes the premises true and the goal false, or None if there is none."""
+
+        if self.satisfiable(premises + [Not(goal)]):
+            return self.model
+        return None
+
+    def entails(self, premises: list, goal: Wff):
+        """Check whether the goal is true at every world of every model of the frame class where the premises are."""
+
+        return self.countermodel(premises, goal) is None
+
+    def valid(self, formula: Wff):
+        """Check whether the formula is true at every world of every model of the frame class."""
+
+        return self.entails([], formula)
+
+
+def countermodel(premises: list, goal: Wff, frame: str = frame_k):
+    """Return a model of the frame class whose world 0 makes the premises true and the goal false, or None."""
+
+    return Tableau(frame).countermodel(premises, goal)
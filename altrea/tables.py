@@ -0,0 +1,129 @@
+# tables.py
+"""This module provides the indexed tables holding the rules, axioms and definitions of a logic.
+
+Each row of a table is a sequence `(name, pattern, displayname, description)` as returned
+by `altrea.data`.  A table is still a list, so rows can be iterated over and accessed by
+position as before, but rows are also found by name, by display name or by the main connective
+of the conclusion without scanning the list.  The indexes are kept up to date as rows are added
+or removed.
+
+It contains the following:
+- `mainconnective(pattern)` - Return the name of the main connective of the conclusion of a pattern.
+- `RuleTable` - A list of rows indexed by name, display name and main connective.
+"""
+
+from altrea.patterns import compilepattern, callnode
+
+
+def mainconnective(pattern: str):
+    """Return the name of the main connective of the conclusion of a pattern.
+
+    For a pattern such as "ConclusionPremises(And({0}, {1}), [{0}, {1}])" this is "And".  If the
+    conclusion is a placeholder or the pattern cannot be read the result is None.
+    """
+
+    try:
+        root = compilepattern(pattern).root
+    except ValueError:
+        return None
+    if root[0] == callnode and root[1] == "ConclusionPremises" and len(root[2]) > 0:
+        root = root[2][0]
+    if root[0] == callnode:
+        return root[1]
+    return None
+
+
+class RuleTable(list):
+    """A list of rules, axioms or definitions indexed by name, display name and main connective.
+
+    Where several rows have the same name or display name the first one is found, as a scan
+    of the list would find it.  The version is increased each time the rows change so that
+    indexes built elsewhere from the rows can tell when they are out of date.
+    """
+
+    def __init__(self, rows=()):
+        super().__init__(rows)
+        self.version = 0
+        self.reindex()
+
+    def reindex(self):
+        """Rebuild the indexes from the rows."""
+
+        self.version += 1
+        self.names = {}
+        self.displaynames = {}
+        self.connectives = {}
+        for i in self:
+            self.addindex(i)
+
+    def addindex(self, row):
+        self.names.setdefault(row[0], row)
+        self.displaynames.setdefault(row[2], row)
+        self.connectives.setdefault(mainconnective(row[1]), []).append(row)
+
+    def find(self, name: str):
+        """Return the row with this name or None if there is none."""
+
+        return self.names.get(name)
+
+    def finddisplayname(self, displayname: str):
+        """Return the row with this display name or None if there is none."""
+
+        return self.displaynames.get(displayname)
+
+    def findconnective(self, connective):
+        """Return the rows whose conclusion has this main connective.
+
+        Rows whose conclusion is a placeholder are found with the connective None.
+        """
+
+        return list(self.connectives.get(connective, []))
+
+    def append(self, row):
+        super().append(row)
+        self.version += 1
+        self.addindex(row)
+
+    def extend(self, rows):
+        super().extend(rows)
+        self.reindex()
+
+    def insert(self, index, row):
+        super().insert(index, row)
+        self.reindex()
+
+    def pop(self, index=-1):
+        row = super().pop(index)
+        self.reindex()
+        return row
+
+    def remove(self, row):
+        super().remove(row)
+        self.reindex()
+
+    def clear(self):
+        super().clear()
+        self.reindex()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self.reindex()
+
+    def reverse(self):
+        super().reverse()
+        self.reindex()
+
+    def copy(self):
+        return RuleTable(self)
+
+    def __setitem__(self, index, row):
+        super().__setitem__(index, row)
+        self.reindex()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self.reindex()
+
+    def __iadd__(self, rows):
+        self.extend(rows)
+        return self
@@ -0,0 +1,310 @@
+# truthtables.py
+"""This module evaluates well formed formulas over every row of a truth table at once.
+
+The formulas are compiled into a program of NumPy array operations.  A row of the table
+is identified by its index whose bits, read from the most significant, are the values of
+the letters with a 0 bit standing for True.  This is the same order in which
+`Proof.truthtable` lists its rows.  The rows are evaluated in chunks so that memory stays
+bounded however many letters there are.
+
+It contains the following:
+- `Program` - Formulas compiled into array operations with common subformulas shared.
+- `MultivalueProgram` - Formulas compiled into lookup tables for three truth values.
+- `assignments(letters, start, stop)` - The letter values for a range of rows.
+- `multivalueassignments(letters, start, stop)` - The three valued letter codes for a range of rows.
+- `summarize(premises, goal, letters)` - Counts for the summary row of a truth table.
+- `findcounterexample(premises, goal, letters)` - The first row that makes the argument invalid.
+- `assignment(row, letters)` - The letter values in one row.
+"""
+
+import numpy
+
+from altrea.wffs import (
+    And,
+    Or,
+    Not,
+    Implies,
+    Iff,
+    Necessary,
+    Possibly,
+    Falsehood,
+    Truth,
+    ConsistentWith,
+    StrictIff,
+    StrictImplies,
+    Wff,
+)
+
+chunksize = 2**16
+
+letterop = 0
+constantop = 1
+notop = 2
+andop = 3
+orop = 4
+impliesop = 5
+iffop = 6
+
+binaryops = {
+    And: andop,
+    ConsistentWith: andop,
+    Or: orop,
+    Implies: impliesop,
+    StrictImplies: impliesop,
+    Iff: iffop,
+    StrictIff: iffop,
+}
+
+
+class Program:
+    """A list of array operations computing the values of several formulas.
+
+    Each instruction stores its result in the register with the same position so that a
+    subformula shared by several formulas, or appearing twice in one, is computed once.
+
+    Parameters:
+        formulas: The well formed formulas to compile.
+        letters: The letters in the order of the columns of the table.  A letter that is
+            not in this list is treated as a constant with its current value.
+    """
+
+    def __init__(self, formulas: list, letters: list):
+        self.letters = letters
+        self.positions = {id(j): i for i, j in enumerate(letters)}
+        self.instructions = []
+        self.registers = {}
+        self.outputs = [self.compile(i) for i in formulas]
+
+    def compile(self, formula: Wff):
+        stack = [(formula, False)]
+        while len(stack) > 0:
+            node, expanded = stack.pop()
+            if id(node) in self.registers:
+                continue
+            children = self.operands(node)
+            if isinstance(node, Necessary) and expanded:
+                self.registers[id(node)] = self.registers[id(node.wff)]
+            elif expanded or len(children) == 0:
+                self.registers[id(node)] = len(self.instructions)
+                self.instructions.append(self.instruction(node, [self.registers[id(i)] for i in children]))
+            else:
+                stack.append((node, True))
+                for i in reversed(children):
+                    stack.append((i, False))
+        return self.registers[id(formula)]
+
+    def operands(self, node: Wff):
+        if id(node) in self.positions:
+            return ()
+        elif type(node) in binaryops:
+            return (node.left, node.right)
+        elif isinstance(node, Not):
+            return (node.negated,)
+        elif isinstance(node, Necessary):
+            return (node.wff,)
+        else:
+            return ()
+
+    def instruction(self, node: Wff, registers: list):
+        if id(node) in self.positions:
+            return (letterop, self.positions[id(node)])
+        elif type(node) in binaryops:
+            return (binaryops[type(node)], registers[0], registers[1])
+        elif isinstance(node, Not):
+            return (notop, registers[0])
+        elif isinstance(node, (Possibly, Truth)):
+            return (constantop, True)
+        elif isinstance(node, Falsehood):
+            return (constantop, False)
+        elif type(node).subformulas == () and hasattr(node, 'name'):
+            return (constantop, bool(node.getvalue()))
+        else:
+            raise ValueError(f'The formula "{node}" cannot be evaluated in a truth table.')
+
+    def run(self, start: int, stop: int):
+        """Return the values of the compiled formulas for the rows from start up to stop."""
+
+        columns = assignments(len(self.letters), start, stop)
+        rows = stop - start
+        values = []
+        for i in self.instructions:
+            op = i[0]
+            if op == letterop:
+                values.append(columns[i[1]])
+            elif op == constantop:
+                values.append(numpy.full(rows, i[1]))
+            elif op == notop:
+                values.append(~values[i[1]])
+            elif op == andop:
+                values.append(values[i[1]] & values[i[2]])
+            elif op == orop:
+                values.append(values[i[1]] | values[i[2]])
+            elif op == impliesop:
+                values.append(~values[i[1]] | values[i[2]])
+            else:
+                values.append(values[i[1]] == values[i[2]])
+        return [values[i] for i in self.outputs]
+
+
+class MultivalueProgram(Program):
+    """The program for the three valued tables of `Proof.multivaluetruthtable`.
+
+    The values False, (True, False) and True are coded as 0, 1 and 2 and each connective
+    is a lookup table indexed by the codes of its operands.  The tables give the same
+    results as the `getmultivalue` methods of the classes in `altrea.wffs`.
+    """
+
+    tables = {
+        notop: numpy.array([2, 1, 0], dtype=numpy.uint8),
+        andop: numpy.array([[0, 0, 0], [0, 1, 1], [0, 1, 2]], dtype=numpy.uint8),
+        orop: numpy.array([[0, 1, 2], [1, 1, 2], [2, 2, 2]], dtype=numpy.uint8),
+        impliesop: numpy.array([[2, 2, 2], [1, 1, 2], [0, 1, 2]], dtype=numpy.uint8),
+    }
+    multivalueops = {
+        And: andop,
+        ConsistentWith: andop,
+        Or: orop,
+        Implies: impliesop,
+        StrictImplies: impliesop,
+        Iff: andop,
+        StrictIff: andop,
+    }
+
+    def instruction(self, node: Wff, registers: list):
+        if id(node) in self.positions:
+            return (letterop, self.positions[id(node)])
+        elif type(node) in self.multivalueops:
+            return (self.multivalueops[type(node)], registers[0], registers[1])
+        elif isinstance(node, Not):
+            return (notop, registers[0])
+        elif isinstance(node, (Possibly, Truth)):
+            return (constantop, 2)
+        elif isinstance(node, Falsehood):
+            return (constantop, 0)
+        elif type(node).subformulas == () and hasattr(node, 'name'):
+            return (constantop, code(node.getmultivalue()))
+        else:
+            raise ValueError(f'The formula "{node}" cannot be evaluated in a truth table.')
+
+    def run(self, start: int, stop: int):
+        """Return the codes of the values of the compiled formulas for the rows from start up to stop."""
+
+        columns = multivalueassignments(len(self.letters), start, stop)
+        values = []
+        for i in self.instructions:
+            op = i[0]
+            if op == letterop:
+                values.append(columns[i[1]])
+            elif op == constantop:
+                values.append(numpy.full(stop - start, i[1], dtype=numpy.uint8))
+            elif op == notop:
+                values.append(self.tables[notop][values[i[1]]])
+            else:
+                values.append(self.tables[op][values[i[1]], values[i[2]]])
+        return [values[i] for i in self.outputs]
+
+
+def code(value):
+    """Return the code 0, 1 or 2 of the value False, (True, False) or True."""
+
+    if value == (True, False):
+        return 1
+    elif value:
+        return 2
+    else:
+        return 0
+
+
+multivalues = [False, (True, False), True]
+
+
+def multivalueassignments(letters: int, start: int, stop: int):
+    """Return the codes of the values of each letter for the rows from start up to stop.
+
+    The digits of the row index in base 3 give the values with the digits 0, 1 and 2
+    standing for True, (True, False) and False so the first row has every letter True.
+    """
+
+    rows = numpy.arange(start, stop, dtype=numpy.int64)
+    return [(2 - (rows // 3 ** (letters - 1 - n)) % 3).astype(numpy.uint8) for n in range(letters)]
+
+
+def assignments(letters: int, start: int, stop: int):
+    """Return the values of each letter for the rows from start up to stop.
+
+    The row index holds the assignment packed into its bits.  Letter n is True when
+    bit letters - 1 - n of the index is 0 so the first row has every letter True.
+    """
+
+    rows = numpy.arange(start, stop, dtype=numpy.uint64)
+    return [((rows >> numpy.uint64(letters - 1 - n)) & numpy.uint64(1)) == 0 for n in range(letters)]
+
+
+def summarize(premises: list, goal: Wff, letters: list):
+    """Evaluate the premises and goal over every row without building the table.
+
+    Returns the number of rows where all of the premises are true, the number of rows
+    where the goal is false and the number of rows where the premises are true and the
+    goal is false.  These decide the status in the summary row of the table.
+    """
+
+    program = Program(premises + [goal], letters)
+    total = 2 ** len(letters)
+    counttruepremises = 0
+    countfalsegoal = 0
+    countcounterexamples = 0
+    for start in range(0, total, chunksize):
+        stop = min(start + chunksize, total)
+        values = program.run(start, stop)
+        premisesvalues = numpy.ones(stop - start, dtype=bool)
+        for i in values[:-1]:
+            premisesvalues &= i
+        counttruepremises += int(premisesvalues.sum())
+        countfalsegoal += int((~values[-1]).sum())
+        countcounterexamples += int((premisesvalues & ~values[-1]).sum())
+    return counttruepremises, countfalsegoal, countcounterexamples
+
+
+def findcounterexample(premises: list, goal: Wff, letters: list):
+    """Look for a row where the premises are true and the goal is false, stopping at the first.
+
+    Only the letters that occur in the premises or goal are enumerated.  The chunks
+    start small and double in size so that an early counterexample is found after
+    evaluating only a few rows.  Returns whether some row makes all of the premises true,
+    whether some row makes the goal false and the values of the letters in the first
+    counterexample, with the letters that do not occur set to True, or None if there is
+    no counterexample.  When a counterexample is found the first two values only cover
+    the rows evaluated up to then.
+    """
+
+    program = Program(premises + [goal], letters)
+    occurring = sorted(i[1] for i in program.instructions if i[0] == letterop)
+    program = Program(premises + [goal], [letters[i] for i in occurring])
+    total = 2 ** len(occurring)
+    truepremises = False
+    falsegoal = False
+    size = min(256, chunksize)
+    start = 0
+    while start < total:
+        stop = min(start + size, total)
+        values = program.run(start, stop)
+        premisesvalues = numpy.ones(stop - start, dtype=bool)
+        for i in values[:-1]:
+            premisesvalues &= i
+        truepremises = truepremises or bool(premisesvalues.any())
+        falsegoal = falsegoal or not bool(values[-1].all())
+        found = numpy.flatnonzero(premisesvalues & ~values[-1])
+        if len(found) > 0:
+            counterexample = [True for i in letters]
+            for n, value in zip(occurring, assignment(start + int(found[0]), len(occurring))):
+                counterexample[n] = value
+            return truepremises, falsegoal, counterexample
+        start = stop
+        size = min(2 * size, chunksize)
+    return truepremises, falsegoal, None
+
+
+def assignment(row: int, letters: int):
+    """Return the values of the letters in a row of the table."""
+
+    return [(row >> (letters - 1 - n)) & 1 == 0 for n in range(letters)]
@@ -8,15 +8,271 @@ It contains the following classes:
 - `Not` - A Wff with one argument which is a Wff representing logical not.
 - `Implies` - A Wff with two arguments which are Wffs representing logical implies.
 - `Iff` - A Wff with two arguments which are Wffs representing logical if and only if.
+
+The connective classes are interned by the `WffStore` metaclass so that constructing
+`And(A, B)` twice returns the same node.  Since a node cannot change, its `__str__`,
+`latex()` and `tree()` renderings are computed once and kept on the node they were asked
+of.  Call `resetrenderings()` after changing how connectives or propositions are written.
+
+The methods that walk a formula, such as `__str__`, `latex`, `tree`, `pattern`,
+`makeschemafromlist`, `treetuple`, `getvalue` and `getmultivalue`, do not recurse.  Each
+connective combines the values already computed for its subformulas in a method such as
+`strfrom` and `fold` visits the nodes with an explicit stack, so a formula may be nested
+as deeply as memory allows.  The `multivalue` of a connective is computed in the same way
+when it is read rather than when the connective is built.
 """
 
 #from altrea.fol import Domain, Variable, Thing, Couple
+
+import inspect
+from operator import methodcaller
+import weakref
+
+
+def frozen(self, name: str, value):
+    """Replaces `__setattr__` on interned classes so a node cannot change once it is shared."""
+
+    if 'structuralhash' in self.__dict__:
+        raise AttributeError(f'The {type(self).__name__} node "{self}" is shared and cannot be changed.')
+    object.__setattr__(self, name, value)
+
+def rebuild(self):
+    """Replaces `__reduce__` on interned classes so copies and pickles are interned again."""
+
+    return type(self), self.arguments
+
+def structuralhash(self):
+    """Replaces `__hash__` on interned classes with the hash computed at construction."""
+
+    return self.structuralhash
+
+renderedmethods = ('__str__', 'latex', 'tree')
+renderednodes = weakref.WeakSet()
+
+def resetrenderings():
+    """Drop the renderings kept on interned nodes so they are computed again when next asked for.
+
+    This is needed after changing the name of a proposition or a connector shared by a class.
+    """
+
+    for node in list(renderednodes):
+        node.__dict__.pop('renderings', None)
+    renderednodes.clear()
+
+def cachedrendering(node, name: str):
+    """Return the rendering kept on an interned node or None if it has not been computed."""
+
+    renderings = node.__dict__.get('renderings')
+    if renderings is None:
+        return None
+    return renderings.get(name)
+
+def keeprendering(node, name: str, text: str):
+    """Keep a rendering on an interned node until the renderings are reset."""
+
+    renderings = node.__dict__.get('renderings')
+    if renderings is None:
+        renderings = node.__dict__['renderings'] = {}
+        renderednodes.add(node)
+    renderings[name] = text
+
+def memoized(render, name: str):
+    """Wrap a rendering method of an interned class so it is computed once for each node."""
+
+    def rendered(self):
+        text = cachedrendering(self, name)
+        if text is None:
+            text = render(self)
+            keeprendering(self, name, text)
+        return text
+
+    rendered.__name__ = render.__name__
+    rendered.__qualname__ = render.__qualname__
+    rendered.__doc__ = render.__doc__
+    rendered.__wrapped__ = render
+    return rendered
+
+def postorder(formula):
+    """Return the distinct nodes of a formula, each after its subformulas from left to right.
+
+    The traversal keeps its own stack, so the depth of a formula is limited only by memory.
+    """
+
+    nodes = []
+    seen = set()
+    stack = [(formula, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            nodes.append(node)
+        elif id(node) not in seen:
+            seen.add(id(node))
+            stack.append((node, True))
+            stack.extend((i, False) for i in reversed(node.children()))
+    return nodes
+
+def fold(formula, combine: str, leaf, rendering: str = ''):
+    """Compute a value for a formula from the values of its subformulas without recursion.
+
+    A node whose class has the method named by `combine` is given the list of the values of
+    its subformulas, in order, and returns its own value.  Any other node is a leaf and its
+    value is `leaf(node)`.  The nodes are visited in post-order from left to right and a
+    subformula that is shared is computed only once, so methods such as `pattern` that
+    collect names in a list see them in the order they are written.
+
+    The value of each subformula is let go once every connective above it has been computed,
+    so for text such as `pattern` or `tree` the memory used grows with the length of the text
+    rather than the square of its depth.
+
+    If `rendering` names a memoized rendering such as 'latex', the renderings already kept on
+    interned nodes are used.  Only the formula asked for keeps its rendering.
+    """
+
+    results = {}
+    methods = {}
+    uses = {}
+    for node in postorder(formula):
+        for i in node.children():
+            uses[id(i)] = uses.get(id(i), 0) + 1
+    stack = [(formula, None, None)]
+    while stack:
+        node, method, children = stack.pop()
+        if method is not None:
+            results[id(node)] = method(node, [results[id(i)] for i in children])
+            for i in children:
+                uses[id(i)] -= 1
+                if uses[id(i)] == 0:
+                    del results[id(i)]
+            continue
+        key = id(node)
+        if key in results:
+            continue
+        kind = type(node)
+        try:
+            method = methods[kind]
+        except KeyError:
+            method = methods[kind] = getattr(kind, combine, None)
+        if method is None:
+            results[key] = leaf(node)
+            continue
+        if rendering:
+            text = cachedrendering(node, rendering)
+            if text is not None:
+                results[key] = text
+                continue
+        children = node.childnodes
+        if children is None:
+            children = node.children()
+        stack.append((node, method, children))
+        for i in reversed(children):
+            stack.append((i, None, None))
+    return results[id(formula)]
+
+def infix(node, parts: list, connector: str):
+    """Write the parts of a binary connective on either side of its connector, bracketing
+    the parts that are not variables.
+    """
+
+    left, right = parts
+    if not node.left.is_variable:
+        left = f'{node.lb}{left}{node.rb}'
+    if not node.right.is_variable:
+        right = f'{node.lb}{right}{node.rb}'
+    return f'{left} {connector} {right}'
+
+latexof = methodcaller('latex')
+treeof = methodcaller('tree')
+treetupleof = methodcaller('treetuple')
+valueof = methodcaller('getvalue')
+multivalueof = methodcaller('getmultivalue')
+
+
+class WffStore(type):
+    """The metaclass of `Wff` which interns the classes that set `interned = True`.
+
+    Constructing such a class a second time with the same arguments returns the node
+    that already exists instead of a new one.  The arguments, with defaults filled in,
+    are the key and the nodes are held weakly so unused ones are released.  Each node
+    receives a structural hash from its tree connector and the hashes of its
+    subformulas.  Equal hashes are necessary but not sufficient for `Wff.equals`, while
+    the default identity `==` is exact for interned nodes since equal arguments always
+    give the same object.  Interned nodes cannot be changed after construction, so
+    their renderings are memoized.
+    """
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        if cls.interned:
+            parameters = inspect.signature(namespace.get('__init__', cls.__init__)).parameters
+            cls.parameters = tuple((i.name, i.default) for i in list(parameters.values())[1:])
+            cls.nodes = weakref.WeakValueDictionary()
+            cls.__setattr__ = frozen
+            cls.__reduce__ = rebuild
+            cls.__hash__ = structuralhash
+            for i in renderedmethods:
+                if i in namespace:
+                    setattr(cls, i, memoized(namespace[i], i))
+
+    def __call__(cls, *args, **kwargs):
+        if not cls.interned:
+            return super().__call__(*args, **kwargs)
+        try:
+            arguments = cls.normalize(args, kwargs)
+            node = cls.nodes.get(arguments)
+        except TypeError:
+            return super().__call__(*args, **kwargs)
+        if node is None:
+            node = super().__call__(*arguments)
+            children = node.children()
+            object.__setattr__(node, 'arguments', arguments)
+            object.__setattr__(node, 'childnodes', children)
+            object.__setattr__(
+                node, 
+                'structuralhash', 
+                hash((getattr(node, 'treeconnector', cls.__name__),) + tuple(hash(i) for i in children))
+            )
+            node = cls.nodes.setdefault(arguments, node)
+        return node
+
+    def normalize(cls, args: tuple, kwargs: dict):
+        """Return the arguments of a call in parameter order with the defaults filled in."""
+
+        if len(args) > len(cls.parameters):
+            raise TypeError(f'{cls.__name__} takes at most {len(cls.parameters)} arguments.')
+        arguments = list(args)
+        for name, default in cls.parameters[len(args):]:
+            if name in kwargs:
+                arguments.append(kwargs.pop(name))
+            elif default is inspect.Parameter.empty:
+                raise TypeError(f'{cls.__name__} is missing the argument "{name}".')
+            else:
+                arguments.append(default)
+        if len(kwargs) > 0:
+            raise TypeError(f'{cls.__name__} got unexpected arguments {list(kwargs)}.')
+        return tuple(arguments)
+
+def internednodes():
+    """Return the number of interned nodes currently alive for each interned class."""
+
+    return {i.__name__: len(i.nodes) for i in [Wff] + allsubclasses(Wff) if i.interned and len(i.nodes) > 0}
+
+def allsubclasses(cls):
+    subclasses = []
+    for i in cls.__subclasses__():
+        subclasses.append(i)
+        subclasses.extend(allsubclasses(i))
+    return subclasses
         
-class Wff:
+class Wff(metaclass=WffStore):
     """The construction of a well formed formula consisting of one propositional variable.
     """
 
     is_variable = True
+    interned = False
+    subformulas = ()
+    arguments = None
+    childnodes = None
+    structuralhash = None
 
     lb = '('
     rb = ')'
@@ -103,9 +359,65 @@ class Wff:
     def setvalue(self, value: bool):
         self.booleanvalue = value
 
+    def children(self):
+        """Return the subformulas of the well formed formula in order."""
+
+        return tuple(getattr(self, i) for i in self.subformulas)
+
     def equals(self, otherwff):
-        return str(self) == str(otherwff)
-    
+        """Check whether two well formed formulas have the same structure.
+
+        Interned nodes that are the same object are equal at once.  Otherwise the
+        structural hashes are compared before falling back on the tree strings.
+        """
+
+        if self is otherwff:
+            return True
+        elif not isinstance(otherwff, Wff) or hash(self) != hash(otherwff):
+            return False
+        else:
+            return self.tree() == otherwff.tree()
+
+    def replace(self, old, new, count: int = 1):
+        """Return the well formed formula with the first `count` subformulas, in the order
+        they are written, that are equal to `old` replaced by `new`.
+        """
+
+        replaced, count = self.replacecount(old, new, count)
+        return replaced
+
+    def replacecount(self, old, new, count: int):
+        """Return the formula with up to `count` subformulas equal to `old` replaced by `new`
+        and the number of replacements left over.
+
+        Unlike `fold` a shared subformula is visited wherever it occurs, since which of its
+        occurrences are replaced depends on the position.  The occurrences are walked with an
+        explicit stack, so the depth is limited only by memory.
+        """
+
+        results = []
+        stack = [(self, None)]
+        while stack:
+            node, arguments = stack.pop()
+            if arguments is not None:
+                names = [i[0] for i in node.parameters]
+                replaced = results[len(results) - len(node.subformulas):]
+                del results[len(results) - len(node.subformulas):]
+                for name, value in zip(node.subformulas, replaced):
+                    arguments[names.index(name)] = value
+                results.append(type(node)(*arguments))
+            elif count <= 0:
+                results.append(node)
+            elif node.equals(old):
+                results.append(new)
+                count -= 1
+            elif node.arguments is None or len(node.subformulas) == 0:
+                results.append(node)
+            else:
+                stack.append((node, list(node.arguments)))
+                stack.extend((getattr(node, i), None) for i in reversed(node.subformulas))
+        return results[0], count
+
     def getvalue(self):
         return self.booleanvalue   
     
@@ -115,6 +427,9 @@ class Wff:
     def setmultivalue(self, value):
         self.multivalue = value
 
+    def __hash__(self):
+        return hash(self.tree())
+
 class Connective(Wff):
     def __init__(self, left: Wff, right: Wff, name: str, latexname: str = ''):
         self.left = left
@@ -137,6 +452,8 @@ class And(Wff):
     by logical and.
     """
 
+    interned = True
+    subformulas = ('left', 'right')
     is_variable = False
 
     def __init__(self, 
@@ -151,65 +468,67 @@ class And(Wff):
         self.latexconnector = latexconnector
         self.treeconnector = treeconnector
         self.booleanvalue = left.booleanvalue and right.booleanvalue
-        leftmultivalue = left.getmultivalue()
-        rightmultivalue = right.getmultivalue()
-        if leftmultivalue == (False) or rightmultivalue == (False):
-            self.multivalue = (False)
-        elif leftmultivalue == (True) and rightmultivalue == (True):
-            self.multivalue = (True)
-        else:
-            self.multivalue = (True, False)
 
     def __str__(self):
-        if self.left.is_variable and self.right.is_variable:
-            return f'{self.left} {self.connector} {self.right}'
-        elif self.left.is_variable:
-            return f'{self.left} {self.connector} {self.lb}{self.right}{self.rb}'
-        elif self.right.is_variable:
-            return f'{self.lb}{self.left}{self.rb} {self.connector} {self.right}'
-        else:
-            return f'{self.lb}{self.left}{self.rb} {self.connector} {self.lb}{self.right}{self.rb}'
-        
+        return fold(self, 'strfrom', str, '__str__')
+
+    def strfrom(self, parts: list):
+        return infix(self, parts, self.connector)
+
     def latex(self):
-        if self.left.is_variable and self.right.is_variable:
-            return f'{self.left.latex()} {self.latexconnector} {self.right.latex()}'
-        elif self.left.is_variable:
-            return f'{self.left.latex()} {self.latexconnector} {self.lb}{self.right.latex()}{self.rb}'
-        elif self.right.is_variable:
-            return f'{self.lb}{self.left.latex()}{self.rb} {self.latexconnector} {self.right.latex()}'
-        else:
-            return f'{self.lb}{self.left.latex()}{self.rb} {self.latexconnector} {self.lb}{self.right.latex()}{self.rb}'
-        
+        return fold(self, 'latexfrom', latexof, 'latex')
+
+    def latexfrom(self, parts: list):
+        return infix(self, parts, self.latexconnector)
+
     def tree(self):
-        return f'{self.treeconnector}{self.lb}{self.left.tree()}, {self.right.tree()}{self.rb}'
-    
+        return fold(self, 'treefrom', treeof, 'tree')
+
+    def treefrom(self, parts: list):
+        return f'{self.treeconnector}{self.lb}{parts[0]}, {parts[1]}{self.rb}'
+
+    patternfrom = treefrom
+    schemafrom = treefrom
+
     def pattern(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.left.pattern(wfflist)}, {self.right.pattern(wfflist)}{self.rb}'
-    
+        return fold(self, 'patternfrom', lambda node: node.pattern(wfflist))
+
     def makeschemafromlist(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.left.makeschemafromlist(wfflist)}, {self.right.makeschemafromlist(wfflist)}{self.rb}'
-    
+        return fold(self, 'schemafrom', lambda node: node.makeschemafromlist(wfflist))
+
     def treetuple(self):
-        return self.treeconnector, self.lb, self.left.treetuple(), ',', self.right.treetuple(), self.rb
-        
+        return fold(self, 'treetuplefrom', treetupleof)
+
+    def treetuplefrom(self, parts: list):
+        return self.treeconnector, self.lb, parts[0], ',', parts[1], self.rb
+
     def getvalue(self):
-        return self.left.getvalue() and self.right.getvalue()
-    
+        return fold(self, 'valuefrom', valueof)
+
+    def valuefrom(self, parts: list):
+        return parts[0] and parts[1]
+
     def getmultivalue(self):
-        leftmultivalue = self.left.getmultivalue()
-        rightmultivalue = self.right.getmultivalue()
-        if leftmultivalue== (False) or rightmultivalue == (False):
+        return fold(self, 'multivaluefrom', multivalueof)
+
+    multivalue = property(getmultivalue)
+
+    def multivaluefrom(self, parts: list):
+        if parts[0] == (False) or parts[1] == (False):
             return (False)
-        elif leftmultivalue == (True) and rightmultivalue == (True):
+        elif parts[0] == (True) and parts[1] == (True):
             return (True)
         else:
             return (True, False)
-        
+
+
 class ConsistentWith(Wff):
     """A well formed formula with two arguments which are also well formed formulas connected
     by logical and.
     """
 
+    interned = True
+    subformulas = ('left', 'right')
     is_variable = False
 
     def __init__(self, 
@@ -224,64 +543,66 @@ class ConsistentWith(Wff):
         self.latexconnector = latexconnector
         self.treeconnector = treeconnector
         self.booleanvalue = left.booleanvalue and right.booleanvalue
-        leftmultivalue = left.getmultivalue()
-        rightmultivalue = right.getmultivalue()
-        if leftmultivalue == (False) or rightmultivalue == (False):
-            self.multivalue = (False)
-        elif leftmultivalue == (True) and rightmultivalue == (True):
-            self.multivalue = (True)
-        else:
-            self.multivalue = (True, False)
 
     def __str__(self):
-        if self.left.is_variable and self.right.is_variable:
-            return f'{self.left} {self.connector} {self.right}'
-        elif self.left.is_variable:
-            return f'{self.left} {self.connector} {self.lb}{self.right}{self.rb}'
-        elif self.right.is_variable:
-            return f'{self.lb}{self.left}{self.rb} {self.connector} {self.right}'
-        else:
-            return f'{self.lb}{self.left}{self.rb} {self.connector} {self.lb}{self.right}{self.rb}'
-        
+        return fold(self, 'strfrom', str, '__str__')
+
+    def strfrom(self, parts: list):
+        return infix(self, parts, self.connector)
+
     def latex(self):
-        if self.left.is_variable and self.right.is_variable:
-            return f'{self.left.latex()} {self.latexconnector} {self.right.latex()}'
-        elif self.left.is_variable:
-            return f'{self.left.latex()} {self.latexconnector} {self.lb}{self.right.latex()}{self.rb}'
-        elif self.right.is_variable:
-            return f'{self.lb}{self.left.latex()}{self.rb} {self.latexconnector} {self.right.latex()}'
-        else:
-            return f'{self.lb}{self.left.latex()}{self.rb} {self.latexconnector} {self.lb}{self.right.latex()}{self.rb}'
-        
+        return fold(self, 'latexfrom', latexof, 'latex')
+
+    def latexfrom(self, parts: list):
+        return infix(self, parts, self.latexconnector)
+
     def tree(self):
-        return f'{self.treeconnector}{self.lb}{self.left.tree()}, {self.right.tree()}{self.rb}'
-    
+        return fold(self, 'treefrom', treeof, 'tree')
+
+    def treefrom(self, parts: list):
+        return f'{self.treeconnector}{self.lb}{parts[0]}, {parts[1]}{self.rb}'
+
+    patternfrom = treefrom
+    schemafrom = treefrom
+
     def pattern(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.left.pattern(wfflist)}, {self.right.pattern(wfflist)}{self.rb}'
-    
+        return fold(self, 'patternfrom', lambda node: node.pattern(wfflist))
+
     def makeschemafromlist(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.left.makeschemafromlist(wfflist)}, {self.right.makeschemafromlist(wfflist)}{self.rb}'
-    
+        return fold(self, 'schemafrom', lambda node: node.makeschemafromlist(wfflist))
+
     def treetuple(self):
-        return self.treeconnector, self.lb, self.left.treetuple(), ',', self.right.treetuple(), self.rb
-        
+        return fold(self, 'treetuplefrom', treetupleof)
+
+    def treetuplefrom(self, parts: list):
+        return self.treeconnector, self.lb, parts[0], ',', parts[1], self.rb
+
     def getvalue(self):
-        return self.left.getvalue() and self.right.getvalue()
-    
+        return fold(self, 'valuefrom', valueof)
+
+    def valuefrom(self, parts: list):
+        return parts[0] and parts[1]
+
     def getmultivalue(self):
-        leftmultivalue = self.left.getmultivalue()
-        rightmultivalue = self.right.getmultivalue()
-        if leftmultivalue== (False) or rightmultivalue == (False):
+        return fold(self, 'multivaluefrom', multivalueof)
+
+    multivalue = property(getmultivalue)
+
+    def multivaluefrom(self, parts: list):
+        if parts[0] == (False) or parts[1] == (False):
             return (False)
-        elif leftmultivalue == (True) and rightmultivalue == (True):
+        elif parts[0] == (True) and parts[1] == (True):
             return (True)
         else:
             return (True, False)
 
+
 class Falsehood(Wff):
     """This well formed formula is the result of a contradiction in a proof which may be useful for explosions.
     """
 
+    interned = True
+    subformulas = ()
     is_variable = True
     booleanvalue = None
     multivalue = None
@@ -343,7 +664,7 @@ class Falsehood(Wff):
         return self.booleanvalue
     
     def setvalue(self, value: bool = False):
-        self.booleanvalue = False
+        """A falsehood is always false and, being shared, is left unchanged."""
 
     def getmultivalue(self):
         return self.multivalue
@@ -354,6 +675,8 @@ class Iff(Wff):
     joined by if and only if.
     """
 
+    interned = True
+    subformulas = ('left', 'right')
     is_variable = False
 
     def __init__(self, 
@@ -368,62 +691,61 @@ class Iff(Wff):
         self.latexconnector = latexconnector
         self.treeconnector = treeconnector
         self.booleanvalue = ((not left.booleanvalue) or right.booleanvalue) and ((not right.booleanvalue) or left.booleanvalue)
-        leftmultivalue = self.left.getmultivalue()
-        rightmultivalue = self.right.getmultivalue()
-        if leftmultivalue == (False) or rightmultivalue == (False):
-            self.multivalue = (False)
-        elif leftmultivalue == (True) and rightmultivalue == (True):
-            self.multivalue = (True)
-        else:
-            self.multivalue = (True, False) 
 
     def __str__(self):
-        if self.left.is_variable and self.right.is_variable:
-            return f'{self.left} {self.connector} {self.right}'
-        elif self.left.is_variable:
-            return f'{self.left} {self.connector} {self.lb}{self.right}{self.rb}'
-        elif self.right.is_variable:
-            return f'{self.lb}{self.left}{self.rb} {self.connector} {self.right}'
-        else:
-            return f'{self.lb}{self.left}{self.rb} {self.connector} {self.lb}{self.right}{self.rb}'
-        
+        return fold(self, 'strfrom', str, '__str__')
+
+    def strfrom(self, parts: list):
+        return infix(self, parts, self.connector)
+
     def latex(self):
-        if self.left.is_variable and self.right.is_variable:
-            return f'{self.left.latex()} {self.latexconnector} {self.right.latex()}'
-        elif self.left.is_variable:
-            return f'{self.left.latex()} {self.latexconnector} {self.lb}{self.right.latex()}{self.rb}'
-        elif self.right.is_variable:
-            return f'{self.lb}{self.left.latex()}{self.rb} {self.latexconnector} {self.right.latex()}'
-        else:
-            return f'{self.lb}{self.left.latex()}{self.rb} {self.latexconnector} {self.lb}{self.right.latex()}{self.rb}'
-        
+        return fold(self, 'latexfrom', latexof, 'latex')
+
+    def latexfrom(self, parts: list):
+        return infix(self, parts, self.latexconnector)
+
     def tree(self):
-        return f'{self.treeconnector}{self.lb}{self.left.tree()}, {self.right.tree()}{self.rb}'
-    
+        return fold(self, 'treefrom', treeof, 'tree')
+
+    def treefrom(self, parts: list):
+        return f'{self.treeconnector}{self.lb}{parts[0]}, {parts[1]}{self.rb}'
+
+    patternfrom = treefrom
+    schemafrom = treefrom
+
     def pattern(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.left.pattern(wfflist)}, {self.right.pattern(wfflist)}{self.rb}'
-    
+        return fold(self, 'patternfrom', lambda node: node.pattern(wfflist))
+
     def makeschemafromlist(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.left.makeschemafromlist(wfflist)}, {self.right.makeschemafromlist(wfflist)}{self.rb}'
-    
+        return fold(self, 'schemafrom', lambda node: node.makeschemafromlist(wfflist))
+
     def treetuple(self):
-        return self.treeconnector, self.lb, self.left.treetuple(), ',', self.right.treetuple(), self.rb
-    
+        return fold(self, 'treetuplefrom', treetupleof)
+
+    def treetuplefrom(self, parts: list):
+        return self.treeconnector, self.lb, parts[0], ',', parts[1], self.rb
+
     def getmultivalue(self):
-        leftmultivalue = self.left.getmultivalue()
-        rightmultivalue = self.right.getmultivalue()
-        if leftmultivalue == (False) or rightmultivalue == (False):
+        return fold(self, 'multivaluefrom', multivalueof)
+
+    multivalue = property(getmultivalue)
+
+    def multivaluefrom(self, parts: list):
+        if parts[0] == (False) or parts[1] == (False):
             return (False)
-        elif leftmultivalue == (True) and rightmultivalue == (True):
+        elif parts[0] == (True) and parts[1] == (True):
             return (True)
         else:
-            return (True, False) 
-        
+            return (True, False)
+
+
 class StrictIff(Wff):
     """A well formed formula with two arguments which are also well formed formulas
     joined by if and only if.
     """
 
+    interned = True
+    subformulas = ('left', 'right')
     is_variable = False
 
     def __init__(self, 
@@ -438,56 +760,53 @@ class StrictIff(Wff):
         self.latexconnector = latexconnector
         self.treeconnector = treeconnector
         self.booleanvalue = ((not left.booleanvalue) or right.booleanvalue) and ((not right.booleanvalue) or left.booleanvalue)
-        leftmultivalue = self.left.getmultivalue()
-        rightmultivalue = self.right.getmultivalue()
-        if leftmultivalue == (False) or rightmultivalue == (False):
-            self.multivalue = (False)
-        elif leftmultivalue == (True) and rightmultivalue == (True):
-            self.multivalue = (True)
-        else:
-            self.multivalue = (True, False) 
 
     def __str__(self):
-        if self.left.is_variable and self.right.is_variable:
-            return f'{self.left} {self.connector} {self.right}'
-        elif self.left.is_variable:
-            return f'{self.left} {self.connector} {self.lb}{self.right}{self.rb}'
-        elif self.right.is_variable:
-            return f'{self.lb}{self.left}{self.rb} {self.connector} {self.right}'
-        else:
-            return f'{self.lb}{self.left}{self.rb} {self.connector} {self.lb}{self.right}{self.rb}'
-        
+        return fold(self, 'strfrom', str, '__str__')
+
+    def strfrom(self, parts: list):
+        return infix(self, parts, self.connector)
+
     def latex(self):
-        if self.left.is_variable and self.right.is_variable:
-            return f'{self.left.latex()} {self.latexconnector} {self.right.latex()}'
-        elif self.left.is_variable:
-            return f'{self.left.latex()} {self.latexconnector} {self.lb}{self.right.latex()}{self.rb}'
-        elif self.right.is_variable:
-            return f'{self.lb}{self.left.latex()}{self.rb} {self.latexconnector} {self.right.latex()}'
-        else:
-            return f'{self.lb}{self.left.latex()}{self.rb} {self.latexconnector} {self.lb}{self.right.latex()}{self.rb}'
-        
+        return fold(self, 'latexfrom', latexof, 'latex')
+
+    def latexfrom(self, parts: list):
+        return infix(self, parts, self.latexconnector)
+
     def tree(self):
-        return f'{self.treeconnector}{self.lb}{self.left.tree()}, {self.right.tree()}{self.rb}'
-    
+        return fold(self, 'treefrom', treeof, 'tree')
+
+    def treefrom(self, parts: list):
+        return f'{self.treeconnector}{self.lb}{parts[0]}, {parts[1]}{self.rb}'
+
+    patternfrom = treefrom
+    schemafrom = treefrom
+
     def pattern(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.left.pattern(wfflist)}, {self.right.pattern(wfflist)}{self.rb}'
-    
+        return fold(self, 'patternfrom', lambda node: node.pattern(wfflist))
+
     def makeschemafromlist(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.left.makeschemafromlist(wfflist)}, {self.right.makeschemafromlist(wfflist)}{self.rb}'
-    
+        return fold(self, 'schemafrom', lambda node: node.makeschemafromlist(wfflist))
+
     def treetuple(self):
-        return self.treeconnector, self.lb, self.left.treetuple(), ',', self.right.treetuple(), self.rb
-    
+        return fold(self, 'treetuplefrom', treetupleof)
+
+    def treetuplefrom(self, parts: list):
+        return self.treeconnector, self.lb, parts[0], ',', parts[1], self.rb
+
     def getmultivalue(self):
-        leftmultivalue = self.left.getmultivalue()
-        rightmultivalue = self.right.getmultivalue()
-        if leftmultivalue == (False) or rightmultivalue == (False):
+        return fold(self, 'multivaluefrom', multivalueof)
+
+    multivalue = property(getmultivalue)
+
+    def multivaluefrom(self, parts: list):
+        if parts[0] == (False) or parts[1] == (False):
             return (False)
-        elif leftmultivalue == (True) and rightmultivalue == (True):
+        elif parts[0] == (True) and parts[1] == (True):
             return (True)
         else:
-            return (True, False) 
+            return (True, False)
+
 
 class Implies(Wff):
     """A well formed formula with two arguments which are also well formed formulas joined
@@ -495,6 +814,8 @@ class Implies(Wff):
     second.
     """
 
+    interned = True
+    subformulas = ('left', 'right')
     is_variable = False
 
     def __init__(self, 
@@ -519,56 +840,66 @@ class Implies(Wff):
         #     self.multivalue = (True, False)
     
     def __str__(self):
-        if self.left.is_variable and self.right.is_variable:
-            return f'{self.left} {self.connector} {self.right}'
-        elif self.left.is_variable:
-            return f'{self.left} {self.connector} {self.lb}{self.right}{self.rb}'
-        elif self.right.is_variable:
-            return f'{self.lb}{self.left}{self.rb} {self.connector} {self.right}'
-        else:
-            return f'{self.lb}{self.left}{self.rb} {self.connector} {self.lb}{self.right}{self.rb}'
-        
+        return fold(self, 'strfrom', str, '__str__')
+
+    def strfrom(self, parts: list):
+        return infix(self, parts, self.connector)
+
     def latex(self):
-        if self.left.is_variable and self.right.is_variable:
-            return f'{self.left.latex()} {self.latexconnector} {self.right.latex()}'
-        elif self.left.is_variable:
-            return f'{self.left.latex()} {self.latexconnector} {self.lb}{self.right.latex()}{self.rb}'
-        elif self.right.is_variable:
-            return f'{self.lb}{self.left.latex()}{self.rb} {self.latexconnector} {self.right.latex()}'
-        else:
-            return f'{self.lb}{self.left.latex()}{self.rb} {self.latexconnector} {self.lb}{self.right.latex()}{self.rb}'
-        
+        return fold(self, 'latexfrom', latexof, 'latex')
+
+    def latexfrom(self, parts: list):
+        return infix(self, parts, self.latexconnector)
+
     def tree(self):
-        return f'{self.treeconnector}{self.lb}{self.left.tree()}, {self.right.tree()}{self.rb}'
-    
+        return fold(self, 'treefrom', treeof, 'tree')
+
+    def treefrom(self, parts: list):
+        return f'{self.treeconnector}{self.lb}{parts[0]}, {parts[1]}{self.rb}'
+
+    patternfrom = treefrom
+    schemafrom = treefrom
+
     def pattern(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.left.pattern(wfflist)}, {self.right.pattern(wfflist)}{self.rb}'
-    
+        return fold(self, 'patternfrom', lambda node: node.pattern(wfflist))
+
     def makeschemafromlist(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.left.makeschemafromlist(wfflist)}, {self.right.makeschemafromlist(wfflist)}{self.rb}'
-    
+        return fold(self, 'schemafrom', lambda node: node.makeschemafromlist(wfflist))
+
     def treetuple(self):
-        return self.treeconnector, self.lb, self.left.treetuple(), ',', self.right.treetuple(), self.rb
-        
+        return fold(self, 'treetuplefrom', treetupleof)
+
+    def treetuplefrom(self, parts: list):
+        return self.treeconnector, self.lb, parts[0], ',', parts[1], self.rb
+
     def getvalue(self):
-        return (not self.left.getvalue()) or self.right.getvalue()
-    
+        return fold(self, 'valuefrom', valueof)
+
+    def valuefrom(self, parts: list):
+        return (not parts[0]) or parts[1]
+
     def getmultivalue(self):
-        leftmultivalue = self.left.getmultivalue()
-        rightmultivalue = self.right.getmultivalue()
-        if leftmultivalue == (False) or rightmultivalue == (True):
+        return fold(self, 'multivaluefrom', multivalueof)
+
+    multivalue = property(getmultivalue)
+
+    def multivaluefrom(self, parts: list):
+        if parts[0] == (False) or parts[1] == (True):
             return (True)
-        elif leftmultivalue == (True) and rightmultivalue == (False):
+        elif parts[0] == (True) and parts[1] == (False):
             return (False)
         else:
             return (True, False)
 
+
 class StrictImplies(Wff):
     """A well formed formula with two arguments which are also well formed formulas joined
     by implies.  The antecedent is the first of the two arguments.  The consequent is the
     second.
     """
 
+    interned = True
+    subformulas = ('left', 'right')
     is_variable = False
 
     def __init__(self, 
@@ -583,63 +914,65 @@ class StrictImplies(Wff):
         self.latexconnector = latexconnector
         self.treeconnector = treeconnector
         self.booleanvalue = None
-        leftmultivalue = self.left.getmultivalue()
-        rightmultivalue = self.right.getmultivalue()
-        if leftmultivalue == (False) or rightmultivalue == (True):
-            self.multivalue = (True)
-        elif leftmultivalue == (True) and rightmultivalue == (False):
-            self.multivalue = (False)
-        else:
-            self.multivalue = (True, False)
     
     def __str__(self):
-        if self.left.is_variable and self.right.is_variable:
-            return f'{self.left} {self.connector} {self.right}'
-        elif self.left.is_variable:
-            return f'{self.left} {self.connector} {self.lb}{self.right}{self.rb}'
-        elif self.right.is_variable:
-            return f'{self.lb}{self.left}{self.rb} {self.connector} {self.right}'
-        else:
-            return f'{self.lb}{self.left}{self.rb} {self.connector} {self.lb}{self.right}{self.rb}'
-        
+        return fold(self, 'strfrom', str, '__str__')
+
+    def strfrom(self, parts: list):
+        return infix(self, parts, self.connector)
+
     def latex(self):
-        if self.left.is_variable and self.right.is_variable:
-            return f'{self.left.latex()} {self.latexconnector} {self.right.latex()}'
-        elif self.left.is_variable:
-            return f'{self.left.latex()} {self.latexconnector} {self.lb}{self.right.latex()}{self.rb}'
-        elif self.right.is_variable:
-            return f'{self.lb}{self.left.latex()}{self.rb} {self.latexconnector} {self.right.latex()}'
-        else:
-            return f'{self.lb}{self.left.latex()}{self.rb} {self.latexconnector} {self.lb}{self.right.latex()}{self.rb}'
-        
+        return fold(self, 'latexfrom', latexof, 'latex')
+
+    def latexfrom(self, parts: list):
+        return infix(self, parts, self.latexconnector)
+
     def tree(self):
-        return f'{self.treeconnector}{self.lb}{self.left.tree()}, {self.right.tree()}{self.rb}'
-    
+        return fold(self, 'treefrom', treeof, 'tree')
+
+    def treefrom(self, parts: list):
+        return f'{self.treeconnector}{self.lb}{parts[0]}, {parts[1]}{self.rb}'
+
+    patternfrom = treefrom
+    schemafrom = treefrom
+
     def pattern(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.left.pattern(wfflist)}, {self.right.pattern(wfflist)}{self.rb}'
-    
+        return fold(self, 'patternfrom', lambda node: node.pattern(wfflist))
+
     def makeschemafromlist(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.left.makeschemafromlist(wfflist)}, {self.right.makeschemafromlist(wfflist)}{self.rb}'
-    
+        return fold(self, 'schemafrom', lambda node: node.makeschemafromlist(wfflist))
+
     def treetuple(self):
-        return self.treeconnector, self.lb, self.left.treetuple(), ',', self.right.treetuple(), self.rb
-        
+        return fold(self, 'treetuplefrom', treetupleof)
+
+    def treetuplefrom(self, parts: list):
+        return self.treeconnector, self.lb, parts[0], ',', parts[1], self.rb
+
     def getvalue(self):
-        return (not self.left.getvalue()) or self.right.getvalue()
-    
+        return fold(self, 'valuefrom', valueof)
+
+    def valuefrom(self, parts: list):
+        return (not parts[0]) or parts[1]
+
     def getmultivalue(self):
-        leftmultivalue = self.left.getmultivalue()
-        rightmultivalue = self.right.getmultivalue()
-        if leftmultivalue == (False) or rightmultivalue == (True):
+        return fold(self, 'multivaluefrom', multivalueof)
+
+    multivalue = property(getmultivalue)
+
+    def multivaluefrom(self, parts: list):
+        if parts[0] == (False) or parts[1] == (True):
             return (True)
-        elif leftmultivalue == (True) and rightmultivalue == (False):
+        elif parts[0] == (True) and parts[1] == (False):
             return (False)
         else:
             return (True, False)
 
+
 class Necessary(Wff):
     """A well-formed formula which is necessarily true."""
 
+    interned = True
+    subformulas = ('wff',)
     is_variable = True
     booleanvalue = True
 
@@ -655,40 +988,64 @@ class Necessary(Wff):
         self.multivalue = (True)
 
     def __str__(self):
+        return fold(self, 'strfrom', str, '__str__')
+
+    def strfrom(self, parts: list):
         if self.wff.is_variable:
-            return f'{self.connector}{self.wff}'
+            return f'{self.connector}{parts[0]}'
         else:
-            return f'{self.connector}{self.lb}{self.wff}{self.rb}'
-    
+            return f'{self.connector}{self.lb}{parts[0]}{self.rb}'
+
     def latex(self):
+        return fold(self, 'latexfrom', latexof, 'latex')
+
+    def latexfrom(self, parts: list):
         if self.wff.is_variable:
-            return f'{self.latexconnector} {self.wff.latex()}'
+            return f'{self.latexconnector} {parts[0]}'
         else:
-            return f'{self.latexconnector} {self.lb}{self.wff.latex()}{self.rb}'
-        
+            return f'{self.latexconnector} {self.lb}{parts[0]}{self.rb}'
+
     def tree(self):
-        return f'{self.treeconnector}{self.lb}{self.wff.tree()}{self.rb}'
-    
+        return fold(self, 'treefrom', treeof, 'tree')
+
+    def treefrom(self, parts: list):
+        return f'{self.treeconnector}{self.lb}{parts[0]}{self.rb}'
+
+    patternfrom = treefrom
+    schemafrom = treefrom
+
     def pattern(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.wff.pattern(wfflist)}{self.rb}'
-    
+        return fold(self, 'patternfrom', lambda node: node.pattern(wfflist))
+
     def makeschemafromlist(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.wff.makeschemafromlist(wfflist)}{self.rb}'
-    
+        return fold(self, 'schemafrom', lambda node: node.makeschemafromlist(wfflist))
+
     def treetuple(self):
-        return self.treeconnector, self.lb, self.wff.treetuple(), self.rb
-    
+        return fold(self, 'treetuplefrom', treetupleof)
+
+    def treetuplefrom(self, parts: list):
+        return self.treeconnector, self.lb, parts[0], self.rb
+
     def getvalue(self):
-        return self.wff.value()
-    
+        return fold(self, 'valuefrom', valueof)
+
+    def valuefrom(self, parts: list):
+        return parts[0]
+
     def getmultivalue(self):
-        return self.wff.getmultivalue()
-    
+        return fold(self, 'multivaluefrom', multivalueof)
+
+    def multivaluefrom(self, parts: list):
+        return parts[0]
+
+
 class Not(Wff):
     """A well formed formula with one argument which is also a well formed formula joined
     with logical not.
     """
 
+    interned = True
+    subformulas = ('negated',)
     is_variable = True
 
     def __init__(self, 
@@ -702,55 +1059,73 @@ class Not(Wff):
         self.connector = connector
         self.latexconnector = latexconnector 
         self.treeconnector = treeconnector  
-        negatedmultivalue = negated.getmultivalue() 
-        if negatedmultivalue == (True):
-            self.multivalue = (False)
-        elif negatedmultivalue == (False):
-            self.multivalue = (True)
-        else:
-            self.multivalue = (True, False)
 
     def __str__(self):
+        return fold(self, 'strfrom', str, '__str__')
+
+    def strfrom(self, parts: list):
         if self.negated.is_variable:
-            return f'{self.connector}{self.negated}'
+            return f'{self.connector}{parts[0]}'
         else:
-            return f'{self.connector}{self.lb}{self.negated}{self.rb}'
-        
+            return f'{self.connector}{self.lb}{parts[0]}{self.rb}'
+
     def latex(self):
+        return fold(self, 'latexfrom', latexof, 'latex')
+
+    def latexfrom(self, parts: list):
         if self.negated.is_variable:
-            return f'{self.latexconnector}{self.negated.latex()}'
+            return f'{self.latexconnector}{parts[0]}'
         else:
-            return f'{self.latexconnector}{self.lb}{self.negated.latex()}{self.rb}'
-        
+            return f'{self.latexconnector}{self.lb}{parts[0]}{self.rb}'
+
     def tree(self):
-        return f'{self.treeconnector}{self.lb}{self.negated.tree()}{self.rb}'
-    
+        return fold(self, 'treefrom', treeof, 'tree')
+
+    def treefrom(self, parts: list):
+        return f'{self.treeconnector}{self.lb}{parts[0]}{self.rb}'
+
+    patternfrom = treefrom
+    schemafrom = treefrom
+
     def pattern(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.negated.pattern(wfflist)}{self.rb}'
-    
+        return fold(self, 'patternfrom', lambda node: node.pattern(wfflist))
+
     def makeschemafromlist(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.negated.makeschemafromlist(wfflist)}{self.rb}'
-    
+        return fold(self, 'schemafrom', lambda node: node.makeschemafromlist(wfflist))
+
     def treetuple(self):
-        return self.treeconnector, self.lb, self.negated.treetuple(), self.rb
-    
+        return fold(self, 'treetuplefrom', treetupleof)
+
+    def treetuplefrom(self, parts: list):
+        return self.treeconnector, self.lb, parts[0], self.rb
+
     def getvalue(self):
-        return not self.negated.getvalue()
-    
+        return fold(self, 'valuefrom', valueof)
+
+    def valuefrom(self, parts: list):
+        return not parts[0]
+
     def getmultivalue(self):
-        negatedmultivalue = self.negated.getmultivalue() 
-        if negatedmultivalue == (True):
+        return fold(self, 'multivaluefrom', multivalueof)
+
+    multivalue = property(getmultivalue)
+
+    def multivaluefrom(self, parts: list):
+        if parts[0] == (True):
             return (False)
-        elif negatedmultivalue == (False):
+        elif parts[0] == (False):
             return (True)
         else:
-            return (True, False) 
+            return (True, False)
+
 
 class Or(Wff):
     """A well formed formula with two arguments which are also well formed formulas connected
     by logical or.
     """
 
+    interned = True
+    subformulas = ('left', 'right')
     is_variable = False
 
     def __init__(self, 
@@ -765,63 +1140,65 @@ class Or(Wff):
         self.latexconnector = latexconnector
         self.treeconnector = treeconnector
         self.booleanvalue = left.booleanvalue or right.booleanvalue
-        leftmultivalue = self.left.getmultivalue()
-        rightmultivalue = self.right.getmultivalue()
-        if leftmultivalue == (False) and rightmultivalue == (False):
-            self.multivalue = (False)
-        elif leftmultivalue == (True) or rightmultivalue == (True):
-            self.multivalue = (True)
-        else:
-            self.multivalue = (True, False)
 
     def __str__(self):
-        if self.left.is_variable and self.right.is_variable:
-            return f'{self.left} {self.connector} {self.right}'
-        elif self.left.is_variable:
-            return f'{self.left} {self.connector} {self.lb}{self.right}{self.rb}'
-        elif self.right.is_variable:
-            return f'{self.lb}{self.left}{self.rb} {self.connector} {self.right}'
-        else:
-            return f'{self.lb}{self.left}{self.rb} {self.connector} {self.lb}{self.right}{self.rb}'
-        
+        return fold(self, 'strfrom', str, '__str__')
+
+    def strfrom(self, parts: list):
+        return infix(self, parts, self.connector)
+
     def latex(self):
-        if self.left.is_variable and self.right.is_variable:
-            return f'{self.left.latex()} {self.latexconnector} {self.right.latex()}'
-        elif self.left.is_variable:
-            return f'{self.left.latex()} {self.latexconnector} {self.lb}{self.right.latex()})'
-        elif self.right.is_variable:
-            return f'{self.lb}{self.left.latex()}{self.rb} {self.latexconnector} {self.right.latex()}'
-        else:
-            return f'{self.lb}{self.left.latex()}{self.rb} {self.latexconnector} {self.lb}{self.right.latex()}{self.rb}'
-        
+        return fold(self, 'latexfrom', latexof, 'latex')
+
+    def latexfrom(self, parts: list):
+        return infix(self, parts, self.latexconnector)
+
     def tree(self):
-        return f'{self.treeconnector}{self.lb}{self.left.tree()}, {self.right.tree()}{self.rb}'
-    
+        return fold(self, 'treefrom', treeof, 'tree')
+
+    def treefrom(self, parts: list):
+        return f'{self.treeconnector}{self.lb}{parts[0]}, {parts[1]}{self.rb}'
+
+    patternfrom = treefrom
+    schemafrom = treefrom
+
     def pattern(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.left.pattern(wfflist)}, {self.right.pattern(wfflist)}{self.rb}'
-    
+        return fold(self, 'patternfrom', lambda node: node.pattern(wfflist))
+
     def makeschemafromlist(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.left.makeschemafromlist(wfflist)}, {self.right.makeschemafromlist(wfflist)}{self.rb}'
-    
+        return fold(self, 'schemafrom', lambda node: node.makeschemafromlist(wfflist))
+
     def treetuple(self):
-        return self.treeconnector, self.lb, self.left.treetuple(), ',', self.right.treetuple(), self.rb
-        
+        return fold(self, 'treetuplefrom', treetupleof)
+
+    def treetuplefrom(self, parts: list):
+        return self.treeconnector, self.lb, parts[0], ',', parts[1], self.rb
+
     def getvalue(self):
-        return self.left.getvalue() or self.right.getvalue()
-    
+        return fold(self, 'valuefrom', valueof)
+
+    def valuefrom(self, parts: list):
+        return parts[0] or parts[1]
+
     def getmultivalue(self):
-        leftmultivalue = self.left.getmultivalue()
-        rightmultivalue = self.right.getmultivalue()
-        if leftmultivalue == (False) and rightmultivalue == (False):
+        return fold(self, 'multivaluefrom', multivalueof)
+
+    multivalue = property(getmultivalue)
+
+    def multivaluefrom(self, parts: list):
+        if parts[0] == (False) and parts[1] == (False):
             return (False)
-        elif leftmultivalue == (True) or rightmultivalue == (True):
+        elif parts[0] == (True) or parts[1] == (True):
             return (True)
         else:
             return (True, False)
 
+
 class Possibly(Wff):
     """A well-formed formula which is possibly true."""
 
+    interned = True
+    subformulas = ('wff',)
     is_variable = True
     booleanvalue = True
 
@@ -837,35 +1214,51 @@ class Possibly(Wff):
         self.multivalue = (True)
 
     def __str__(self):
+        return fold(self, 'strfrom', str, '__str__')
+
+    def strfrom(self, parts: list):
         if self.wff.is_variable:
-            return f'{self.connector}{self.wff}'
+            return f'{self.connector}{parts[0]}'
         else:
-            return f'{self.connector}{self.lb}{self.wff}{self.rb}'
-    
+            return f'{self.connector}{self.lb}{parts[0]}{self.rb}'
+
     def latex(self):
+        return fold(self, 'latexfrom', latexof, 'latex')
+
+    def latexfrom(self, parts: list):
         if self.wff.is_variable:
-            return f'{self.latexconnector} {self.wff.latex()}'
+            return f'{self.latexconnector} {parts[0]}'
         else:
-            return f'{self.latexconnector} {self.lb}{self.wff.latex()}{self.rb}'
-        
+            return f'{self.latexconnector} {self.lb}{parts[0]}{self.rb}'
+
     def tree(self):
-        return f'{self.treeconnector}{self.lb}{self.wff.tree()}{self.rb}'
-    
-    def pattern(self, wfflist):
-        return f'{self.treeconnector}{self.lb}{self.wff.pattern(wfflist)}{self.rb}'
-    
+        return fold(self, 'treefrom', treeof, 'tree')
+
+    def treefrom(self, parts: list):
+        return f'{self.treeconnector}{self.lb}{parts[0]}{self.rb}'
+
+    patternfrom = treefrom
+    schemafrom = treefrom
+
+    def pattern(self, wfflist: list):
+        return fold(self, 'patternfrom', lambda node: node.pattern(wfflist))
+
     def makeschemafromlist(self, wfflist: list):
-        return f'{self.treeconnector}{self.lb}{self.wff.makeschemafromlist(wfflist)}{self.rb}'
-    
+        return fold(self, 'schemafrom', lambda node: node.makeschemafromlist(wfflist))
+
     def treetuple(self):
-        return self.treeconnector, self.lb, self.wff.treetuple(), self.rb
-    
+        return fold(self, 'treetuplefrom', treetupleof)
+
+    def treetuplefrom(self, parts: list):
+        return self.treeconnector, self.lb, parts[0], self.rb
+
     def getvalue(self):
         return True
-    
+
     def getmultivalue(self):
         return self.multivalue
-    
+
+
 class Truth(Wff):
     """A well formed formula which is always true."""
 
@@ -877,8 +1270,6 @@ class Truth(Wff):
                  latexname: str = ''):
         if name in self.reserved_names or latexname in self.reserved_names:
             raise ValueError(f'The name "{name}" or the latexname "{latexname}" is in the list of reserved words: {self.reserved_names} which cannot be used.')
-        elif name == '':
-            raise ValueError(f'The name "{name}" is the empty string which cannot be used as a name.')
         elif not isinstance(name, str) or not isinstance(latexname, str):
             raise TypeError(f' The name "{str(name)}" or the latexname "{str(latexname)}" was not a string.')
         else:
@@ -887,7 +1278,7 @@ class Truth(Wff):
             else:
                 self.name = name
             if latexname == '':
-                self.latexname = self.name
+                self.latexname = self.t_latexname if name == '' else self.name
             else:
                 self.latexname = latexname
         self.multivalue = (True)
@@ -1234,6 +1625,8 @@ class ForAll(Wff):
 class Couple(Wff):
     """Assign a name to a specific thing."""
 
+    interned = True
+    subformulas = ('left', 'right')
     lb = "("
     rb = ")"
     c = ", "
@@ -1274,6 +1667,8 @@ class Couple(Wff):
 class Identity(Wff):
     """Define a relation for the variables or elements."""
 
+    interned = True
+    subformulas = ('left', 'right')
     is_variable = False
     lb = "("
     rb = ")"
@@ -1287,19 +1682,30 @@ class Identity(Wff):
         self.latexname = latexname
 
     def __str__(self):
-        return f'{self.left}{self.name}{self.right}'
+        return fold(self, 'strfrom', str, '__str__')
+
+    def strfrom(self, parts: list):
+        return f'{parts[0]}{self.name}{parts[1]}'
     
     def latex(self):
-        return f'{self.left.latex()}{self.latexname}{self.right.latex()}'
+        return fold(self, 'latexfrom', latexof, 'latex')
+
+    def latexfrom(self, parts: list):
+        return f'{parts[0]}{self.latexname}{parts[1]}'
 
     def tree(self):
-        return f'Identity{self.lb}{self.left.tree()}, {self.right.tree()}{self.rb}'
+        return fold(self, 'treefrom', treeof, 'tree')
+
+    def treefrom(self, parts: list):
+        return f'Identity{self.lb}{parts[0]}, {parts[1]}{self.rb}'
+
+    patternfrom = treefrom
     
     def pattern(self, objectlist: list):
-        return f'Identity{self.lb}{self.left.pattern(objectlist)}, {self.right.pattern(objectlist)}{self.rb}'
+        return fold(self, 'patternfrom', lambda node: node.pattern(objectlist))
     
     def setvalue(self):
-        self.booleanvalue = None
+        """The value is not set on the node since it is shared."""
 
     def getmultivalue(self):
         return self.multivalue
@@ -1463,6 +1869,8 @@ class Predicate(Wff):
 class Relation(Wff):
     """Define a relation for the variables or elements."""
 
+    interned = True
+    subformulas = ('connective', 'left', 'right')
     is_variable = False
     lb = "{"
     rb = "}"
@@ -1493,7 +1901,7 @@ class Relation(Wff):
         return f"Relation({self.connective.pattern(objectlist)}, {self.left.pattern(objectlist)}, {self.right.pattern(objectlist)})"
     
     def setvalue(self):
-        self.booleanvalue = None
+        """The value is not set on the node since it is shared."""
 
     def getmultivalue(self):
         return self.multivalue
@@ -1501,6 +1909,8 @@ class Relation(Wff):
 class Attribute(Wff):
     """Assign a name to a specific thing."""
 
+    interned = True
+    subformulas = ('predicate', 'subject')
     booleanvalue = None
     multivalue = None
     memberof = "$~\\epsilon~$"
@@ -0,0 +1,70 @@
+# deepchainbenchmark.py
+"""This script times building and walking implication chains nested n times.
+
+For each depth the chain A, B > A, (B > A) > ~B, B > ((B > A) > ~B), ... is built one
+connective at a time and then each method that walks a formula is timed once with the
+renderings reset.  None of these methods recurse, so the depth is limited only by memory.
+The peak memory of `pattern` is measured separately and grows in step with the depth.
+
+Run it from the root of the repository with
+
+    python benchmarks/deepchainbenchmark.py
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import altrea.wffs
+from altrea.wffs import Implies, Not, Proposition
+
+A = Proposition("A")
+B = Proposition("B")
+
+
+def chain(depth: int):
+    formula = A
+    for i in range(depth):
+        formula = Implies(formula, Not(B)) if i % 2 else Implies(B, formula)
+    return formula
+
+
+methods = {
+    "str": str,
+    "latex": lambda formula: formula.latex(),
+    "tree": lambda formula: formula.tree(),
+    "pattern": lambda formula: formula.pattern([]),
+    "value": lambda formula: formula.getvalue(),
+    "multivalue": lambda formula: formula.getmultivalue(),
+}
+
+
+def main():
+    A.setvalue(True)
+    B.setvalue(False)
+    print(
+        f'{"depth":>8}{"build (s)":>12}'
+        + "".join(f"{i + ' (s)':>16}" for i in methods)
+        + f'{"pattern (MB)":>16}'
+    )
+    for depth in [500, 1000, 2000, 5000, 10000, 20000, 50000]:
+        start = time.perf_counter()
+        formula = chain(depth)
+        line = f"{depth:>8}{time.perf_counter() - start:12.4f}"
+        for method in methods.values():
+            altrea.wffs.resetrenderings()
+            start = time.perf_counter()
+            method(formula)
+            line += f"{time.perf_counter() - start:16.4f}"
+        tracemalloc.start()
+        methods["pattern"](formula)
+        line += f"{tracemalloc.get_traced_memory()[1] / 2**20:16.1f}"
+        tracemalloc.stop()
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
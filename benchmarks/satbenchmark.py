@@ -0,0 +1,63 @@
+# satbenchmark.py
+"""This script compares the truth table and SAT methods of `Proof.checkvalidity`.
+
+Two families of arguments are timed for an increasing number of letters n:
+- chain: the premises P0 > P1, P1 > P2, ..., P(n-2) > P(n-1) entail P0 > P(n-1).  Since
+    the argument is valid every row of the truth table has to be evaluated.
+- broken chain: the same premises with the last one missing do not entail the goal.
+    The counterexample is not in the first rows of the table.
+
+Run it from the root of the repository with
+
+    python benchmarks/satbenchmark.py
+
+The truth table method is skipped once it would take too long.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from altrea.wffs import Implies
+from altrea.rules import Proof
+
+truthtablelimit = 22
+
+
+def chain(n: int, broken: bool = False):
+    prf = Proof()
+    letters = [prf.proposition("".join(["P", str(i)])) for i in range(n)]
+    prf.setlogic()
+    prf.goal(Implies(letters[0], letters[-1]))
+    last = n - 2 if broken else n - 1
+    for i in range(last):
+        prf.premise(Implies(letters[i], letters[i + 1]))
+    return prf
+
+
+def timeit(prf: Proof, method: str):
+    start = time.perf_counter()
+    status, counterexample = prf.checkvalidity(method)
+    return status, time.perf_counter() - start
+
+
+def main():
+    print(f'{"argument":<14}{"letters":>8}{"status":>10}{"truthtable (s)":>17}{"sat (s)":>10}')
+    for broken in [False, True]:
+        for n in [4, 8, 12, 16, 20, 22, 30, 50, 100, 200]:
+            prf = chain(n, broken)
+            status, sattime = timeit(prf, prf.method_sat)
+            if n <= truthtablelimit:
+                truthtablestatus, truthtabletime = timeit(prf, prf.method_truthtable)
+                assert truthtablestatus == status
+                truthtable = f'{truthtabletime:17.4f}'
+            else:
+                truthtable = f'{"-":>17}'
+            name = "broken chain" if broken else "chain"
+            print(f'{name:<14}{n:>8}{status:>10}{truthtable}{sattime:10.4f}')
+
+
+if __name__ == "__main__":
+    main()
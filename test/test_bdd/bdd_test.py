@@ -0,0 +1,181 @@
+"""------------------------------------------------------------------------------
+                                BDD
+------------------------------------------------------------------------------"""
+
+import pytest
+
+from altrea.wffs import And, Or, Not, Implies, Iff, Falsehood, Necessary, Possibly, Proposition
+from altrea.bdd import BDD, checkentailment, equivalent, tautology, order
+from altrea.rules import Proof
+import altrea.truthtables
+
+A = Proposition("A")
+B = Proposition("B")
+C = Proposition("C")
+P = [Proposition("".join(["P", str(i)])) for i in range(400)]
+t = Proof()
+
+
+def parity(letters: list):
+    """The equivalence of the letters joined from the left."""
+
+    formula = letters[0]
+    for i in letters[1:]:
+        formula = Iff(formula, i)
+    return formula
+
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# Equivalent formulas are the same node.
+
+testdata = [
+    ("manager.node(Implies(A, B)) == manager.node(Or(Not(A), B))", True),
+    ("manager.node(Not(And(A, B))) == manager.node(Or(Not(A), Not(B)))", True),
+    ("manager.node(Implies(A, B)) == manager.node(Implies(B, A))", False),
+    ("manager.node(Or(A, Not(A)))", BDD.true),
+    ("manager.node(And(A, Not(A)))", BDD.false),
+    ("manager.node(Necessary(A)) == manager.node(A)", True),
+    ("manager.node(Possibly(A))", BDD.true),
+    ("manager.node(Falsehood())", BDD.false),
+    ("manager.count(manager.node(Or(A, B)))", 3),
+    ("manager.size(manager.node(Iff(A, B)))", 5),
+    ("manager.satisfying(manager.node(And(Not(A), B)), [A, B, C])", [False, True, True]),
+    ("manager.satisfying(manager.node(And(A, Not(A))), [A])", None),
+    ("manager.node(manager.letters[0]) == manager.variable(A)", True),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_bdd_clean_1(input_n, expected):
+    manager = BDD([A, B])
+    assert eval(input_n) == expected
+
+
+# Entailment agrees with the truth table including the first counterexample.
+
+testdata = [
+    ("[A, Implies(A, B)]", "B"),
+    ("[Or(A, B)]", "A"),
+    ("[Implies(A, B), B]", "A"),
+    ("[]", "Or(A, Not(A))"),
+    ("[And(A, Not(A))]", "C"),
+    ("[Iff(A, B)]", "And(A, B)"),
+    ("[]", "C"),
+]
+
+
+@pytest.mark.parametrize("premises,goal", testdata)
+def test_bdd_clean_2(premises, goal):
+    expected = altrea.truthtables.findcounterexample(eval(premises), eval(goal), [A, B, C])
+    found = checkentailment(eval(premises), eval(goal), [A, B, C])
+    assert found[2] == expected[2]
+    if expected[2] is None:
+        assert found[:2] == tuple(bool(i) for i in expected[:2])
+
+
+# Formulas with far too many letters for a truth table.
+
+testdata = [
+    ("checkentailment([Implies(P[i], P[i + 1]) for i in range(399)], Implies(P[0], P[399]), P)", (True, True, None)),
+    ("checkentailment([Implies(P[i], P[i + 1]) for i in range(399)], Implies(P[399], P[0]), P)[2][:2]", [False, True]),
+    ("equivalent(parity(P[:300]), parity(list(reversed(P[:300]))))", True),
+    ("tautology(Iff(parity(P[:300]), parity(P[:300])))", True),
+    ("tautology(parity(P[:300]))", False),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_bdd_clean_3(input_n, expected):
+    assert eval(input_n) == expected
+
+
+# The order heuristics and the reclaiming of nodes.
+
+testdata = [
+    ("[str(i) for i in order([And(B, Or(A, B)), C])]", ["B", "A", "C"]),
+    ("[str(i) for i in order([And(A, Or(C, C)), C], 'frequency')]", ["C", "A"]),
+    ("len(manager) < 3000", True),
+    ("manager.node(parity(P[:300])) == node", True),
+    ("(manager.collect(forget=True) > 0, len(manager))", (True, 0)),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_bdd_clean_4(input_n, expected):
+    manager = BDD(threshold=100)
+    node = manager.node(parity(P[:300]))
+    assert eval(input_n) == expected
+
+
+# Kept nodes survive when the converted formulas are forgotten.
+
+def test_bdd_clean_5():
+    manager = BDD()
+    node = manager.keep(manager.node(Or(And(A, B), C)))
+    manager.node(Iff(A, C))
+    manager.collect(forget=True)
+    assert len(manager) == manager.size(node) - 2
+    assert manager.node(Or(C, And(B, A))) == node
+    manager.release(node)
+    manager.collect(forget=True)
+    assert len(manager) == 0
+
+
+# Reclaiming nodes partway through a conversion keeps the nodes still needed.
+
+testdata = [
+    ("[A, Implies(A, B)]", "B"),
+    ("[Or(A, B), Implies(A, C), Implies(B, C)]", "C"),
+    ("[Iff(A, Not(B)), Or(B, C)]", "Implies(A, C)"),
+    ("[And(Or(A, Not(C)), Iff(B, C))]", "Iff(Implies(A, B), Or(C, Not(A)))"),
+    ("[Not(Iff(A, Iff(B, C)))]", "Or(And(A, B), Not(C))"),
+    ("[Implies(P[i], P[i + 1]) for i in range(27)]", "Implies(P[0], P[27])"),
+    ("[Implies(P[i], P[i + 1]) for i in range(27)]", "Implies(P[27], P[0])"),
+    ("[parity(P[:12])]", "parity(list(reversed(P[:12])))"),
+]
+
+
+@pytest.mark.parametrize("premises,goal", testdata)
+def test_bdd_clean_collect(premises, goal):
+    letters = order(eval(premises) + [eval(goal)])
+    expected = checkentailment(eval(premises), eval(goal), letters, threshold=1 << 30)
+    assert checkentailment(eval(premises), eval(goal), letters, threshold=3) == expected
+
+
+# The proof checks validity, equivalence and the soundness of its rules.
+
+testdata = [
+    ("prf.checkvalidity(prf.method_bdd)", (t.label_invalid, {"A": False, "B": True})),
+    ("prf.checkvalidity(prf.method_bdd) == prf.checkvalidity()", True),
+    ("prf.equivalent(Implies(A, B), Or(Not(A), B))", True),
+    ("prf.equivalent(Implies(A, B), Implies(B, A))", False),
+    ("[i[2] for i in prf.soundness() if i[1] in ['imp elim', 'lem', 'iff intro']]", [True, True, True]),
+    ("[i[2] for i in prf.soundness() if i[1] in ['nec elim', 'id intro']]", [None, None]),
+    ("[i[2] for i in prf.soundness() if i[1] == 'affirm consequent']", [False]),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_bdd_clean_6(input_n, expected):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic()
+    prf.logicrules.append(["affirm consequent", "ConclusionPremises({0}, [{1}, Implies({0}, {1})])", "AC", ""])
+    prf.goal(A)
+    prf.premise(Or(A, B))
+    assert eval(input_n) == expected
+
+
+"""------------------------------------------------------------------------------
+                                Errors
+------------------------------------------------------------------------------"""
+
+# The heuristic must be known.
+
+def test_bdd_error_1():
+    with pytest.raises(ValueError):
+        order([A], "guess")
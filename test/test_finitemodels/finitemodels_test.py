@@ -0,0 +1,156 @@
+"""------------------------------------------------------------------------------
+                                FINITEMODELS
+------------------------------------------------------------------------------"""
+
+import pytest
+
+from altrea.wffs import (
+    And,
+    Or,
+    Not,
+    Implies,
+    Iff,
+    Falsehood,
+    ForAll,
+    ThereExists,
+    Attribute,
+    Relation,
+    Identity,
+    Connective,
+    Predicate,
+    Proposition,
+    Subject,
+    Variable,
+)
+from altrea.finitemodels import ModelFinder, countermodel
+from altrea.rules import Proof
+
+x = Variable("x")
+y = Variable("y")
+z = Variable("z")
+w = Variable("w")
+P = Predicate("P")
+Q = Predicate("Q")
+R = Connective("R", " R ")
+a = Subject("a")
+b = Subject("b")
+
+# The relation is irreflexive and transitive.
+order = [
+    ForAll([x], Not(Relation(R, x, x))),
+    ForAll([x, y, z], Implies(And(Relation(R, x, y), Relation(R, y, z)), Relation(R, x, z))),
+]
+
+# There are four distinct elements.
+four = ThereExists(
+    [x, y, z, w],
+    And(
+        And(And(Not(Identity(x, y)), Not(Identity(x, z))), And(Not(Identity(x, w)), Not(Identity(y, z)))),
+        And(Not(Identity(y, w)), Not(Identity(z, w))),
+    ),
+)
+
+
+def size(model):
+    """The number of elements of a model or None."""
+
+    return None if model is None else len(model.domain.elements)
+
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# The smallest countermodel of an invalid argument is found.
+
+testdata = [
+    ("[ForAll([x], Implies(Attribute(P, x), Attribute(Q, x)))]", "ForAll([x], Implies(Attribute(Q, x), Attribute(P, x)))", 1),
+    ("[ThereExists([x], Attribute(P, x))]", "ForAll([x], Attribute(P, x))", 2),
+    ("[ForAll([x], ThereExists([y], Relation(R, x, y)))]", "ThereExists([y], ForAll([x], Relation(R, x, y)))", 2),
+    ("[ForAll([x, y], Implies(Relation(R, x, y), Relation(R, y, x)))]", "ForAll([x], Relation(R, x, x))", 1),
+    ("[Attribute(P, a)]", "Attribute(P, b)", 2),
+    ("[ThereExists([x], Attribute(P, x)), ThereExists([x], Attribute(Q, x))]", "ThereExists([x], And(Attribute(P, x), Attribute(Q, x)))", 2),
+    ("[]", "Not(four)", 4),
+]
+
+
+@pytest.mark.parametrize("premises,goal,expected", testdata)
+def test_finitemodels_clean_1(premises, goal, expected):
+    premises = eval(premises)
+    goal = eval(goal)
+    model = countermodel(premises, goal)
+    assert size(model) == expected
+    assert all(model.evaluate(i) for i in premises)
+    assert not model.evaluate(goal)
+
+
+# A valid argument, or one whose countermodels are too large or infinite, has none.
+
+testdata = [
+    ("countermodel([ThereExists([y], ForAll([x], Relation(R, x, y)))], ForAll([x], ThereExists([y], Relation(R, x, y))))", None),
+    ("countermodel([Attribute(P, a), Not(Attribute(P, b))], Not(Identity(a, b)))", None),
+    ("countermodel([ForAll([x], Attribute(P, x))], Attribute(P, a))", None),
+    ("countermodel(order, ThereExists([x], ForAll([y], Not(Relation(R, x, y)))))", None),
+    ("countermodel([], Not(four), 3)", None),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_finitemodels_clean_2(input_n, expected):
+    assert eval(input_n) == expected
+
+
+# The model finder keeps its solver between the sizes and the formulas it is asked about.
+
+testdata = [
+    ("[finder.satisfiable([four], 1), finder.satisfiable([four], 3), finder.satisfiable([four], 5)]", [False, False, True]),
+    ("(finder.satisfiable([four], 4), size(finder.model))", (True, 4)),
+    ("(finder.satisfiable([four, Not(four)], 5), finder.model)", (False, None)),
+    ("finder.search([ForAll([x], Identity(x, a))], 3).subjects", {"a": 0}),
+    ("finder.satisfiable([ForAll([x], Falsehood())], 1)", False),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_finitemodels_clean_3(input_n, expected):
+    finder = ModelFinder([four, Identity(a, a)])
+    assert eval(input_n) == expected
+
+
+# A countermodel of the premises and goal of a proof.
+
+testdata = [
+    ("[ThereExists([x], Attribute(P, x))]", "ForAll([x], Attribute(P, x))", 2),
+    ("[ForAll([x], Attribute(P, x))]", "ThereExists([x], Attribute(P, x))", None),
+]
+
+
+@pytest.mark.parametrize("premises,goal,expected", testdata)
+def test_finitemodels_clean_4(premises, goal, expected):
+    prf = Proof()
+    prf.setlogic()
+    prf.goal(eval(goal))
+    for i in eval(premises):
+        prf.premise(i)
+    assert size(prf.findcountermodel(3)) == expected
+
+
+"""------------------------------------------------------------------------------
+                                Errors
+------------------------------------------------------------------------------"""
+
+testdata = [
+    ("ModelFinder([Proposition('A')])", ValueError),
+    ("ModelFinder([Attribute(P, P)])", ValueError),
+    ("ModelFinder([Attribute(P, x)]).satisfiable([Attribute(P, x)], 2)", ValueError),
+    ("ModelFinder([Attribute(P, a)]).satisfiable([Attribute(P, a)], 0)", ValueError),
+    ("finder.satisfiable([Attribute(P, b)], 2)", ValueError),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_finitemodels_error_1(input_n, expected):
+    finder = ModelFinder([Attribute(P, a)])
+    finder.satisfiable([Attribute(P, a)], 1)
+    with pytest.raises(expected):
+        eval(input_n)
@@ -0,0 +1,150 @@
+"""------------------------------------------------------------------------------
+                                INTERPRETATION
+------------------------------------------------------------------------------"""
+
+import numpy
+import pytest
+
+from altrea.wffs import (
+    And,
+    Or,
+    Not,
+    Implies,
+    Iff,
+    Falsehood,
+    ForAll,
+    ThereExists,
+    Attribute,
+    Relation,
+    Identity,
+    Connective,
+    Predicate,
+    Subject,
+    Variable,
+)
+from altrea.fol import Domain, Interpretation
+
+x = Variable("x")
+y = Variable("y")
+Even = Predicate("Even")
+Odd = Predicate("Odd")
+Less = Connective("Less", " < ")
+
+# The numbers 0 to 5 with the even ones and the order between them.
+numbers = Domain(list(range(6)), "N")
+even = [0, 2, 4]
+less = [(i, j) for i in range(6) for j in range(6) if i < j]
+
+# The numbers 0 to 2999 with the same predicate and relation given as arrays.
+size = 3000
+large = Domain(list(range(size)), "L")
+largeeven = numpy.arange(size) % 2 == 0
+largeless = numpy.triu(numpy.ones((size, size), dtype=bool), 1)
+
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# Closed formulas are true or false in the interpretation.
+
+testdata = [
+    ("model.evaluate(ForAll([x], Or(Attribute(Even, x), Not(Attribute(Even, x)))))", True),
+    ("model.evaluate(ThereExists([x], Attribute(Even, x)))", True),
+    ("model.evaluate(ForAll([x], Attribute(Even, x)))", False),
+    ("model.evaluate(ForAll([x], ThereExists([y], Relation(Less, x, y))))", False),
+    ("model.evaluate(ThereExists([x], ForAll([y], Or(Identity(x, y), Relation(Less, x, y)))))", True),
+    ("model.evaluate(ForAll([x], Not(Relation(Less, x, x))))", True),
+    ("model.evaluate(ForAll([x, y], Implies(Relation(Less, x, y), Not(Relation(Less, y, x)))))", True),
+    ("model.evaluate(ForAll([x, y], Iff(Identity(x, y), Identity(y, x))))", True),
+    ("model.evaluate(ThereExists([x], And(Attribute(Even, x), Relation(Less, Subject('3'), x))))", True),
+    ("model.evaluate(ThereExists([x], And(Attribute(Even, x), Relation(Less, x, Subject('0')))))", False),
+    ("model.evaluate(Attribute(Even, Subject('4')))", True),
+    ("model.evaluate(Relation(Less, Subject('3'), Subject('1')))", False),
+    ("model.evaluate(ForAll([x], Falsehood()))", False),
+    ("model.evaluate(ForAll([y], Attribute(Even, Subject('2'))))", True),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_interpretation_clean_1(input_n, expected):
+    model = Interpretation(numbers, {"Even": even}, {"Less": less})
+    assert eval(input_n) == expected
+
+
+# The assignments that make a formula, or what it quantifies, true or false.
+
+testdata = [
+    ("model.falsifying(ForAll([x], ThereExists([y], Relation(Less, x, y))))", [{"x": 5}]),
+    ("model.satisfying(ThereExists([x], Attribute(Even, x)), 2)", [{"x": 0}, {"x": 2}]),
+    ("model.satisfying(ForAll([x], Attribute(Even, x)))", [{"x": 0}, {"x": 2}, {"x": 4}]),
+    (
+        "model.satisfying(And(Relation(Less, x, y), Attribute(Even, y)), 3)",
+        [{"x": 0, "y": 2}, {"x": 0, "y": 4}, {"x": 1, "y": 2}],
+    ),
+    ("model.satisfying(ForAll([y, x], Relation(Less, x, y)), 2)", [{"y": 1, "x": 0}, {"y": 2, "x": 0}]),
+    ("model.falsifying(Attribute(Even, Subject('4')))", []),
+    ("model.satisfying(Attribute(Even, Subject('4')))", [{}]),
+    ("model.extension(And(Attribute(Even, x), Relation(Less, y, x)))[0]", ("x", "y")),
+    ("model.extension(Relation(Less, x, x))[1].tolist()", [False] * 6),
+    ("model.extension(Identity(x, Subject('2')))[1].tolist()", [False, False, True, False, False, False]),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_interpretation_clean_2(input_n, expected):
+    model = Interpretation(numbers, {"Even": even}, {"Less": less})
+    assert eval(input_n) == expected
+
+
+# A subject may be given the element it names.
+
+testdata = [
+    ("model.evaluate(Attribute(Even, Subject('zero')))", True),
+    ("model.evaluate(Relation(Less, Subject('zero'), Subject('1')))", True),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_interpretation_clean_3(input_n, expected):
+    model = Interpretation(numbers, {"Even": even}, {"Less": less}, {"zero": 0})
+    assert eval(input_n) == expected
+
+
+# A domain of thousands of elements is evaluated by whole arrays.
+
+testdata = [
+    ("model.evaluate(ForAll([x], ThereExists([y], Or(Identity(x, y), Relation(Less, x, y)))))", True),
+    ("model.falsifying(ForAll([x], ThereExists([y], Relation(Less, x, y))))", [{"x": size - 1}]),
+    ("model.evaluate(ForAll([x], ThereExists([y], And(Relation(Less, x, y), Not(Attribute(Even, y))))))", False),
+    ("len(model.satisfying(ThereExists([x], Attribute(Even, x))))", size // 2),
+    ("model.evaluate(ForAll([x, y], Implies(Relation(Less, x, y), Not(Relation(Less, y, x)))))", True),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_interpretation_clean_4(input_n, expected):
+    model = Interpretation(large, {"Even": largeeven}, {"Less": largeless})
+    assert eval(input_n) == expected
+
+
+"""------------------------------------------------------------------------------
+                                Errors
+------------------------------------------------------------------------------"""
+
+testdata = [
+    ("model.evaluate(Attribute(Even, x))", ValueError),
+    ("model.evaluate(ForAll([x], Attribute(Odd, x)))", ValueError),
+    ("model.evaluate(Attribute(Even, Subject('9')))", ValueError),
+    ("model.evaluate(ForAll([x], Attribute(Even, Even)))", ValueError),
+    ("Interpretation(numbers, {'Even': numpy.zeros(3, dtype=bool)})", ValueError),
+    ("Interpretation(numbers, {}, {'Less': [(0, 7)]})", ValueError),
+    ("Interpretation(Domain([], 'E'))", ValueError),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_interpretation_error_1(input_n, expected):
+    model = Interpretation(numbers, {"Even": even}, {"Less": less})
+    with pytest.raises(expected):
+        eval(input_n)
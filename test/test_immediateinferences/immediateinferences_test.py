@@ -0,0 +1,128 @@
+"""------------------------------------------------------------------------------
+                                IMMEDIATEINFERENCES
+------------------------------------------------------------------------------"""
+
+import pytest
+
+from altrea.terms import Term
+from altrea.categories import All, Some, No, SomeNot, Categorical
+from altrea.immediateinferences import (
+    inference_conversion,
+    opposition_contradictory,
+    opposition_contrary,
+    opposition_subcontrary,
+    opposition_subalternation,
+    closures,
+    complement,
+    categorical,
+    infer,
+    convert,
+    obvert,
+    contrapose,
+    opposition,
+    closure,
+)
+
+S = Term("dogs")
+P = Term("mortals")
+Q = Term("cats")
+
+
+def text(proposition):
+    """The proposition as a string or None."""
+
+    return None if proposition is None else str(proposition)
+
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# Conversion, obversion and contraposition.
+
+testdata = [
+    ("text(convert(No(S, P)))", "No mortals are dogs."),
+    ("text(convert(Some(S, P)))", "Some mortals are dogs."),
+    ("text(convert(All(S, P)))", None),
+    ("text(convert(All(S, P), True))", "Some mortals are dogs."),
+    ("text(convert(SomeNot(S, P), True))", None),
+    ("text(obvert(All(S, P)))", "No dogs are non-mortals."),
+    ("text(obvert(No(S, P)))", "All dogs are non-mortals."),
+    ("text(obvert(Some(S, P)))", "Some dogs are not non-mortals."),
+    ("text(obvert(SomeNot(S, P)))", "Some dogs are non-mortals."),
+    ("text(obvert(obvert(All(S, P))))", "All dogs are mortals."),
+    ("text(contrapose(All(S, P)))", "All non-mortals are non-dogs."),
+    ("text(contrapose(SomeNot(S, P)))", "Some non-mortals are not non-dogs."),
+    ("text(contrapose(No(S, P)))", None),
+    ("text(contrapose(No(S, P), True))", "Some non-mortals are not non-dogs."),
+    ("text(contrapose(Some(S, P), True))", None),
+    ("text(infer(All(Term('non-dogs'), P), inference_conversion, True))", "Some mortals are non-dogs."),
+    ("complement('non-dogs')", "dogs"),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_immediateinferences_clean_1(input_n, expected):
+    assert eval(input_n) == expected
+
+
+# The relations of the square of opposition.
+
+testdata = [
+    ("opposition(All(S, P), SomeNot(S, P))", opposition_contradictory),
+    ("opposition(Some(S, P), No(S, P))", opposition_contradictory),
+    ("opposition(All(S, P), No(S, P))", opposition_contrary),
+    ("opposition(Some(S, P), SomeNot(S, P))", opposition_subcontrary),
+    ("opposition(No(S, P), SomeNot(S, P))", opposition_subalternation),
+    ("opposition(Some(S, P), All(S, P))", opposition_subalternation),
+    ("opposition(All(S, P), All(S, P))", None),
+    ("opposition(All(S, P), SomeNot(P, S))", None),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_immediateinferences_clean_2(input_n, expected):
+    assert eval(input_n) == expected
+
+
+# The truth values which follow from a set of premises.
+
+testdata = [
+    ("len(closures)", 16),
+    ("closure([All(S, P)])[('O', 'dogs', 'mortals')]", False),
+    ("closure([All(S, P)])[('A', 'non-mortals', 'non-dogs')]", True),
+    ("('I', 'dogs', 'mortals') in closure([All(S, P)])", False),
+    ("closure([All(S, P)], True)[('I', 'dogs', 'mortals')]", True),
+    ("closure([All(S, P)], True)[('E', 'dogs', 'mortals')]", False),
+    ("closure([(Some(S, P), False)], True)[('E', 'mortals', 'dogs')]", True),
+    ("closure([(Some(S, P), False)], True)[('O', 'dogs', 'mortals')]", True),
+    ("closure([(SomeNot(S, P), False)])[('A', 'dogs', 'mortals')]", True),
+    ("len(closure([All(S, P)]))", 8),
+    ("len(closure([All(S, P), No(Q, P)]))", 16),
+    ("len(closure([All(S, P), All(Term('non-mortals'), Term('non-dogs'))]))", 8),
+    ("str(categorical('O', 'dogs', 'non-mortals'))", "Some dogs are not non-mortals."),
+    ("len(closure([All(Term(str(i)), P) for i in range(1000)], True))", 24000),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_immediateinferences_clean_3(input_n, expected):
+    assert eval(input_n) == expected
+
+
+"""------------------------------------------------------------------------------
+                                Errors
+------------------------------------------------------------------------------"""
+
+testdata = [
+    ("closure([All(S, P), SomeNot(S, P)])", ValueError),
+    ("closure([All(S, P), No(S, P)], True)", ValueError),
+    ("closure([All(S, P), (Some(S, P), False)], True)", ValueError),
+    ("obvert(Categorical())", ValueError),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_immediateinferences_error_1(input_n, expected):
+    with pytest.raises(expected):
+        eval(input_n)
@@ -0,0 +1,125 @@
+"""------------------------------------------------------------------------------
+                                KRIPKE
+------------------------------------------------------------------------------"""
+
+import numpy
+import pytest
+
+from altrea.wffs import (
+    And,
+    Or,
+    Not,
+    Implies,
+    Iff,
+    Falsehood,
+    Necessary,
+    Possibly,
+    Proposition,
+    StrictImplies,
+    StrictIff,
+    ConsistentWith,
+    ForAll,
+)
+from altrea.kripke import KripkeModel
+
+A = Proposition("A")
+B = Proposition("B")
+C = Proposition("C")
+
+# Three worlds in a chain 0 -> 1 -> 2 with 2 seeing only itself.
+chain = [[False, True, False], [False, False, True], [False, False, True]]
+
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# The truth sets of the connectives at every world.
+
+testdata = [
+    ("model.truthset(A).tolist()", [True, False, True]),
+    ("model.truthset(Necessary(A)).tolist()", [False, True, True]),
+    ("model.truthset(Possibly(A)).tolist()", [False, True, True]),
+    ("model.truthset(Possibly(B)).tolist()", [True, False, False]),
+    ("model.truthset(Necessary(Possibly(B))).tolist()", [False, False, False]),
+    ("model.truthset(StrictImplies(B, A)).tolist()", [False, True, True]),
+    ("model.truthset(StrictIff(A, B)).tolist()", [False, False, False]),
+    ("model.truthset(ConsistentWith(A, Not(B))).tolist()", [False, True, True]),
+    ("model.truthset(Implies(A, Necessary(A))).tolist()", [False, True, True]),
+    ("model.truthset(Necessary(Falsehood())).tolist()", [False, False, False]),
+    ("model.holds(Iff(A, Not(B)), 1)", True),
+    ("model.valid(Implies(Necessary(Implies(A, B)), Implies(Necessary(A), Necessary(B))))", True),
+    ("model.valid(Implies(Necessary(A), A))", False),
+    ("model.satisfiable(And(A, Not(Possibly(A))))", True),
+    ("model.counterexample([Necessary(A)], A)", 1),
+    ("model.counterexample([A, Implies(A, Possibly(A))], Possibly(A))", None),
+    ("model.counterexample([], Or(A, Not(A)))", None),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_kripke_clean_1(input_n, expected):
+    model = KripkeModel(chain, {A: {0, 2}, B: [False, True, False]})
+    assert eval(input_n) == expected
+
+
+# The frame conditions of the relation.
+
+testdata = [
+    ("KripkeModel(chain, {}).serial()", True),
+    ("KripkeModel(chain, {}).reflexive()", False),
+    ("KripkeModel(chain, {}).transitive()", False),
+    ("KripkeModel(chain, {}).euclidean()", False),
+    ("KripkeModel(numpy.eye(3), {}).symmetric()", True),
+    ("KripkeModel(numpy.ones((3, 3)), {}).euclidean()", True),
+    ("KripkeModel(numpy.triu(numpy.ones((3, 3))), {}).transitive()", True),
+    ("KripkeModel(numpy.triu(numpy.ones((3, 3))), {}).symmetric()", False),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_kripke_clean_2(input_n, expected):
+    assert eval(input_n) == expected
+
+
+# The axioms of a frame condition hold in a large model with that condition.
+
+testdata = [
+    ("Implies(Necessary(A), A)", "reflexive"),
+    ("Implies(Necessary(A), Necessary(Necessary(A)))", "transitive"),
+    ("Implies(Possibly(A), Necessary(Possibly(A)))", "euclidean"),
+    ("Implies(A, Necessary(Possibly(A)))", "symmetric"),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_kripke_clean_3(input_n, expected):
+    random = numpy.random.default_rng(0)
+    worlds = 2000
+    # An equivalence relation with 50 classes has all four conditions.
+    classes = random.integers(0, 50, worlds)
+    relation = classes[:, None] == classes[None, :]
+    model = KripkeModel(relation, {A: random.random(worlds) < 0.5})
+    assert getattr(model, expected)()
+    assert model.valid(eval(input_n))
+    # Without any accessible worlds only the axiom of reflexivity fails.
+    empty = KripkeModel(numpy.zeros((worlds, worlds), dtype=bool), {A: model.valuation[0]})
+    assert empty.valid(eval(input_n)) == (expected != "reflexive")
+
+
+"""------------------------------------------------------------------------------
+                                Errors
+------------------------------------------------------------------------------"""
+
+testdata = [
+    ("KripkeModel([[True, False]], {})", ValueError),
+    ("KripkeModel(chain, {A: [True]})", ValueError),
+    ("KripkeModel(chain, {A: {0}}).truthset(B)", ValueError),
+    ("KripkeModel(chain, {A: {0}}).truthset(ForAll([A], A))", ValueError),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_kripke_error_1(input_n, expected):
+    with pytest.raises(expected):
+        eval(input_n)
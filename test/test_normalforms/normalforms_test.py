@@ -0,0 +1,166 @@
+"""------------------------------------------------------------------------------
+                                NORMALFORMS
+------------------------------------------------------------------------------"""
+
+import pytest
+
+from altrea.wffs import (
+    And,
+    Or,
+    Not,
+    Implies,
+    Iff,
+    Falsehood,
+    Necessary,
+    Possibly,
+    Proposition,
+    StrictImplies,
+    StrictIff,
+    ConsistentWith,
+    ForAll,
+)
+from altrea.normalforms import NormalForms, nnf, cnf, dnf, tseitin
+from altrea.bdd import equivalent, tautology
+
+A = Proposition("A")
+B = Proposition("B")
+C = Proposition("C")
+P = [Proposition("".join(["P", str(i)])) for i in range(2000)]
+T = Not(Falsehood())
+
+
+def parity(letters: list):
+    """The equivalence of the letters joined from the left."""
+
+    formula = letters[0]
+    for i in letters[1:]:
+        formula = Iff(formula, i)
+    return formula
+
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# Negations are moved inward and the other connectives rewritten.
+
+testdata = [
+    ("nnf(Not(And(A, B)))", Or(Not(A), Not(B))),
+    ("nnf(Not(Or(A, Not(B))))", And(Not(A), B)),
+    ("nnf(Implies(A, B))", Or(Not(A), B)),
+    ("nnf(Not(Implies(A, B)))", And(A, Not(B))),
+    ("nnf(Iff(A, B))", And(Or(Not(A), B), Or(A, Not(B)))),
+    ("nnf(Not(Iff(A, B)))", And(Or(A, B), Or(Not(A), Not(B)))),
+    ("nnf(StrictImplies(A, B))", Necessary(Or(Not(A), B))),
+    ("nnf(Not(StrictImplies(A, B)))", Possibly(And(A, Not(B)))),
+    ("nnf(StrictIff(A, B))", Necessary(And(Or(Not(A), B), Or(A, Not(B))))),
+    ("nnf(Not(ConsistentWith(A, B)))", Necessary(Or(Not(A), Not(B)))),
+    ("nnf(Not(Necessary(Not(A))))", Possibly(A)),
+    ("nnf(Not(Not(A)))", A),
+    ("nnf(And(A, Not(Falsehood())))", A),
+    ("nnf(Or(A, Not(Falsehood())))", T),
+    ("nnf(Implies(Falsehood(), A))", T),
+    ("nnf(Necessary(Implies(A, A)))", Necessary(Or(Not(A), A))),
+    ("nnf(And(A, A))", A),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_normalforms_clean_1(input_n, expected):
+    assert eval(input_n) is expected
+
+
+# The clauses and terms are read off the negation normal form.
+
+testdata = [
+    ("converter.clauses(Or(A, And(B, C)))", [(A, B), (A, C)]),
+    ("converter.terms(And(A, Or(B, C)))", [(A, B), (A, C)]),
+    ("converter.clauses(Or(A, Not(A)))", []),
+    ("converter.terms(And(A, Not(A)))", []),
+    ("converter.clauses(Falsehood())", [()]),
+    ("converter.terms(Falsehood())", []),
+    ("converter.clauses(And(Or(A, B), Or(B, A)))", [(A, B)]),
+    ("converter.clauses(Not(StrictImplies(A, B)))", [(Possibly(And(A, Not(B))),)]),
+    ("converter.cnf(Iff(A, B)) is And(Or(Not(A), B), Or(A, Not(B)))", True),
+    ("converter.dnf(Iff(A, B)) is Or(And(Not(A), Not(B)), And(B, A))", True),
+    ("converter.cnf(Falsehood()) is Falsehood()", True),
+    ("converter.dnf(Implies(Falsehood(), A)) is converter.truth", True),
+    ("converter.formulafrom([(A, B), (C,)]) is And(Or(A, B), C)", True),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_normalforms_clean_2(input_n, expected):
+    converter = NormalForms()
+    assert eval(input_n) == expected
+
+
+# The normal forms have the same truth function as the formula.
+
+testdata = [
+    ("Iff(Iff(A, B), Not(C))"),
+    ("Implies(And(Implies(A, B), Implies(B, C)), Implies(A, C))"),
+    ("Not(Or(And(A, Not(B)), Iff(C, Falsehood())))"),
+    ("Or(And(A, B), Or(And(B, C), And(Not(A), Not(C))))"),
+    ("parity([A, B, C, A])"),
+]
+
+
+@pytest.mark.parametrize("input_n", testdata)
+def test_normalforms_clean_3(input_n):
+    formula = eval(input_n)
+    assert equivalent(formula, nnf(formula))
+    assert equivalent(formula, cnf(formula))
+    assert equivalent(formula, dnf(formula))
+
+
+# The Tseitin clauses are satisfiable exactly when the formula is and entail it.
+
+testdata = [
+    ("Iff(Iff(A, B), Not(C))", True),
+    ("And(A, Not(A))", False),
+    ("Not(Implies(And(Implies(A, B), Implies(B, C)), Implies(A, C)))", False),
+    ("Or(And(A, B), Not(Or(B, C)))", True),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_normalforms_clean_4(input_n, expected):
+    converter = NormalForms()
+    formula = eval(input_n)
+    encoded = converter.formulafrom(converter.tseitin(formula))
+    assert (not tautology(Not(encoded))) == expected
+    assert tautology(Implies(encoded, formula))
+
+
+# A shared subformula is converted once and the encoding stays linear.
+
+testdata = [
+    ("len(converter.tseitin(parity(P))) == 3 * len(converter.gates) + 1", True),
+    ("len(converter.tseitin(And(parity(P), A))) == 3 * len(converter.gates) + 1", True),
+    ("len(converter.gates) < 6 * len(P)", True),
+    ("str(converter.definitions[converter.tseitin(And(A, B))[-1][0]])", str(And(A, B))),
+    ("tseitin(Implies(Falsehood(), A))", []),
+    ("tseitin(Falsehood())", [()]),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_normalforms_clean_5(input_n, expected):
+    converter = NormalForms()
+    converter.tseitin(parity(P))
+    assert eval(input_n) == expected
+
+
+# A formula that is not a propositional connective is a letter.
+
+testdata = [
+    ("nnf(Not(quantified)) is Not(quantified)", True),
+    ("cnf(Or(quantified, And(A, B))) is And(Or(quantified, A), Or(quantified, B))", True),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_normalforms_clean_6(input_n, expected):
+    quantified = ForAll([A], B)
+    assert eval(input_n) == expected
@@ -0,0 +1,131 @@
+"""------------------------------------------------------------------------------
+                                PARSER
+------------------------------------------------------------------------------"""
+
+import pytest
+
+from altrea.wffs import (
+    And,
+    ConsistentWith,
+    Falsehood,
+    Identity,
+    Iff,
+    Implies,
+    Necessary,
+    Not,
+    Or,
+    Possibly,
+    Proposition,
+    StrictIff,
+    StrictImplies,
+    Truth,
+)
+from altrea.parser import parseformula
+
+A = Proposition("A")
+B = Proposition("B")
+C = Proposition("C")
+letters = {"A": A, "B": B, "C": C}
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# The infix syntax is read with precedence and returns the interned nodes.
+
+testdata = [
+    ("parseformula('A & ~B > C', letters)", Implies(And(A, Not(B)), C)),
+    ("parseformula('A | B & C', letters)", Or(A, And(B, C))),
+    ("parseformula('A > B > C', letters)", Implies(A, Implies(B, C))),
+    ("parseformula('A & B & C', letters)", And(And(A, B), C)),
+    ("parseformula('A -> B <-> ~B -> ~A', letters)", Iff(Implies(A, B), Implies(Not(B), Not(A)))),
+    ("parseformula('~(A ∧ B) ≡ ¬A ∨ ¬B', letters)", Iff(Not(And(A, B)), Or(Not(A), Not(B)))),
+    ("parseformula('☐◇A ⊰ □A', letters)", StrictImplies(Necessary(Possibly(A)), Necessary(A))),
+    ("parseformula('A ≣ B ∘ C', letters)", ConsistentWith(StrictIff(A, B), C)),
+    ("parseformula('A = B & ⊥', letters)", And(Identity(A, B), Falsehood())),
+    ("parseformula('((A))', letters)", A),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_parser_clean_1(input_n, expected):
+    assert eval(input_n) is expected
+
+
+# The text produced by tree() and __str__ is read back to the same node.
+
+formulas = [
+    Implies(And(A, Not(B)), C),
+    Or(Not(Not(A)), Iff(B, Necessary(C))),
+    StrictIff(Possibly(And(A, B)), Falsehood()),
+    ConsistentWith(Implies(A, Implies(B, C)), Not(Or(A, B))),
+    And(Identity(A, B), StrictImplies(B, A)),
+]
+
+testdata = [(i, "tree") for i in range(len(formulas))] + [(i, "str") for i in range(len(formulas))]
+
+
+@pytest.mark.parametrize("index,form", testdata)
+def test_parser_clean_2(index, form):
+    formula = formulas[index]
+    text = formula.tree() if form == "tree" else str(formula)
+    assert parseformula(text, letters) is formula
+
+
+# The two syntaxes can be mixed and new names become propositions in the dictionary.
+
+def test_parser_clean_3():
+    dictionary = {}
+    formula = parseformula("And(P, Q > P) | Falsehood", dictionary)
+    assert sorted(dictionary) == ["P", "Q"]
+    assert formula is Or(And(dictionary["P"], Implies(dictionary["Q"], dictionary["P"])), Falsehood())
+    assert parseformula("Q", dictionary) is dictionary["Q"]
+
+
+# Truth is read like the other constants.
+
+testdata = [
+    ("type(parseformula('Truth', letters))", Truth),
+    ("parseformula('A | ⊤()', letters).tree()", "Or(A, Truth)"),
+    ("parseformula(Implies(Truth(), A).tree(), letters).tree()", "Implies(Truth, A)"),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_parser_clean_4(input_n, expected):
+    assert eval(input_n) == expected
+
+
+# Formulas nested more deeply than the recursion limit are read back.
+
+def test_parser_clean_5():
+    formula = A
+    for i in range(5000):
+        formula = Implies(formula, Not(B)) if i % 2 else Implies(B, Necessary(formula))
+    assert parseformula(formula.tree(), letters) is formula
+    assert parseformula(str(formula), letters) is formula
+
+
+"""------------------------------------------------------------------------------
+                                Errors
+------------------------------------------------------------------------------"""
+
+testdata = [
+    "A &",
+    "A B",
+    "(A & B",
+    "A & B)",
+    "Foo(A)",
+    "Not(A, B)",
+    "A # B",
+    "",
+    "& A",
+    "And(A,)",
+    "(A, B)",
+]
+
+
+@pytest.mark.parametrize("text", testdata)
+def test_parser_error_1(text):
+    with pytest.raises(ValueError):
+        parseformula(text, letters)
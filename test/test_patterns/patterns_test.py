@@ -0,0 +1,72 @@
+"""------------------------------------------------------------------------------
+                                PATTERNS
+------------------------------------------------------------------------------"""
+
+import pytest
+
+from altrea.wffs import And, Or, Not, Implies, Falsehood, ConclusionPremises
+from altrea.patterns import compilepattern
+from altrea.rules import Proof
+
+t = Proof()
+A = t.proposition("A")
+B = t.proposition("B")
+C = t.proposition("C")
+d = t.objectdictionary
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# Instantiating a compiled pattern builds the same object eval would have.
+
+testdata = [
+    ("compilepattern('{0}').instantiate([And(A, B)], d)", And(A, B)),
+    ("compilepattern('And({0}, {1})').instantiate([A, B], d)", And(A, B)),
+    ("compilepattern('Implies({0}, Falsehood())').instantiate([A], d)", Implies(A, Falsehood())),
+    ("compilepattern('Or(C, Not({0}))').instantiate([A], d)", Or(C, Not(A))),
+    ("compilepattern('ConclusionPremises({1}, [{0}, Implies({0}, {1})])').instantiate([A, B], d).conclusion", B),
+    ("compilepattern('ConclusionPremises({1}, [{0}, Implies({0}, {1})])').instantiate([A, B], d).premises", [A, Implies(A, B)]),
+    ("compilepattern('ConclusionPremises(Or({0}, Not({0})), [])').instantiate([C], d).premises", []),
+    ("compilepattern('And({0}, {1})').slots", 2),
+    ("compilepattern('And({0}, {1})') is compilepattern('And({0}, {1})')", True),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_patterns_clean_1(input_n, expected):
+    assert eval(input_n) == expected
+
+
+# The substitution is logged without rendering the formulas until the log is read.
+
+def test_patterns_clean_2():
+    prf = Proof()
+    P = prf.proposition("P")
+    Q = prf.proposition("Q")
+    formula = prf.substitute("Implies({0}, {1})", [P, Q], "test")
+    message = prf.log[-1][0]
+    assert formula is Implies(P, Q)
+    assert message.text is None
+    assert "Implies(P, Q)" in str(message)
+    assert "{}".format(message) == str(message)
+
+
+"""------------------------------------------------------------------------------
+                                Errors
+------------------------------------------------------------------------------"""
+
+# Too few substitutions, unknown names and unreadable patterns.
+
+testdata = [
+    ("compilepattern('And({0}, {1})').instantiate([A], d)", IndexError),
+    ("compilepattern('And({0}, Q)').instantiate([A], d)", NameError),
+    ("compilepattern('And({0}, {1}')", ValueError),
+    ("compilepattern('And({0} {1})')", ValueError),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_patterns_error_1(input_n, expected):
+    with pytest.raises(expected):
+        eval(input_n)
@@ -0,0 +1,129 @@
+"""------------------------------------------------------------------------------
+                                APPLICABLERULES
+------------------------------------------------------------------------------"""
+
+import pytest
+
+from altrea.wffs import And, Or, Not, Implies, Falsehood
+from altrea.rules import Proof
+from altrea.discrimination import DiscriminationTree, formulakeys, patternkeys
+from altrea.patterns import compilepattern
+
+t = Proof()
+A = t.proposition("A")
+B = t.proposition("B")
+C = t.proposition("C")
+
+"""------------------------------------------------------------------------------
+                                   Clean Run
+------------------------------------------------------------------------------"""
+
+# The rules are listed with the lines they use and the substitutions the lines give.
+testdata = [
+    ("[[str(j) for j in i[3]] for i in applicable if i[1] == 'conj elim l']", [["A", "B"]]),
+    ("[i[2] for i in applicable if i[1] == 'conj elim r']", [[1]]),
+    ("[i[2] for i in applicable if i[1] == 'imp elim']", []),
+    ("[i[3][1] for i in applicable if i[1] == 'disj intro l' and i[2] == [2]]", [None]),
+    ("[i[2] for i in applicable if i[1] == 'conj intro']", [[1, 1], [1, 2], [2, 1], [2, 2]]),
+    ("[i[0] for i in applicable if i[1] == 'and to not or']", [t.axiom_name]),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_applicablerules_clean_1(input_n, expected):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    C = prf.proposition("C")
+    prf.setlogic()
+    prf.goal(C)
+    prf.premise(And(A, B))
+    prf.premise(Implies(A, C))
+    applicable = prf.applicablerules()
+    assert eval(input_n) == expected
+
+
+# The rules are found again for the lines added since they were last asked for.
+testdata = [
+    ("[i[2] for i in before if i[1] == 'imp elim']", []),
+    ("[i[2] for i in after if i[1] == 'imp elim']", [[3, 2]]),
+    ("[[str(j) for j in i[3]] for i in after if i[1] == 'imp elim']", [["A", "C"]]),
+    ("[i[2] for i in after if i[1] == 'neg elim']", [[3, 4]]),
+    ("sorted(prf.linecandidates)", [1, 2, 3, 4]),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_applicablerules_clean_2(input_n, expected):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    C = prf.proposition("C")
+    prf.setlogic()
+    prf.goal(Falsehood())
+    prf.premise(And(A, B))
+    prf.premise(Implies(A, C))
+    before = prf.applicablerules()
+    prf.rule("conj elim l", [], [1])
+    prf.premise(Not(A))
+    after = prf.applicablerules()
+    assert eval(input_n) == expected
+
+
+# Only the lines in the current subproof are used.
+testdata = [
+    ("[i[2] for i in applicable if i[1] == 'imp elim']", []),
+    ("[i[2] for i in applicable if i[1] == 'conj elim l']", [[3]]),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_applicablerules_clean_3(input_n, expected):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic()
+    prf.goal(Implies(And(A, B), B))
+    prf.premise(A)
+    prf.premise(Implies(A, B))
+    prf.opensubproof()
+    prf.hypothesis(And(A, B))
+    applicable = prf.applicablerules()
+    assert eval(input_n) == expected
+
+
+# The index is rebuilt when a rule is added to the logic.
+def test_applicablerules_clean_4():
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic()
+    prf.goal(B)
+    prf.premise(Or(A, B))
+    prf.applicablerules()
+    tree = prf.premisetree
+    prf.logicrules.append(["or swap", "ConclusionPremises(Or({1}, {0}), [Or({0}, {1})])", "Or Swap", ""])
+    applicable = prf.applicablerules()
+    assert prf.premisetree is not tree
+    assert [i[3] for i in applicable if i[1] == "or swap"] == [[A, B]]
+
+
+# The tree returns the premises having the shape of the formula.
+testdata = [
+    ("patternkeys(compilepattern('Implies({0}, And({1}, {0}))').root)", [("Implies", 2), "*", ("And", 2), "*", "*"]),
+    ("formulakeys(Implies(A, And(B, A)))", ([("Implies", 2), ("Proposition", 0), ("And", 2), ("Proposition", 0), ("Proposition", 0)], [5, 2, 5, 4, 5])),
+    ("sorted(tree.candidates(Implies(A, And(B, A))))", [1, 2, 3]),
+    ("sorted(tree.candidates(Implies(A, B)))", [1, 2]),
+    ("sorted(tree.candidates(And(A, B)))", [2]),
+    ("len(tree)", 4),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_applicablerules_clean_5(input_n, expected):
+    tree = DiscriminationTree()
+    tree.insert(compilepattern("Implies({0}, {1})").root, 1)
+    tree.insert(compilepattern("{0}").root, 2)
+    tree.insert(compilepattern("Implies({0}, And({1}, {0}))").root, 3)
+    tree.insert(compilepattern("Or({0}, {1})").root, 4)
+    assert eval(input_n) == expected
@@ -0,0 +1,254 @@
+"""------------------------------------------------------------------------------
+                                AUTOPROVE
+------------------------------------------------------------------------------"""
+
+import pytest
+import threading
+import time
+
+from altrea.wffs import And, Or, Not, Implies, Iff
+from altrea.rules import Proof
+import altrea.wffs
+import altrea.search
+
+t = Proof()
+A = t.proposition("A")
+B = t.proposition("B")
+C = t.proposition("C")
+D = t.proposition("D")
+
+"""------------------------------------------------------------------------------
+                                   Clean Run
+------------------------------------------------------------------------------"""
+
+# A chain of implications is proved in a subproof.
+testdata = [
+    ("found", True),
+    ("prf.status", t.complete),
+    ("len(prf.lines)", 9),
+    ("str(prf.lines[3][prf.statementindex])", str(A)),
+    ("prf.lines[3][prf.ruleindex]", t.hypothesis_name),
+    ("prf.lines[4][prf.ruleindex]", t.reiterate_name),
+    ("prf.lines[5][prf.linesindex]", "3, 4"),
+    ("str(prf.lines[8][prf.statementindex])", str(Implies(A, C))),
+    ("prf.lines[8][prf.proofsindex]", "3-7"),
+    ("prf.proofcode[-3]", 'proofcode.rule("imp elim", [B, C], [5, 6])'),
+    ("prf.proofcode[-1]", "proofcode.implication_intro()"),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_autoprove_clean_1(input_n, expected):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    C = prf.proposition("C")
+    prf.setlogic()
+    prf.goal(Implies(A, C))
+    prf.premise(Implies(A, B))
+    prf.premise(Implies(B, C))
+    found = prf.autoprove()
+    assert eval(input_n) == expected
+
+
+# Tautologies and entailments of the default logic are proved.
+testdata = [
+    ("Implies(A, Implies(B, A))", []),
+    ("Implies(Implies(A, Implies(B, C)), Implies(Implies(A, B), Implies(A, C)))", []),
+    ("Implies(Implies(Implies(A, B), A), A)", []),
+    ("Implies(Implies(A, B), Implies(Not(B), Not(A)))", []),
+    ("Implies(Or(A, B), Or(B, A))", []),
+    ("Or(A, Not(A))", []),
+    ("And(B, A)", ["And(A, B)"]),
+    ("Or(C, D)", ["Or(A, B)", "Implies(A, C)", "Implies(B, D)"]),
+    ("Iff(A, B)", ["Implies(A, B)", "Implies(B, A)"]),
+    ("Not(A)", ["Implies(A, B)", "Not(B)"]),
+    ("A", ["Not(Not(A))"]),
+]
+
+
+@pytest.mark.parametrize("goal,premises", testdata)
+def test_autoprove_clean_2(goal, premises):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    C = prf.proposition("C")
+    D = prf.proposition("D")
+    prf.setlogic()
+    prf.goal(eval(goal))
+    for i in premises:
+        prf.premise(eval(i))
+    assert prf.autoprove() is True
+    assert prf.status == prf.complete
+
+
+# The proof code of a derivation that was found checks as a proof written by hand.
+def test_autoprove_clean_3():
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic()
+    prf.goal(Implies(Implies(Implies(A, B), A), A))
+    prf.autoprove()
+    namespace = {"Proof": Proof}
+    namespace.update({i: getattr(altrea.wffs, i) for i in altrea.wffs.__dict__ if i[0].isupper()})
+    exec("\n".join(prf.proofcode), namespace)
+    assert namespace["proofcode"].status == t.complete
+    assert len(namespace["proofcode"].lines) == len(prf.lines)
+
+
+# A goal may be proved within an open subproof using lines of the main proof.
+testdata = [
+    ("found", True),
+    ("str(prf.lines[-1][prf.statementindex])", str(C)),
+    ("prf.lines[-1][prf.proofidindex]", 1),
+    ("prf.proofcode[-4]", "proofcode.reiterate(1)"),
+    ("prf.proofcode[-2]", "proofcode.reiterate(2)"),
+    ("prf.status", ""),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_autoprove_clean_4(input_n, expected):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    C = prf.proposition("C")
+    prf.setlogic()
+    prf.goal(Implies(A, C))
+    prf.premise(Implies(A, B))
+    prf.premise(Implies(B, C))
+    prf.opensubproof()
+    prf.hypothesis(A)
+    found = prf.autoprove(C)
+    assert eval(input_n) == expected
+
+
+"""------------------------------------------------------------------------------
+                                Not Found
+------------------------------------------------------------------------------"""
+
+# A statement that does not follow is not found and the proof is left as it was.
+testdata = [
+    ("found", False),
+    ("len(prf.lines)", 2),
+    ("prf.status", ""),
+    ("prf.log[-1][0].startswith(t.autoprove_name.upper())", True),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_autoprove_notfound_1(input_n, expected):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic()
+    prf.goal(B)
+    prf.premise(A)
+    found = prf.autoprove(maxdepth=4)
+    assert eval(input_n) == expected
+
+
+# The search stops when it has searched the number of goals allowed.
+testdata = [
+    ("found", False),
+    ("len(prf.lines)", 1),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_autoprove_notfound_2(input_n, expected):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic()
+    prf.goal(Implies(Implies(Implies(A, B), A), A))
+    found = prf.autoprove(maxnodes=10)
+    assert eval(input_n) == expected
+
+
+# The budget of goals is given to each goal searched, not to the search as a whole.
+def test_autoprove_notfound_3():
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic()
+    search = altrea.search.Search(prf.premisetables(), prf.objectdictionary, maxdepth=6, maxnodes=200)
+    assert search.prove([A], B) is None
+    assert search.nodes > 200
+    assert search.prove([A, Implies(A, B)], B) is not None
+    assert search.prove([], Implies(A, Implies(B, A))) is not None
+
+
+"""------------------------------------------------------------------------------
+                                Parallel
+------------------------------------------------------------------------------"""
+
+# The backward steps from the goal are divided among processes.
+testdata = [
+    ("Implies(Implies(Implies(A, B), A), A)", []),
+    ("Implies(Implies(A, B), Implies(Not(B), Not(A)))", []),
+    ("Or(C, D)", ["Or(A, B)", "Implies(A, C)", "Implies(B, D)"]),
+    ("And(B, A)", ["And(A, B)"]),
+]
+
+
+@pytest.mark.parametrize("goal,premises", testdata)
+def test_autoprove_parallel_1(goal, premises):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    C = prf.proposition("C")
+    D = prf.proposition("D")
+    prf.setlogic()
+    prf.goal(eval(goal))
+    for i in premises:
+        prf.premise(eval(i))
+    assert prf.autoprove(processes=2) is True
+    assert prf.status == prf.complete
+
+
+# A statement that does not follow is not found by any process.
+def test_autoprove_parallel_2():
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic()
+    prf.goal(B)
+    prf.premise(A)
+    assert prf.autoprove(maxdepth=4, processes=2) is False
+    assert len(prf.lines) == 2
+
+
+# A worker keeps its table from one task to the next and gives each task its own budget.
+def test_autoprove_parallel_4():
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic()
+    search = altrea.search.ParallelSearch(prf.premisetables(), prf.objectdictionary, 6, 100)
+    givens = frozenset([A])
+    search.start(givens, B)
+    steps = list(search.steps(givens, search.closure(givens), B))
+    altrea.search.startworker(search.rows, prf.objectdictionary, (6, 100, 10.0), time.time() + 10, {}, threading.Event())
+    found = []
+    for step in steps[:2]:
+        derivation, nodes, depth = altrea.search.provetask(altrea.search.encode(([A], B, step)))
+        found.append((derivation, nodes, len(altrea.search.worker.table)))
+    assert [i[:2] for i in found] == [(None, 101), (None, 101)]
+    assert found[0][2] < found[1][2]
+
+
+# Derivations are sent between processes as text and read back as the same objects.
+testdata = [
+    ("altrea.search.encode(Implies(A, Not(B)))", ("formula", "Implies(A, Not(B))")),
+    ("altrea.search.decode(altrea.search.encode(Implies(A, Not(B))), t.objectdictionary) is Implies(A, Not(B))", True),
+    ("altrea.search.decode(altrea.search.encode(derivation), t.objectdictionary) == derivation", True),
+    ("altrea.search.encode([None, 'imp elim'])", [None, "imp elim"]),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_autoprove_parallel_3(input_n, expected):
+    derivation = ("apply", t.rule_name, "imp elim", [A, B], [("have", A), ("have", Implies(A, B))], B)
+    assert eval(input_n) == expected
@@ -0,0 +1,118 @@
+"""------------------------------------------------------------------------------
+                                CHECKVALIDITY
+------------------------------------------------------------------------------"""
+
+import pytest
+
+from altrea.wffs import And, Or, Not, Implies
+from altrea.rules import Proof
+
+t = Proof()
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# The status agrees with the truth table and a counterexample is given when invalid.
+
+testdata = [
+    ("[A, Implies(A, B)]", "B", True, (t.label_valid, None)),
+    ("[Or(A, B)]", "A", True, (t.label_invalid, {"A": False, "B": True, "C": True})),
+    ("[Implies(A, B), B]", "A", True, (t.label_invalid, {"A": False, "B": True, "C": True})),
+    ("[]", "Or(A, Not(A))", True, (t.label_tautology, None)),
+    ("[And(A, Not(A))]", "C", True, (t.label_vacuous, None)),
+    ("[And(A, Not(A))]", "C", False, (t.label_valid, None)),
+    ("[]", "C", True, (t.label_invalid, {"A": True, "B": True, "C": False})),
+]
+
+
+@pytest.mark.parametrize("premises,goal,restricted,expected", testdata)
+def test_checkvalidity_clean_1(premises, goal, restricted, expected):
+    prf = Proof()
+    prf.setrestricted(restricted)
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    C = prf.proposition("C")
+    prf.setlogic()
+    prf.goal(eval(goal))
+    for i in eval(premises):
+        prf.premise(i)
+    assert prf.checkvalidity() == expected
+    assert prf.checkvalidity()[0] == prf.truthtable(verdict=True)
+
+
+# An invalid argument with many letters is decided at the first counterexample.
+
+def test_checkvalidity_clean_2():
+    prf = Proof()
+    letters = [prf.proposition("".join(["P", str(i)])) for i in range(40)]
+    prf.setlogic()
+    prf.goal(letters[0])
+    prf.premise(letters[1])
+    status, counterexample = prf.checkvalidity()
+    assert status == prf.label_invalid
+    assert counterexample["P0"] is False
+    assert counterexample["P1"] is True
+
+
+# The sat method agrees with the truth table method.
+
+testdata = [
+    ("[A, Implies(A, B)]", "B", True, (t.label_valid, None)),
+    ("[Or(A, B)]", "A", True, (t.label_invalid, {"A": False, "B": True, "C": True})),
+    ("[]", "Or(A, Not(A))", True, (t.label_tautology, None)),
+    ("[And(A, Not(A))]", "C", True, (t.label_vacuous, None)),
+    ("[And(A, Not(A))]", "C", False, (t.label_valid, None)),
+    ("[Implies(A, B), Implies(B, C)]", "Implies(A, C)", True, (t.label_valid, None)),
+]
+
+
+@pytest.mark.parametrize("premises,goal,restricted,expected", testdata)
+def test_checkvalidity_clean_3(premises, goal, restricted, expected):
+    prf = Proof()
+    prf.setrestricted(restricted)
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    C = prf.proposition("C")
+    prf.setlogic()
+    prf.goal(eval(goal))
+    for i in eval(premises):
+        prf.premise(i)
+    assert prf.checkvalidity(prf.method_sat) == expected
+
+
+# A valid argument with too many letters for a truth table.
+
+def test_checkvalidity_clean_4():
+    prf = Proof()
+    letters = [prf.proposition("".join(["P", str(i)])) for i in range(60)]
+    prf.setlogic()
+    prf.goal(Implies(letters[0], letters[-1]))
+    for i in range(59):
+        prf.premise(Implies(letters[i], letters[i + 1]))
+    assert prf.checkvalidity(prf.method_sat) == (prf.label_valid, None)
+
+
+"""------------------------------------------------------------------------------
+                                Errors
+------------------------------------------------------------------------------"""
+
+# A goal is required.
+
+def test_checkvalidity_error_1():
+    prf = Proof()
+    prf.proposition("A")
+    prf.setlogic()
+    with pytest.raises(ValueError):
+        prf.checkvalidity()
+
+
+# The method must be known.
+
+def test_checkvalidity_error_2():
+    prf = Proof()
+    A = prf.proposition("A")
+    prf.setlogic()
+    prf.goal(A)
+    with pytest.raises(ValueError):
+        prf.checkvalidity("guess")
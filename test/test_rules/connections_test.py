@@ -0,0 +1,96 @@
+"""------------------------------------------------------------------------------
+                                CONNECTIONS
+------------------------------------------------------------------------------"""
+
+import threading
+
+import pytest
+
+import altrea.data
+
+
+def otherthread(path: str):
+    """Return the connection another thread gets from the pool."""
+
+    result = []
+    thread = threading.Thread(target=lambda: result.append(altrea.data.connect(path)))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# The same connection is returned to the same thread and a different one to another thread.
+
+testdata = [
+    ("altrea.data.connect(altrea.data.metadata) is altrea.data.connect(altrea.data.metadata)", True),
+    ("otherthread(altrea.data.metadata) is altrea.data.connect(altrea.data.metadata)", False),
+    ("altrea.data.connect(altrea.data.metadata).execute('SELECT 1').fetchone()", (1,)),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_connections_clean_1(input_n, expected):
+    assert eval(input_n) == expected
+
+
+# Closing the pool opens a new connection on the next call.
+
+def test_connections_clean_2():
+    first = altrea.data.connect(altrea.data.metadata)
+    altrea.data.closeconnections()
+    assert len(altrea.data.pool) == 0
+    second = altrea.data.connect(altrea.data.metadata)
+    assert second is not first
+    assert second.execute("SELECT 1").fetchone() == (1,)
+
+
+# Work not yet committed survives a nested call and is rolled back when a pooled call fails.
+
+@altrea.data.pooled
+def failinsert():
+    altrea.data.connect(altrea.data.metadata).execute(
+        "INSERT INTO logics (logic, database, description) VALUES (?, ?, ?)",
+        ("_pooltest_", "_pooltest_", "_pooltest_"),
+    )
+    raise ValueError("failed")
+
+
+def test_connections_clean_3():
+    connection = altrea.data.connect(altrea.data.metadata)
+    connection.execute(
+        "INSERT INTO logics (logic, database, description) VALUES (?, ?, ?)",
+        ("_pooltest_", "_pooltest_", "_pooltest_"),
+    )
+    connection = altrea.data.connect(altrea.data.metadata)
+    assert connection.in_transaction is True
+    connection.rollback()
+    with pytest.raises(ValueError):
+        failinsert()
+    assert connection.in_transaction is False
+    row = connection.execute("SELECT COUNT(*) FROM logics WHERE logic=?", ("_pooltest_",)).fetchone()
+    assert row == (0,)
+
+
+# The connections of a thread are closed when it ends.
+
+def test_connections_clean_5():
+    connection = otherthread(altrea.data.metadata)
+    with pytest.raises(altrea.data.sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
+
+
+# The database of a logic is cached once it has been found and forgotten when the logic is deleted.
+
+def test_connections_clean_4():
+    altrea.data.deletelogic("_pooltest_")
+    altrea.data.addlogic("_pooltest_", "_pooltest_", "_pooltest_")
+    assert altrea.data.getdatabase("_pooltest_") == "altrea/data/_pooltest_.db"
+    assert altrea.data.databases["_pooltest_"] == "altrea/data/_pooltest_.db"
+    altrea.data.deletelogic("_pooltest_")
+    assert "_pooltest_" not in altrea.data.databases
+    with pytest.raises(UnboundLocalError):
+        altrea.data.getdatabase("_pooltest_")
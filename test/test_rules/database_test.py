@@ -629,10 +629,10 @@ def test_database_lemma_nosuchproof_1(input_n, expected):
 
 """------------------------------------------------------------------------------
                                   Stopped Run
-                                stopped_nosubs
+                                stopped_cannotinfersubs
 ------------------------------------------------------------------------------"""
 
-# Error: no substitution values
+# Error: no substitution values and no lines to infer them from
 
 testdata = [
     ("len(prf.lines)", 2),
@@ -645,14 +645,14 @@ testdata = [
     ("prf.lines[1][prf.proofsindex]", ""),
     (
         "prf.lines[1][prf.commentindex]",
-        t.stopped + t.colon_connector + t.stopped_nosubs,
+        t.stopped + t.colon_connector + t.stopped_cannotinfersubs,
     ),
     ("prf.lines[1][prf.typeindex]", ""),
 ]
 
 
 @pytest.mark.parametrize("input_n,expected", testdata)
-def test_database_lemma_nosubs_1(input_n, expected):
+def test_database_lemma_cannotinfersubs_1(input_n, expected):
     prf = Proof()
     A = prf.proposition("A")
     B = prf.proposition("B")
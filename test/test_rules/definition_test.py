@@ -172,27 +172,27 @@ def test_definition_premiseslengthsdontmatch_2(input_n, expected):
 
 
 """------------------------------------------------------------------------------
-                                stopped_nosubs
+                                Inferred Substitutions
 ------------------------------------------------------------------------------"""
 
 
-# Error: No substitutes were entered.
+# No substitutes were entered so they are inferred from the line.
 
 testdata = [
     ('len(prf.lines)', 5),
     #
-    ("str(prf.lines[4][prf.statementindex])", t.blankstatement),
+    ("str(prf.lines[4][prf.statementindex])", str(Iff(A, B))),
     ("prf.lines[4][prf.levelindex]", 0),
     ("prf.lines[4][prf.proofidindex]", 0),
     #("prf.lines[4][prf.ruleindex]", "Iff Intro"),
-    ("prf.lines[4][prf.linesindex]", ""),
+    ("prf.lines[4][prf.linesindex]", "3"),
     ("prf.lines[4][prf.proofsindex]", ""),
-    ("prf.lines[4][prf.commentindex]", t.stopped + t.colon_connector + t.stopped_nosubs),
-    ("prf.lines[4][prf.typeindex]", ""),
+    ("prf.lines[4][prf.commentindex]", ""),
+    ("prf.lines[4][prf.typeindex]", t.linetype_definition),
     #
 ]
 @pytest.mark.parametrize("input_n,expected", testdata)
-def test_definition_nosubs_1(input_n, expected):
+def test_definition_infersubs_1(input_n, expected):
     prf = Proof()
     A = prf.proposition('A')
     B = prf.proposition('B')
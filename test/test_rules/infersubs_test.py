@@ -0,0 +1,146 @@
+"""------------------------------------------------------------------------------
+                                INFERSUBS
+------------------------------------------------------------------------------"""
+
+import pytest
+
+from altrea.wffs import And, Or, Not, Implies, Falsehood
+from altrea.rules import Proof
+from altrea.patterns import compilepattern
+
+t = Proof()
+A = t.proposition("A")
+B = t.proposition("B")
+C = t.proposition("C")
+
+"""------------------------------------------------------------------------------
+                                   Clean Run
+------------------------------------------------------------------------------"""
+
+# The substitutions are inferred from the lines when the list is empty.
+testdata = [
+    ("len(prf.lines)", 8),
+    ("str(prf.lines[3][prf.statementindex])", str(A)),
+    ("str(prf.lines[4][prf.statementindex])", str(And(A, A))),
+    ("str(prf.lines[5][prf.statementindex])", str(C)),
+    ("prf.lines[5][prf.linesindex]", "3, 2"),
+    ("str(prf.lines[7][prf.statementindex])", str(Falsehood())),
+    ("prf.proofcode[-1]", 'proofcode.rule("neg elim", [], [3, 6])'),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_infersubs_clean_1(input_n, expected):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    C = prf.proposition("C")
+    prf.setlogic()
+    prf.goal(Falsehood())
+    prf.premise(And(A, B))
+    prf.premise(Implies(A, C))
+    prf.rule("conj elim l", [], [1])
+    prf.rule("conj intro", [], [3, 3])
+    prf.rule("imp elim", [], [3, 2])
+    prf.premise(Not(A))
+    prf.rule("neg elim", [], [3, 6])
+    assert eval(input_n) == expected
+
+
+# The template walks the object alongside the pattern.
+testdata = [
+    ("compilepattern('ConclusionPremises({1}, [{0}, Implies({0}, {1})])').match((2, 'Implies', ((0, 0), (0, 1)), {}), Implies(A, B), subs, dictionary)", True),
+    ("compilepattern('{0}').match((2, 'Implies', ((0, 0), (0, 0)), {}), Implies(A, B), subs, dictionary)", False),
+    ("compilepattern('{0}').match((2, 'Or', ((0, 0), (0, 1)), {}), Implies(A, B), subs, dictionary)", False),
+    ("compilepattern('{0}').match((2, 'Falsehood', (), {}), Falsehood(), subs, dictionary)", True),
+    ("len(compilepattern('ConclusionPremises({2}, [Or({0}, {1}), Implies({0}, {2}), Implies({1}, {2})])').premises())", 3),
+    ("compilepattern('{0}').premises()", ()),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_infersubs_clean_2(input_n, expected):
+    subs = {}
+    dictionary = t.objectdictionary
+    assert eval(input_n) == expected
+
+
+"""------------------------------------------------------------------------------
+                              stopped_premisesdontmatch
+------------------------------------------------------------------------------"""
+
+# The line does not have the form of the premise.
+testdata = [
+    ("len(prf.lines)", 3),
+    ("str(prf.lines[2][prf.statementindex])", t.blankstatement),
+    (
+        "prf.lines[2][prf.commentindex]",
+        t.stopped + t.colon_connector + t.stopped_premisesdontmatch,
+    ),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_infersubs_premisesdontmatch_1(input_n, expected):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic()
+    prf.goal(B)
+    prf.premise(Or(A, B))
+    prf.rule("conj elim l", [], [1])
+    assert eval(input_n) == expected
+
+
+"""------------------------------------------------------------------------------
+                              stopped_premiseslengthsdontmatch
+------------------------------------------------------------------------------"""
+
+# There are fewer lines than premises.
+testdata = [
+    ("len(prf.lines)", 3),
+    ("str(prf.lines[2][prf.statementindex])", t.blankstatement),
+    (
+        "prf.lines[2][prf.commentindex]",
+        t.stopped + t.colon_connector + t.stopped_premiseslengthsdontmatch,
+    ),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_infersubs_premiseslengthsdontmatch_1(input_n, expected):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic()
+    prf.goal(B)
+    prf.premise(A)
+    prf.rule("imp elim", [], [1])
+    assert eval(input_n) == expected
+
+
+"""------------------------------------------------------------------------------
+                              stopped_cannotinfersubs
+------------------------------------------------------------------------------"""
+
+# A metavariable only occurs in the conclusion.
+testdata = [
+    ("len(prf.lines)", 3),
+    ("str(prf.lines[2][prf.statementindex])", t.blankstatement),
+    (
+        "prf.lines[2][prf.commentindex]",
+        t.stopped + t.colon_connector + t.stopped_cannotinfersubs,
+    ),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_infersubs_cannotinfersubs_1(input_n, expected):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic()
+    prf.goal(Or(B, A))
+    prf.premise(A)
+    prf.rule("disj intro r", [], [1])
+    assert eval(input_n) == expected
@@ -0,0 +1,99 @@
+"""------------------------------------------------------------------------------
+                                LEMMA CACHE
+------------------------------------------------------------------------------"""
+
+import pytest
+
+from altrea.wffs import Implies
+from altrea.rules import Proof
+import altrea.data
+
+t = Proof()
+
+logicname = "_lemmacache_"
+
+altrea.data.deletelogic(logicname)
+altrea.data.addlogic(logicname, logicname, "A logic for testing the lemma cache.")
+
+
+def saveproof():
+    prf = Proof("mplemma", "MP Lemma", "A saved proof with premises.")
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic(logicname)
+    prf.goal(B)
+    prf.premise(A)
+    prf.premise(Implies(A, B))
+    prf.entailment(
+        prf.mvbeta,
+        [prf.mvalpha, Implies(prf.mvalpha, prf.mvbeta)],
+        name="mp",
+        displayname="mp",
+        description="modusponens",
+        kind=prf.label_rule)
+    prf.rule("mp", [A, B], [1, 2])
+    prf.saveproof()
+
+
+def uselemma(times: int):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic(logicname)
+    prf.goal(Implies(B, A))
+    prf.premise(A)
+    prf.premise(Implies(A, B))
+    for i in range(times):
+        prf.lemma("mplemma", [A, B], [1, 2])
+    return prf
+
+
+saveproof()
+
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# The saved proof is read once and then taken from the cache while the goal is not reached.
+
+testdata = [
+    ("str(prf.lines[3][prf.statementindex])", "B"),
+    ("prf.lines[3][prf.typeindex]", t.linetype_lemma),
+    ("str(prf.lines[5][prf.statementindex])", "B"),
+    ("prf.lemmacacheinfo()['misses']", 1),
+    ("prf.lemmacacheinfo()['hits']", 4),
+    ("prf.lemmacacheinfo()['size']", 1),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_lemmacache_clean_1(input_n, expected):
+    altrea.data.lemmacache.clear()
+    prf = uselemma(5)
+    assert eval(input_n) == expected
+
+
+# Removing and saving the proof again drops it from the cache.
+
+def test_lemmacache_clean_2():
+    altrea.data.lemmacache.clear()
+    prf = uselemma(2)
+    assert ("_lemmacache_", "mplemma") in altrea.data.lemmacache.entries
+    prf.removeproof("mplemma")
+    assert ("_lemmacache_", "mplemma") not in altrea.data.lemmacache.entries
+    saveproof()
+    prf = uselemma(1)
+    assert prf.lemmacacheinfo()["misses"] == 2
+    assert str(prf.lines[-1][prf.statementindex]) == "B"
+
+
+# Only the least recently used entries are kept.
+
+def test_lemmacache_clean_3():
+    cache = altrea.data.LemmaCache(maxsize=1)
+    cache.entries[("a", "x")] = 1
+    cache.entries[("a", "y")] = 2
+    assert cache.get("a", "x") == 1
+    cache.invalidate("a")
+    assert cache.info() == {"hits": 1, "misses": 0, "size": 0, "maxsize": 1}
@@ -0,0 +1,82 @@
+"""------------------------------------------------------------------------------
+                            MULTIVALUETRUTHTABLE
+------------------------------------------------------------------------------"""
+
+import pytest
+
+from altrea.wffs import And, Or, Not, Implies
+from altrea.rules import Proof
+
+t = Proof()
+both = (True, False)
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# Each letter takes the values True, (True, False) and False in turn.
+
+testdata = [
+    ("len(df)", 10),
+    ("df.iloc[0].tolist()", [True, True, "|", True, " ", True, "ok"]),
+    ("df.iloc[1].tolist()", [True, both, "|", both, " ", True, "ok"]),
+    ("df.iloc[2].tolist()", [True, False, "|", False, " ", True, " "]),
+    ("df.iloc[4].tolist()", [both, both, "|", both, " ", both, "ok"]),
+    ("df.iloc[5].tolist()", [both, False, "|", False, " ", both, " "]),
+    ("df.iloc[7].tolist()", [False, both, "|", False, " ", False, " "]),
+    ("df.iloc[8].tolist()", [False, False, "|", False, " ", False, " "]),
+    ("df.iloc[9].iloc[4]", t.label_valid),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_multivaluetruthtable_clean_1(input_n, expected):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic()
+    prf.goal(A)
+    prf.premise(And(A, B))
+    df = prf.multivaluetruthtable(latex=False)
+    assert eval(input_n) == expected
+
+
+# The values of the connectives agree with getmultivalue.
+
+testdata = [
+    ("Or(A, B)", "A"),
+    ("Implies(A, B)", "Not(B)"),
+    ("Not(And(A, Not(B)))", "Or(Not(A), B)"),
+]
+
+
+@pytest.mark.parametrize("premise,goal", testdata)
+def test_multivaluetruthtable_clean_2(premise, goal):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic()
+    prf.goal(eval(goal))
+    prf.premise(eval(premise))
+    df = prf.multivaluetruthtable(latex=False)
+    for i in range(9):
+        A.multivalue = df.iloc[i].iloc[0]
+        B.multivalue = df.iloc[i].iloc[1]
+        assert df.iloc[i].iloc[3] == prf.premises[0].getmultivalue()
+        assert df.iloc[i].iloc[5] == prf.goalswff[0].getmultivalue()
+
+
+# Ten letters give 59049 rows.
+
+def test_multivaluetruthtable_clean_3():
+    prf = Proof()
+    letters = [prf.proposition("".join(["P", str(i)])) for i in range(10)]
+    prf.setlogic()
+    goal = letters[0]
+    for i in letters[1:]:
+        goal = Or(goal, i)
+    prf.goal(goal)
+    prf.premise(letters[-1])
+    df = prf.multivaluetruthtable(latex=False)
+    assert len(df) == 3**10 + 1
+    assert df.iloc[-1].iloc[-3] == prf.label_valid
@@ -0,0 +1,91 @@
+"""------------------------------------------------------------------------------
+                                PROOFLINES
+------------------------------------------------------------------------------"""
+
+import pytest
+
+from altrea.wffs import And, Implies
+from altrea.rules import Proof
+from altrea.prooflines import ProofLine, rulecodes
+
+t = Proof()
+
+
+def completeproof():
+    prf = Proof("lines", "Lines", "A proof saved as a view of its lines.")
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    C = prf.proposition("C")
+    prf.setlogic()
+    prf.goal(And(B, C))
+    prf.premise(A)
+    prf.premise(Implies(A, B))
+    prf.premise(C)
+    prf.entailment(
+        prf.mvbeta,
+        [prf.mvalpha, Implies(prf.mvalpha, prf.mvbeta)],
+        name="mp",
+        displayname="mp",
+        description="modusponens",
+        kind=prf.label_rule)
+    prf.rule("mp", [A, B], [1, 2])
+    prf.rule("conj intro", [B, C], [4, 3])
+    return prf
+
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# The lines are stored as ProofLine records read through the old indexes.
+
+testdata = [
+    ("type(prf.lines[1])", ProofLine),
+    ("prf.lines[4][prf.ruleindex]", "mp"),
+    ("prf.lines[4].rule", "mp"),
+    ("prf.lines[4].rulecode == rulecodes.encode('mp')", True),
+    ("prf.lines[4][prf.typeindex]", t.linetype_rule),
+    ("prf.lines[5][prf.commentindex]", t.complete),
+    ("prf.lines[5][-1]", ""),
+    ("prf.lines[2][1:4]", [0, 0, "Premise"]),
+    ("len(prf.lines[3])", 9),
+    ("prf.lines[1] == [prf.lines[1].statement, 0, 0, 'Premise', '', '', '', t.linetype_premise, '']", True),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_prooflines_clean_1(input_n, expected):
+    prf = completeproof()
+    assert eval(input_n) == expected
+
+
+# The data saved with the proof is built from the lines when it is read.
+
+testdata = [
+    ("len(prf.proofdata)", 6),
+    ("prf.proofdata[0]", ["lines", "Lines", "A proof saved as a view of its lines.", ""]),
+    ("prf.proofdata[4][1] is prf.lines[4].statement", True),
+    ("prf.proofdata[4][2:]", [0, 0, "mp", "1, 2", "", "", t.linetype_rule, ""]),
+    ("len(prf.proofdatafinal)", 6),
+    ("prf.proofdatafinal[0][4]", "ConclusionPremises(And({1}, {2}), [{0}, Implies({0}, {1}), {2}])"),
+    ("[i[1] for i in prf.proofdatafinal[1:]]", ["{0}", "Implies({0}, {1})", "{2}", "{1}", "And({1}, {2})"]),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_prooflines_clean_2(input_n, expected):
+    prf = completeproof()
+    assert eval(input_n) == expected
+
+
+# Nothing is ready to be saved before the proof is complete.
+
+def test_prooflines_clean_3():
+    prf = Proof("lines", "Lines", "An incomplete proof.")
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic()
+    prf.goal(B)
+    prf.premise(A)
+    assert len(prf.proofdata) == 2
+    assert len(prf.proofdatafinal) == 0
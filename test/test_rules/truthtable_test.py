@@ -0,0 +1,82 @@
+"""------------------------------------------------------------------------------
+                                TRUTHTABLE
+------------------------------------------------------------------------------"""
+
+import pytest
+
+from altrea.wffs import And, Or, Not, Implies
+from altrea.rules import Proof
+
+t = Proof()
+A = t.proposition("A")
+B = t.proposition("B")
+C = t.proposition("C")
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# The rows and summary of a table for modus ponens.
+
+testdata = [
+    ("len(df)", 5),
+    ("df.iloc[0].tolist()", [True, True, "|", True, True, " ", True, "ok"]),
+    ("df.iloc[1].tolist()", [True, False, "|", True, False, " ", False, " "]),
+    ("df.iloc[2].tolist()", [False, True, "|", False, True, " ", True, " "]),
+    ("df.iloc[3].tolist()", [False, False, "|", False, True, " ", False, " "]),
+    ("df.iloc[4].iloc[5]", t.label_valid),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_truthtable_clean_1(input_n, expected):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic()
+    prf.goal(B)
+    prf.premise(A)
+    prf.premise(Implies(A, B))
+    df = prf.truthtable(latex=False)
+    assert eval(input_n) == expected
+
+
+# The status alone without building the table.
+
+testdata = [
+    ("[A, Implies(A, B)]", "B", True, t.label_valid),
+    ("[Or(A, B)]", "A", True, t.label_invalid),
+    ("[]", "Or(A, Not(A))", True, t.label_tautology),
+    ("[And(A, Not(A))]", "C", True, t.label_vacuous),
+    ("[And(A, Not(A))]", "C", False, t.label_valid),
+    ("[Implies(A, B), Implies(B, C)]", "Implies(A, C)", True, t.label_valid),
+]
+
+
+@pytest.mark.parametrize("premises,goal,restricted,expected", testdata)
+def test_truthtable_clean_2(premises, goal, restricted, expected):
+    prf = Proof()
+    prf.setrestricted(restricted)
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    C = prf.proposition("C")
+    prf.setlogic()
+    prf.goal(eval(goal))
+    for i in eval(premises):
+        prf.premise(i)
+    assert prf.truthtable(verdict=True) == expected
+    assert prf.truthtable(latex=False).iloc[-1].iloc[-3] == expected
+
+
+# The status of an argument with more letters than can be listed quickly row by row.
+
+def test_truthtable_clean_3():
+    prf = Proof()
+    letters = [prf.proposition("".join(["P", str(i)])) for i in range(20)]
+    prf.setlogic()
+    goal = letters[0]
+    for i in letters[1:]:
+        goal = Or(goal, i)
+    prf.goal(goal)
+    prf.premise(letters[-1])
+    assert prf.truthtable(verdict=True) == prf.label_valid
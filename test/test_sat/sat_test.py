@@ -0,0 +1,82 @@
+"""------------------------------------------------------------------------------
+                                SAT
+------------------------------------------------------------------------------"""
+
+import pytest
+
+from altrea.wffs import And, Or, Not, Implies, Iff, Falsehood, Proposition
+from altrea.sat import Solver, checkentailment, luby
+
+A = Proposition("A")
+B = Proposition("B")
+C = Proposition("C")
+
+
+def pigeonhole(holes: int):
+    """The clauses saying that one more pigeon than holes can each have its own hole."""
+
+    solver = Solver()
+    place = {}
+    for i in range(holes + 1):
+        for j in range(holes):
+            place[(i, j)] = solver.newvariable()
+    for i in range(holes + 1):
+        solver.addclause([place[(i, j)] for j in range(holes)])
+    for j in range(holes):
+        for i in range(holes + 1):
+            for k in range(i + 1, holes + 1):
+                solver.addclause([-place[(i, j)], -place[(k, j)]])
+    return solver
+
+
+def satisfies(model: list, clauses: list):
+    return all(any(model[abs(i)] == (i > 0) for i in clause) for clause in clauses)
+
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# The solver on small clause sets.
+
+clauses = [[1, 2], [-1, 3], [-2, 3], [-3, 4]]
+
+testdata = [
+    ("[luby(i) for i in range(1, 10)]", [1, 1, 2, 1, 1, 2, 4, 1, 1]),
+    ("pigeonhole(3).solve()", False),
+    ("pigeonhole(5).solve()", False),
+    ("solver.solve()", True),
+    ("satisfies(solver.model, clauses) if solver.solve() else None", True),
+    ("solver.solve([-4])", False),
+    ("solver.solve([-3, 1])", False),
+    ("solver.solve([4, -1])", True),
+    ("solver.solve()", True),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_sat_clean_1(input_n, expected):
+    solver = Solver()
+    for i in range(4):
+        solver.newvariable()
+    for i in clauses:
+        solver.addclause(i)
+    assert eval(input_n) == expected
+
+
+# Entailment through the Tseitin encoding.
+
+testdata = [
+    ("checkentailment([A, Implies(A, B)], B, [A, B])", (True, True, None)),
+    ("checkentailment([Or(A, B)], A, [A, B])", (True, True, [False, True])),
+    ("checkentailment([], Or(A, Not(A)), [A])", (True, False, None)),
+    ("checkentailment([And(A, Not(A))], C, [A, C])", (False, True, None)),
+    ("checkentailment([Iff(A, B), B], A, [A, B])", (True, True, None)),
+    ("checkentailment([Implies(A, Falsehood())], Not(A), [A])", (True, True, None)),
+    ("checkentailment([Iff(A, B)], And(A, B), [A, B, C])", (True, True, [False, False, True])),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_sat_clean_2(input_n, expected):
+    assert eval(input_n) == expected
@@ -0,0 +1,87 @@
+"""------------------------------------------------------------------------------
+                                SYLLOGISMS
+------------------------------------------------------------------------------"""
+
+import pytest
+
+from altrea.terms import Term
+from altrea.categories import All, Some, No, SomeNot, Categorical
+from altrea.syllogisms import (
+    Syllogism,
+    checksyllogism,
+    validforms,
+    formindex,
+    letter,
+    booleantable,
+    aristoteliantable,
+)
+
+S = Term("dogs")
+P = Term("mortals")
+M = Term("animals")
+
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# The form of a syllogism and its validity.
+
+testdata = [
+    ("Syllogism(All(M, P), All(S, M), All(S, P)).form", "AAA-1"),
+    ("Syllogism(No(P, M), All(S, M), No(S, P)).form", "EAE-2"),
+    ("Syllogism(SomeNot(M, P), All(M, S), SomeNot(S, P)).form", "OAO-3"),
+    ("Syllogism(Some(P, M), All(M, S), Some(S, P)).form", "IAI-4"),
+    ("checksyllogism(All(M, P), All(S, M), All(S, P))", True),
+    ("checksyllogism(All(P, M), All(S, M), All(S, P))", False),
+    ("checksyllogism(No(M, P), Some(S, M), SomeNot(S, P))", True),
+    ("checksyllogism(All(M, P), All(S, M), Some(S, P))", False),
+    ("checksyllogism(All(M, P), All(S, M), Some(S, P), True)", True),
+    ("checksyllogism(All(P, M), All(M, S), Some(S, P), True)", True),
+    ("checksyllogism(All(M, P), Some(M, S), Some(S, P))", True),
+    ("checksyllogism(All(M, P), No(S, M), No(S, P), True)", False),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_syllogisms_clean_1(input_n, expected):
+    assert eval(input_n) == expected
+
+
+# The tables of the 256 forms.
+
+testdata = [
+    ("len(booleantable)", 256),
+    ("len(aristoteliantable)", 256),
+    ("len(validforms())", 15),
+    ("len(validforms(True))", 24),
+    ("set(validforms()) <= set(validforms(True))", True),
+    ("sorted(set(validforms(True)) - set(validforms()))", ["AAI-1", "AAI-3", "AAI-4", "AEO-2", "AEO-4", "EAO-1", "EAO-2", "EAO-3", "EAO-4"]),
+    ("formindex('AAA', 1)", 0),
+    ("formindex('OOO', 4)", 255),
+    ("booleantable[formindex('EIO', 4)]", True),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_syllogisms_clean_2(input_n, expected):
+    assert eval(input_n) == expected
+
+
+"""------------------------------------------------------------------------------
+                                Errors
+------------------------------------------------------------------------------"""
+
+testdata = [
+    ("Syllogism(All(M, P), All(S, M), All(S, S))", ValueError),
+    ("Syllogism(All(M, S), All(S, M), All(S, P))", ValueError),
+    ("Syllogism(All(S, P), All(S, M), All(S, P))", ValueError),
+    ("Syllogism(All(M, P), All(S, P), All(S, P))", ValueError),
+    ("letter(Categorical())", ValueError),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_syllogisms_error_1(input_n, expected):
+    with pytest.raises(expected):
+        eval(input_n)
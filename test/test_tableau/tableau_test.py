@@ -0,0 +1,152 @@
+"""------------------------------------------------------------------------------
+                                TABLEAU
+------------------------------------------------------------------------------"""
+
+import pytest
+
+from altrea.wffs import (
+    And,
+    Or,
+    Not,
+    Implies,
+    Iff,
+    Falsehood,
+    Necessary,
+    Possibly,
+    Proposition,
+    StrictImplies,
+    ConsistentWith,
+)
+from altrea.tableau import Tableau, countermodel
+from altrea.rules import Proof
+
+A = Proposition("A")
+B = Proposition("B")
+t = Proof()
+
+axiomk = Implies(Necessary(Implies(A, B)), Implies(Necessary(A), Necessary(B)))
+axiomt = Implies(Necessary(A), A)
+axiom4 = Implies(Necessary(A), Necessary(Necessary(A)))
+axiom5 = Implies(Possibly(A), Necessary(Possibly(A)))
+axiomb = Implies(A, Necessary(Possibly(A)))
+
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# Each frame class validates its own axioms and none of the stronger ones.
+
+testdata = [
+    ("K", [True, False, False, False, False]),
+    ("T", [True, True, False, False, False]),
+    ("S4", [True, True, True, False, False]),
+    ("S5", [True, True, True, True, True]),
+]
+
+
+@pytest.mark.parametrize("frame,expected", testdata)
+def test_tableau_clean_1(frame, expected):
+    tableau = Tableau(frame)
+    assert [tableau.valid(i) for i in [axiomk, axiomt, axiom4, axiom5, axiomb]] == expected
+
+
+# The countermodel makes the premises true and the goal false at world 0 and has the frame conditions.
+
+testdata = [
+    ("[]", "axiomt", "K"),
+    ("[]", "axiom4", "T"),
+    ("[]", "axiom5", "S4"),
+    ("[Possibly(A)]", "Possibly(And(A, B))", "S5"),
+    ("[StrictImplies(A, B)]", "StrictImplies(B, A)", "S4"),
+    ("[Necessary(Or(A, B))]", "Or(Necessary(A), Necessary(B))", "T"),
+    ("[ConsistentWith(A, B)]", "Necessary(A)", "K"),
+]
+
+
+@pytest.mark.parametrize("premises,goal,frame", testdata)
+def test_tableau_clean_2(premises, goal, frame):
+    model = countermodel(eval(premises), eval(goal), frame)
+    assert all(model.holds(i, 0) for i in eval(premises))
+    assert not model.holds(eval(goal), 0)
+    if frame != "K":
+        assert model.reflexive()
+    if frame in ("S4", "S5"):
+        assert model.transitive()
+    if frame == "S5":
+        assert model.symmetric()
+
+
+# Entailments which hold in every frame class.
+
+testdata = [
+    ("[StrictImplies(A, B), A]", "B", "T", True),
+    ("[StrictImplies(A, B), A]", "B", "K", False),
+    ("[Necessary(A), Necessary(B)]", "Necessary(And(A, B))", "K", True),
+    ("[Possibly(Or(A, B))]", "Or(Possibly(A), Possibly(B))", "K", True),
+    ("[Necessary(Falsehood())]", "A", "T", True),
+    ("[Possibly(Necessary(A))]", "Necessary(A)", "S5", True),
+    ("[Possibly(Necessary(A))]", "Necessary(A)", "S4", False),
+    ("[Necessary(Possibly(A))]", "Possibly(Necessary(A))", "S4", False),
+]
+
+
+@pytest.mark.parametrize("premises,goal,frame,expected", testdata)
+def test_tableau_clean_3(premises, goal, frame, expected):
+    assert Tableau(frame).entails(eval(premises), eval(goal)) == expected
+
+
+# Labels are remembered between calls and deep nesting needs no recursion.
+
+testdata = [
+    ("tableau.satisfiable([Possibly(And(A, Not(A)))])", False),
+    ("(tableau.satisfiable([Possibly(And(A, Not(A)))]), frozenset([And(A, Not(A))]) in tableau.unsatisfiable)", (False, True)),
+    ("(tableau.satisfiable([nested]), tableau.model.worlds)", (True, 2001)),
+    ("tableau.satisfiable([nested, Necessary(Not(A))])", True),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_tableau_clean_4(input_n, expected):
+    tableau = Tableau("K")
+    nested = A
+    for i in range(2000):
+        nested = Possibly(nested)
+    assert eval(input_n) == expected
+
+
+# The status of a proof in a frame class.
+
+testdata = [
+    ("[A]", "Necessary(Possibly(A))", "S5", (t.label_valid, None)),
+    ("[]", "Implies(Necessary(A), A)", "T", (t.label_tautology, None)),
+    ("[Necessary(A), Possibly(Not(A))]", "B", "K", (t.label_valid, None)),
+    ("[A]", "Necessary(A)", "S5", t.label_invalid),
+]
+
+
+@pytest.mark.parametrize("premises,goal,frame,expected", testdata)
+def test_tableau_clean_5(premises, goal, frame, expected):
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic()
+    prf.goal(eval(goal))
+    for i in eval(premises):
+        prf.premise(i)
+    status, model = prf.checkmodal(frame)
+    if model is None:
+        assert (status, model) == expected
+    else:
+        assert status == expected
+        assert not model.holds(eval(goal), 0)
+
+
+"""------------------------------------------------------------------------------
+                                Errors
+------------------------------------------------------------------------------"""
+
+
+def test_tableau_error_1():
+    with pytest.raises(ValueError):
+        Tableau("KD45")
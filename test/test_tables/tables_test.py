@@ -0,0 +1,90 @@
+"""------------------------------------------------------------------------------
+                                TABLES
+------------------------------------------------------------------------------"""
+
+import pytest
+
+from altrea.wffs import And, Implies
+from altrea.tables import RuleTable, mainconnective
+from altrea.rules import Proof
+
+rows = [
+    ("conj intro", "ConclusionPremises(And({0}, {1}), [{0}, {1}])", "& I", "Conjunction Introduction"),
+    ("modus ponens", "ConclusionPremises({1}, [{0}, Implies({0}, {1})])", "MP", "Modus Ponens"),
+    ("disj intro", "ConclusionPremises(Or({0}, {1}), [{0}])", "| I", "Disjunction Introduction"),
+    ("conj intro", "ConclusionPremises(And({1}, {0}), [{0}, {1}])", "& I'", "A Duplicate Name"),
+]
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# The rows are found by name, display name and main connective.
+
+testdata = [
+    ("mainconnective(rows[0][1])", "And"),
+    ("mainconnective(rows[1][1])", None),
+    ("mainconnective('Not({0})')", "Not"),
+    ("table.find('conj intro')", rows[0]),
+    ("table.find('nothing')", None),
+    ("table.finddisplayname('MP')", rows[1]),
+    ("table.findconnective('And')", [rows[0], rows[3]]),
+    ("table.findconnective(None)", [rows[1]]),
+    ("table.findconnective('Iff')", []),
+    ("table[2]", rows[2]),
+    ("len(table)", 4),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_tables_clean_1(input_n, expected):
+    table = RuleTable(rows)
+    assert eval(input_n) == expected
+
+
+# The indexes follow the rows as they are added and removed.
+
+testdata = [
+    ("table.find('conj intro')", rows[3]),
+    ("table.find('modus ponens')", None),
+    ("table.findconnective(None)", []),
+    ("table.find('new')", ("new", "ConclusionPremises(Iff({0}, {0}), [])", "new", "New")),
+    ("table.findconnective('Iff')[0][0]", "new"),
+    ("table.finddisplayname('& I')", None),
+    ("len(table)", 3),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_tables_clean_2(input_n, expected):
+    table = RuleTable(rows)
+    table.pop(0)
+    table.remove(rows[1])
+    table.append(("new", "ConclusionPremises(Iff({0}, {0}), [])", "new", "New"))
+    assert eval(input_n) == expected
+
+
+# A proof keeps the indexes of its rules up to date.
+
+def test_tables_clean_3():
+    prf = Proof()
+    A = prf.proposition("A")
+    B = prf.proposition("B")
+    prf.setlogic()
+    assert isinstance(prf.logicrules, RuleTable)
+    assert prf.logicrules.find("coimp elim")[3] == "Coimplication Elimination"
+    prf.entailment(
+        And(prf.mvalpha, prf.mvbeta),
+        [prf.mvalpha, prf.mvbeta],
+        name="both",
+        displayname="both",
+        description="Both",
+        kind=prf.label_rule)
+    assert prf.logicrules.finddisplayname("both")[0] == "both"
+    prf.removerule("coimp elim")
+    assert prf.logicrules.find("coimp elim") is None
+    prf.goal(And(A, B))
+    prf.premise(A)
+    prf.premise(B)
+    prf.rule("both", [A, B], [1, 2])
+    assert prf.lines[3][prf.ruleindex] == "both"
@@ -0,0 +1,76 @@
+"""------------------------------------------------------------------------------
+                                INTERNING
+------------------------------------------------------------------------------"""
+
+import copy
+import pickle
+
+import pytest
+
+from altrea.wffs import And, Or, Not, Implies, Necessary, Falsehood, Wff
+from altrea.rules import Proof
+
+t = Proof()
+A = t.proposition("A")
+B = t.proposition("B")
+C = t.proposition("C")
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# Constructing the same formula twice returns the same node.
+
+testdata = [
+    ("And(A, B) is And(A, B)", True),
+    ("Not(And(A, B)) is Not(And(A, B))", True),
+    ("Implies(A, Or(B, C)).right is Or(B, C)", True),
+    ("Necessary(A) is Necessary(A)", True),
+    ("Falsehood() is Falsehood()", True),
+    ("And(A, B) is And(A, B, '&')", True),
+    ("And(A, B) is And(B, A)", False),
+    ("And(A, B) is Or(A, B)", False),
+    ("hash(And(A, B)) == hash(And(A, B))", True),
+    ("hash(And(A, B)) == hash(And(B, A))", False),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_interning_clean_1(input_n, expected):
+    assert eval(input_n) == expected
+
+
+# Equality across nodes is structural.
+
+testdata = [
+    ("And(A, B).equals(And(A, B))", True),
+    ("And(A, B).equals(And(Wff('A'), Wff('B')))", True),
+    ("And(A, B).equals(And(A, C))", False),
+    ("Not(A).equals(A)", False),
+    ("And(A, B).equals('A & B')", False),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_interning_clean_2(input_n, expected):
+    assert eval(input_n) == expected
+
+
+# Copies and pickles are interned again and nodes cannot be changed.
+
+testdata = [
+    ("copy.copy(And(A, B)) is And(A, B)", True),
+    ("pickle.loads(pickle.dumps(And(Wff('A'), Wff('B')))).equals(And(A, B))", True),
+    ("str(Implies(And(A, B), A).replace(A, C))", str(Implies(And(C, B), A))),
+    ("Implies(And(A, B), A).replace(A, C, 2) is Implies(And(C, B), C)", True),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_interning_clean_3(input_n, expected):
+    assert eval(input_n) == expected
+
+
+def test_interning_immutable():
+    with pytest.raises(AttributeError):
+        And(A, B).left = C
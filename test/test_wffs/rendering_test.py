@@ -0,0 +1,61 @@
+"""------------------------------------------------------------------------------
+                                RENDERING
+------------------------------------------------------------------------------"""
+
+import pytest
+
+import altrea.wffs
+from altrea.wffs import And, Or, Not, Implies, Necessary, Proposition
+
+A = Proposition("A")
+B = Proposition("B")
+AB = And(A, B)
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# The renderings are the same as before and are kept on the node.
+
+testdata = [
+    ("str(Implies(And(A, Not(B)), A))", "(A & ~B) ⊃ A"),
+    ("Implies(And(A, Not(B)), A).latex()", "(A \\wedge \\lnot~B) \\supset  A"),
+    ("Implies(And(A, Not(B)), A).tree()", "Implies(And(A, Not(B)), A)"),
+    ("str(Necessary(Or(A, B)))", "☐(A | B)"),
+    ("str(AB) is str(And(A, B))", True),
+    ("AB.tree() is And(A, B).tree()", True),
+    ("AB.renderings['__str__']", "A & B"),
+    ("(str(Or(Not(Or(A, Not(B))), A)), 'renderings' in Not(Or(A, Not(B))).__dict__)", ("~(A | ~B) | A", False)),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_rendering_clean_1(input_n, expected):
+    str(AB)
+    AB.tree()
+    assert eval(input_n) == expected
+
+
+# Resetting the renderings picks up a changed name.
+
+def test_rendering_clean_2():
+    C = Proposition("C")
+    formula = Or(C, Not(C))
+    assert str(formula) == "C | ~C"
+    C.name = "D"
+    assert str(formula) == "C | ~C"
+    altrea.wffs.resetrenderings()
+    assert "renderings" not in formula.__dict__
+    assert str(formula) == "D | ~D"
+
+
+# Each rendering of a formula built up one connective at a time reuses the rendering below it.
+
+def test_rendering_clean_3():
+    formula = A
+    for i in range(600):
+        formula = And(formula, B)
+        str(formula)
+        formula.tree()
+    assert str(formula).startswith("(((")
+    assert len(formula.tree()) == len("And(, B)") * 600 + 1
@@ -0,0 +1,107 @@
+"""------------------------------------------------------------------------------
+                                TRAVERSAL
+------------------------------------------------------------------------------"""
+
+import pytest
+import tracemalloc
+
+import altrea.wffs
+from altrea.wffs import And, Or, Not, Implies, Iff, Necessary, Falsehood, Proposition
+
+A = Proposition("A")
+B = Proposition("B")
+
+
+def chain(depth: int):
+    """Return an implication chain nested `depth` times on the left."""
+
+    formula = A
+    for i in range(depth):
+        formula = Implies(formula, Not(B)) if i % 2 else Implies(B, formula)
+    return formula
+
+
+DEEP = chain(5000)
+ANB = And(A, Not(B))
+
+"""------------------------------------------------------------------------------
+                                Clean Run
+------------------------------------------------------------------------------"""
+
+# Formulas nested more deeply than the recursion limit are walked without error.
+
+testdata = [
+    ("str(DEEP).count('⊃')", 5000),
+    ("DEEP.latex().count('\\\\supset')", 5000),
+    ("DEEP.tree().count('Implies(')", 5000),
+    ("DEEP.pattern([]).count('{0}')", 5000),
+    ("DEEP.makeschemafromlist([B]).count('{0}')", 5000),
+    ("DEEP.getmultivalue()", True),
+    ("len(altrea.wffs.postorder(DEEP))", 5003),
+    ("DEEP.treetuple()[0]", "Implies"),
+    ("DEEP.replace(B, Not(A), 5000).tree().count('Not(A)')", 5000),
+    ("DEEP.replace(Falsehood(), A) is DEEP", True),
+    ("DEEP.replacecount(Not(B), A, 6000)[1]", 3500),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_traversal_clean_1(input_n, expected):
+    assert eval(input_n) == expected
+
+
+# The subformulas come before the formula, from left to right, and shared ones only once.
+
+testdata = [
+    ("[str(i) for i in altrea.wffs.postorder(Or(ANB, ANB))]", ["A", "B", "~B", "A & ~B", "(A & ~B) | (A & ~B)"]),
+    ("[str(i) for i in altrea.wffs.postorder(A)]", ["A"]),
+    ("Iff(B, ANB).pattern([])", "Iff({0}, And({1}, Not({0})))"),
+    ("str(Necessary(Iff(A, B)))", "☐(A ≡ B)"),
+    ("str(Or(ANB, ANB).replace(A, B, 3))", "(B & ~B) | (B & ~B)"),
+    ("str(Or(ANB, Implies(B, ANB)).replace(ANB, B, 1))", "B | (B ⊃ (A & ~B))"),
+    ("str(Or(ANB, ANB).replace(Not(B), B, 0))", "(A & ~B) | (A & ~B)"),
+    ("altrea.wffs.fold(ANB, 'treetuplefrom', lambda node: 1)", ("And", "(", 1, ",", ("Not", "(", 1, ")"), ")")),
+]
+
+
+@pytest.mark.parametrize("input_n,expected", testdata)
+def test_traversal_clean_2(input_n, expected):
+    assert eval(input_n) == expected
+
+
+# The values are taken from the propositions when they are asked for.
+
+def test_traversal_clean_3():
+    formula = chain(3002)
+    A.setvalue(True)
+    B.setvalue(True)
+    assert formula.getvalue() is False
+    B.setvalue(False)
+    assert formula.getvalue() is True
+    B.setmultivalue((True, False))
+    assert formula.getmultivalue() == (True, False)
+    assert formula.multivalue == (True, False)
+    B.setmultivalue(True)
+    assert formula.multivalue is False
+
+
+# The text of each subformula is let go once it has been used, so the memory grows with the depth.
+
+testdata = [
+    ("pattern", lambda formula: formula.pattern([])),
+    ("makeschemafromlist", lambda formula: formula.makeschemafromlist([B])),
+]
+
+
+@pytest.mark.parametrize("name,method", testdata)
+def test_traversal_clean_4(name, method):
+    formula = chain(30000)
+    tracemalloc.start()
+    try:
+        text = method(formula)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert text.count("{0}") == 30000
+    assert peak < 64 * 2**20
+